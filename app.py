@@ -1,20 +1,29 @@
-from flask import Flask
-from flask_migrate import Migrate
 import logging
-from src.models import (
-    db
-)
-
-from src.routes import init_routes
+import threading
+import click
+from flask import Flask
 from src.config.env import (
     SECRET_KEY,
     FLASK_ENV,
-    DEBUG
+    DEBUG,
+    FAST_START
 )
-from src.config.database import DatabaseConfig
 
 
 def create_app(config_name='local'):
+    # 모델/라우트/마이그레이션 모듈은 앱을 만들 때 임포트 (빠른 시작 모드에서 임포트 비용을 줄임)
+    from src.models import db
+    from src.routes import init_routes
+    from src.commands import init_commands
+    from src.utils.profiling import init_profiling
+    from src.utils.compression import init_compression
+    from src.utils.sql_metrics import init_sql_metrics
+    from src.utils.metrics import init_metrics
+    from src.utils.slow_queries import init_slow_query_log
+    from src.utils.n_plus_one import init_n_plus_one
+    from src.utils.traffic_capture import init_traffic_capture
+    from src.config.database import DatabaseConfig
+
     app = Flask(__name__)
     app.config.from_object(DatabaseConfig())
     app.config['SECRET_KEY'] = SECRET_KEY
@@ -31,14 +40,70 @@ def create_app(config_name='local'):
         app.logger.addHandler(handler)
     
     db.init_app(app)
-    Migrate(app, db)
+
+    # 마이그레이션(alembic)은 CLI에서만 필요하므로 빠른 시작 모드에서는 CLI로 실행할 때만 등록
+    if not FAST_START or click.get_current_context(silent=True) is not None:
+        from flask_migrate import Migrate
+        Migrate(app, db)
     
     # 라우트 등록
     init_routes(app)
+
+    # CLI 명령 등록
+    init_commands(app)
+
+    # 요청 프로파일링 (서명된 헤더 또는 샘플링). 다른 훅까지 포함하도록 가장 먼저 등록
+    init_profiling(app)
+
+    # 응답 압축 (Accept-Encoding에 따라 gzip/brotli)
+    init_compression(app)
+
+    # 요청 단위 SQL 계측 (Server-Timing 헤더, 엔드포인트별 요약)
+    init_sql_metrics(app)
+
+    # 느린 쿼리 기록 (정규화한 SQL, 가려진 바인드 값, 실행 계획)
+    init_slow_query_log(app)
+
+    # 엔드포인트별 응답 시간/상태 코드/DB 시간 지표와 /metrics (SQL 계측 다음에 등록)
+    init_metrics(app)
+
+    # N+1 쿼리 감지 (개발/테스트)
+    init_n_plus_one(app)
+
+    # 운영 트래픽 샘플 수집 (부하 테스트 재생용)
+    init_traffic_capture(app)
     
     return app
 
-app = create_app(FLASK_ENV)
+
+class LazyApp:
+    """첫 요청이 들어올 때 앱을 만드는 WSGI 래퍼입니다.
+
+    빠른 시작 모드에서 모듈 임포트만으로는 엔진 생성, 블루프린트 등록 등이 일어나지 않도록 합니다.
+    """
+
+    def __init__(self, factory, *args):
+        self._factory = factory
+        self._args = args
+        self._app = None
+        self._lock = threading.Lock()
+
+    def get_app(self):
+        if self._app is None:
+            with self._lock:
+                if self._app is None:
+                    self._app = self._factory(*self._args)
+        return self._app
+
+    def __call__(self, environ, start_response):
+        return self.get_app()(environ, start_response)
+
+    def __getattr__(self, name):
+        # app.test_client() 등 Flask 속성 접근은 실제 앱으로 위임
+        return getattr(self.get_app(), name)
+
+
+app = LazyApp(create_app, FLASK_ENV) if FAST_START else create_app(FLASK_ENV)
 
 if __name__ == '__main__':
     app.run()
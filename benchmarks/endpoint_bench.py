@@ -0,0 +1,396 @@
+"""엔드포인트 벤치마크
+
+Flask 테스트 클라이언트로 모든 블루프린트(auth, posts, comments, likes, users, countries)의
+엔드포인트를 반복 호출하고 p50/p95/p99 지연 시간, 처리량, 요청당 SQL 수를 측정합니다.
+`flask seed-data`로 채운 DB를 대상으로 실행합니다. (DATABASE_URL 또는 DB_* 환경 변수)
+
+결과를 JSON으로 저장해 두고 compare로 비교하면, 기준보다 느려지거나 SQL 수가 늘어난
+엔드포인트가 있을 때 종료 코드 1을 반환합니다.
+
+사용법:
+    python -m benchmarks.endpoint_bench run --iterations 200 --output results.json
+    python -m benchmarks.endpoint_bench run --read-only --groups posts,comments
+    python -m benchmarks.endpoint_bench compare baseline.json results.json --threshold 0.15
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+import uuid
+from collections import defaultdict
+from datetime import datetime, timezone
+
+from sqlalchemy import event, func
+from sqlalchemy.engine import Engine
+
+# 전체 엔진에서 실행된 SQL 수 (테스트 클라이언트는 같은 스레드에서 동작)
+_statements = [0]
+
+
+def _count_statement(conn, cursor, statement, parameters, context, executemany):
+    _statements[0] += 1
+
+
+def percentile(sorted_values, q):
+    """정렬된 값의 q 분위수를 반환합니다. (nearest-rank)"""
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, int(round(q / 100 * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+class Recorder:
+    """요청을 보내고 이름별로 지연 시간, SQL 수, 오류를 기록합니다."""
+
+    def __init__(self, client):
+        self.client = client
+        self.recording = False
+        self.samples = defaultdict(list)
+        self.statements = defaultdict(int)
+        self.errors = defaultdict(lambda: defaultdict(int))
+
+    def request(self, name, method, path, expect=200, **kwargs):
+        before = _statements[0]
+        started = time.perf_counter()
+        response = self.client.open(path, method=method, **kwargs)
+        elapsed = time.perf_counter() - started
+
+        if self.recording:
+            self.samples[name].append(elapsed)
+            self.statements[name] += _statements[0] - before
+            if response.status_code != expect:
+                self.errors[name][response.status_code] += 1
+        return response
+
+    def results(self):
+        endpoints = {}
+        for name, samples in sorted(self.samples.items()):
+            ordered = sorted(samples)
+            total = sum(ordered)
+            endpoints[name] = {
+                'requests': len(ordered),
+                'p50_ms': percentile(ordered, 50) * 1000,
+                'p95_ms': percentile(ordered, 95) * 1000,
+                'p99_ms': percentile(ordered, 99) * 1000,
+                'mean_ms': total / len(ordered) * 1000,
+                'throughput_rps': len(ordered) / total if total else 0.0,
+                'sql_per_request': self.statements[name] / len(ordered),
+                'errors': {str(status): count for status, count in self.errors[name].items()}
+            }
+        return endpoints
+
+
+class Context:
+    """벤치마크 대상 ID와 인증 헤더입니다."""
+
+    def __init__(self, user, password, post_id, comment_id, like_post_id, post_ids, writes):
+        self.user = user
+        self.password = password
+        self.post_id = post_id
+        self.comment_id = comment_id
+        self.like_post_id = like_post_id
+        self.post_ids = post_ids
+        self.writes = writes
+        self.headers = None
+
+    @property
+    def country_id(self):
+        return self.user.country_id
+
+    @property
+    def school_id(self):
+        return self.user.school_id
+
+    @property
+    def college_id(self):
+        return self.user.college_id
+
+    @property
+    def department_id(self):
+        return self.user.department_id
+
+
+def discover(app, password, writes):
+    """시드 데이터에서 대댓글이 가장 많은 댓글과 그 게시글, 게시글 작성자를 고릅니다."""
+    from src.models import db, Post, PostComment, PostLike, User
+
+    with app.app_context():
+        row = db.session.query(PostComment.parent_id, func.count().label('replies'))\
+            .filter(PostComment.parent_id != None)\
+            .group_by(PostComment.parent_id)\
+            .order_by(func.count().desc())\
+            .first()
+        if row is None:
+            raise SystemExit('대댓글이 있는 댓글이 없습니다. 먼저 `flask seed-data`를 실행하세요.')
+
+        comment = db.session.get(PostComment, row.parent_id)
+        post = db.session.get(Post, comment.post_id)
+        user = db.session.get(User, post.user_id)
+
+        # 아직 반응하지 않은 같은 학교 게시글 (좋아요 → 취소를 반복)
+        reacted = db.session.query(PostLike.post_id).filter(PostLike.user_id == user.id)
+        like_post = Post.query.filter(
+            Post.school_id == user.school_id,
+            Post.deleted_at == None,
+            Post.id.notin_(reacted)
+        ).first()
+
+        post_ids = [
+            post_id for post_id, in db.session.query(Post.id)
+            .filter(Post.school_id == user.school_id)
+            .order_by(Post.created_at.desc())
+            .limit(50)
+        ]
+
+        db.session.expunge(user)
+        return Context(
+            user, password, post.id, comment.id, like_post.id if like_post else None, post_ids, writes
+        )
+
+
+def _auth(token):
+    return {'Authorization': f'Bearer {token}'}
+
+
+def login(rec, email, password, name='auth.login'):
+    response = rec.request(name, 'POST', '/api/v1/auth/login', json={'email': email, 'password': password})
+    if response.status_code != 200:
+        raise SystemExit(f'로그인 실패 ({email}): {response.get_json()}')
+    return _auth(response.get_json()['access_token'])
+
+
+def bench_auth(rec, ctx, i):
+    login(rec, ctx.user.email, ctx.password)
+    if not ctx.writes:
+        return
+
+    # 가입 → 비밀번호 변경 → 새 비밀번호로 로그인 → 로그아웃 → 다시 로그인 → 탈퇴
+    email = f'bench-{uuid.uuid4().hex[:12]}@example.com'
+    response = rec.request('auth.register', 'POST', '/api/v1/auth/register', expect=201, json={
+        'email': email, 'password': 'bench-password', 'name': '벤치마크',
+        'country_id': ctx.country_id, 'school_id': ctx.school_id,
+        'college_id': ctx.college_id, 'department_id': ctx.department_id
+    })
+    headers = _auth(response.get_json()['access_token'])
+    rec.request('users.change_password', 'PUT', '/api/v1/users/me/password', expect=204, headers=headers,
+                json={'current_password': 'bench-password', 'new_password': 'bench-password-2'})
+    headers = login(rec, email, 'bench-password-2')
+    rec.request('auth.logout', 'POST', '/api/v1/auth/logout', expect=204, headers=headers)
+    headers = login(rec, email, 'bench-password-2')
+    rec.request('users.delete_account', 'DELETE', '/api/v1/users/me', expect=204, headers=headers)
+
+
+def bench_countries(rec, ctx, i):
+    base = f'/api/v1/countries/{ctx.country_id}'
+    rec.request('countries.list', 'GET', '/api/v1/countries/')
+    rec.request('countries.schools', 'GET', f'{base}/schools')
+    rec.request('countries.schools_search', 'GET', f'{base}/schools?search=ㅅㅇ')
+    rec.request('countries.colleges', 'GET', f'{base}/schools/{ctx.school_id}/colleges')
+    rec.request('countries.departments', 'GET',
+                f'{base}/schools/{ctx.school_id}/colleges/{ctx.college_id}/departments')
+    rec.request('countries.snapshot', 'GET', f'/api/v1/countries/snapshot?country_id={ctx.country_id}',
+                headers={'Accept-Encoding': 'gzip'})
+
+
+def bench_posts(rec, ctx, i):
+    rec.request('posts.feed_anonymous', 'GET', '/api/v1/posts')
+    rec.request('posts.feed', 'GET', '/api/v1/posts?per_page=20', headers=ctx.headers)
+    rec.request('posts.feed_fields', 'GET', '/api/v1/posts?per_page=20&fields=id,title,excerpt,like_count',
+                headers=ctx.headers)
+    rec.request('posts.feed_search', 'GET', '/api/v1/posts?search=시험', headers=ctx.headers)
+
+    response = rec.request('posts.detail', 'GET', f'/api/v1/posts/{ctx.post_id}', headers=ctx.headers)
+    rec.request('posts.detail_not_modified', 'GET', f'/api/v1/posts/{ctx.post_id}', expect=304,
+                headers={**ctx.headers, 'If-None-Match': response.headers.get('ETag', '')})
+
+    if ctx.writes:
+        response = rec.request('posts.create', 'POST', '/api/v1/posts', expect=201, headers=ctx.headers,
+                               json={'title': '벤치마크', 'content': '벤치마크 본문\n' * 10, 'category': '자유'})
+        post_id = response.get_json()['id']
+        rec.request('posts.update', 'PUT', f'/api/v1/posts/{post_id}', headers=ctx.headers,
+                    json={'content': '수정된 본문'})
+        rec.request('posts.delete', 'DELETE', f'/api/v1/posts/{post_id}', expect=204, headers=ctx.headers)
+
+
+def bench_comments(rec, ctx, i):
+    base = f'/api/v1/posts/{ctx.post_id}/comments'
+    response = rec.request('comments.list', 'GET', base)
+    rec.request('comments.list_not_modified', 'GET', base, expect=304,
+                headers={'If-None-Match': response.headers.get('ETag', '')})
+    rec.request('comments.replies', 'GET', f'{base}/{ctx.comment_id}/replies')
+    rec.request('comments.get', 'GET', f'{base}/{ctx.comment_id}')
+
+    if ctx.writes:
+        response = rec.request('comments.create', 'POST', base, expect=201, headers=ctx.headers,
+                               json={'content': '벤치마크 댓글', 'parent_id': ctx.comment_id})
+        comment_id = response.get_json()['id']
+        rec.request('comments.update', 'PUT', f'{base}/{comment_id}', headers=ctx.headers,
+                    json={'content': '수정된 댓글'})
+        rec.request('comments.delete', 'DELETE', f'{base}/{comment_id}', expect=204, headers=ctx.headers)
+
+
+def bench_likes(rec, ctx, i):
+    rec.request('likes.lookup', 'POST', '/api/v1/posts/reactions:lookup', headers=ctx.headers,
+                json={'post_ids': ctx.post_ids})
+
+    if ctx.writes and ctx.like_post_id:
+        base = f'/api/v1/posts/{ctx.like_post_id}'
+        rec.request('likes.like', 'POST', f'{base}/like', headers=ctx.headers)
+        rec.request('likes.unlike', 'POST', f'{base}/unlike', headers=ctx.headers)
+        rec.request('likes.dislike', 'POST', f'{base}/dislike', headers=ctx.headers)
+        rec.request('likes.undislike', 'POST', f'{base}/undislike', headers=ctx.headers)
+
+
+def bench_users(rec, ctx, i):
+    response = rec.request('users.me', 'GET', '/api/v1/users/me', headers=ctx.headers)
+    rec.request('users.me_not_modified', 'GET', '/api/v1/users/me', expect=304,
+                headers={**ctx.headers, 'If-None-Match': response.headers.get('ETag', '')})
+    rec.request('users.my_posts', 'GET', '/api/v1/users/me/posts', headers=ctx.headers)
+    rec.request('users.my_comments', 'GET', '/api/v1/users/me/comments', headers=ctx.headers)
+
+
+GROUPS = {
+    'auth': bench_auth,
+    'countries': bench_countries,
+    'posts': bench_posts,
+    'comments': bench_comments,
+    'likes': bench_likes,
+    'users': bench_users,
+}
+
+
+def _git_revision():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(args):
+    from app import create_app
+    from src.config.env import FLASK_ENV
+
+    app = create_app(FLASK_ENV)
+    if not event.contains(Engine, 'after_cursor_execute', _count_statement):
+        event.listen(Engine, 'after_cursor_execute', _count_statement)
+
+    groups = args.groups.split(',') if args.groups else list(GROUPS)
+    unknown = set(groups) - set(GROUPS)
+    if unknown:
+        raise SystemExit(f"알 수 없는 그룹입니다: {', '.join(sorted(unknown))}")
+
+    ctx = discover(app, args.password, writes=not args.read_only)
+    rec = Recorder(app.test_client())
+    ctx.headers = login(rec, ctx.user.email, ctx.password)
+
+    # 워밍업 (참조 데이터/사용자 캐시, 커넥션 풀 채우기)
+    for i in range(args.warmup):
+        for group in groups:
+            GROUPS[group](rec, ctx, i)
+
+    rec.recording = True
+    started = time.perf_counter()
+    for i in range(args.iterations):
+        for group in groups:
+            GROUPS[group](rec, ctx, i)
+    elapsed = time.perf_counter() - started
+
+    with app.app_context():
+        from src.models import db
+        dialect = db.engine.dialect.name
+
+    results = {
+        'meta': {
+            'created_at': datetime.now(timezone.utc).isoformat(),
+            'git_revision': _git_revision(),
+            'python': platform.python_version(),
+            'database': dialect,
+            'iterations': args.iterations,
+            'groups': groups,
+            'writes': ctx.writes,
+            'elapsed_s': elapsed
+        },
+        'endpoints': rec.results()
+    }
+
+    print(f"{'endpoint':<30} {'n':>5} {'p50':>8} {'p95':>8} {'p99':>8} {'req/s':>8} {'sql':>6}  errors")
+    for name, result in results['endpoints'].items():
+        print(
+            f"{name:<30} {result['requests']:>5} {result['p50_ms']:>8.2f} {result['p95_ms']:>8.2f} "
+            f"{result['p99_ms']:>8.2f} {result['throughput_rps']:>8.1f} {result['sql_per_request']:>6.1f}  "
+            f"{result['errors'] or ''}"
+        )
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f'결과 저장: {args.output}')
+
+    return 1 if any(result['errors'] for result in results['endpoints'].values()) else 0
+
+
+def compare(args):
+    with open(args.baseline) as f:
+        baseline = json.load(f)['endpoints']
+    with open(args.current) as f:
+        current = json.load(f)['endpoints']
+
+    metric = f'{args.metric}_ms'
+    regressions = []
+
+    print(f"{'endpoint':<30} {'base':>8} {'current':>8} {'change':>8} {'sql':>12}")
+    for name in sorted(set(baseline) & set(current)):
+        base, cur = baseline[name], current[name]
+        change = (cur[metric] - base[metric]) / base[metric] if base[metric] else 0.0
+        slower = change > args.threshold and cur[metric] - base[metric] > args.min_delta_ms
+        # SQL 수는 결정적이므로 조금이라도 늘면 회귀로 봄
+        more_sql = cur['sql_per_request'] > base['sql_per_request'] + 0.01
+
+        flag = ''
+        if slower or more_sql:
+            regressions.append(name)
+            flag = '  <- 회귀'
+        print(
+            f"{name:<30} {base[metric]:>8.2f} {cur[metric]:>8.2f} {change:>+8.1%} "
+            f"{base['sql_per_request']:>5.1f}->{cur['sql_per_request']:<5.1f}{flag}"
+        )
+
+    for name in sorted(set(baseline) - set(current)):
+        print(f'{name:<30} (현재 결과에 없음)')
+
+    if regressions:
+        print(f"\n{len(regressions)}개 엔드포인트가 기준보다 나빠졌습니다: {', '.join(regressions)}")
+        return 1
+    print('\n회귀 없음')
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='엔드포인트 벤치마크')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help='벤치마크 실행')
+    run_parser.add_argument('--iterations', type=int, default=100)
+    run_parser.add_argument('--warmup', type=int, default=5)
+    run_parser.add_argument('--groups', help=f"쉼표로 구분 ({','.join(GROUPS)})")
+    run_parser.add_argument('--read-only', action='store_true', help='데이터를 바꾸는 요청 제외')
+    run_parser.add_argument('--password', default='password1234', help='seed-data로 만든 사용자의 비밀번호')
+    run_parser.add_argument('--output', help='결과 JSON 경로')
+
+    compare_parser = subparsers.add_parser('compare', help='두 결과 비교 (회귀가 있으면 종료 코드 1)')
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument('--metric', choices=('p50', 'p95', 'p99', 'mean'), default='p95')
+    compare_parser.add_argument('--threshold', type=float, default=0.15, help='허용 증가율 (0.15 = 15%%)')
+    compare_parser.add_argument('--min-delta-ms', type=float, default=0.5, help='이보다 작은 차이는 무시')
+
+    args = parser.parse_args()
+    sys.exit(run(args) if args.command == 'run' else compare(args))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""비밀번호 해시 벤치마크
+
+코어당 초당 로그인(비밀번호 검증) 수를 측정합니다.
+
+사용법:
+    python -m benchmarks.password_hash_bench
+    python -m benchmarks.password_hash_bench --method pbkdf2:sha256:600000 --iterations 50
+"""
+import argparse
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from werkzeug.security import generate_password_hash, check_password_hash
+
+from src.config.env import PASSWORD_HASH_METHOD, PASSWORD_HASH_WORKERS
+
+
+def measure(method, iterations, workers):
+    """주어진 파라미터로 검증을 반복하고 초당 처리량을 반환합니다."""
+    password_hash = generate_password_hash('benchmark-password', method)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # 워밍업
+        list(executor.map(lambda _: check_password_hash(password_hash, 'benchmark-password'), range(workers)))
+
+        started = time.perf_counter()
+        results = list(executor.map(
+            lambda _: check_password_hash(password_hash, 'benchmark-password'),
+            range(iterations)
+        ))
+        elapsed = time.perf_counter() - started
+
+    assert all(results)
+    return iterations / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='비밀번호 해시 벤치마크')
+    parser.add_argument('--method', action='append', help='werkzeug 해시 형식 (여러 번 지정 가능)')
+    parser.add_argument('--iterations', type=int, default=20)
+    parser.add_argument('--workers', type=int, default=PASSWORD_HASH_WORKERS)
+    args = parser.parse_args()
+
+    methods = args.method or [PASSWORD_HASH_METHOD]
+    cores = os.cpu_count() or 1
+
+    print(f'cores={cores} workers={args.workers} iterations={args.iterations}')
+    for method in methods:
+        single = measure(method, args.iterations, 1)
+        pooled = measure(method, args.iterations, args.workers)
+        print(
+            f'{method:<28} '
+            f'logins/s/core={single:8.1f}  '
+            f'logins/s(pool)={pooled:8.1f}  '
+            f'ms/login={1000 / single:7.1f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
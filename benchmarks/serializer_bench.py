@@ -0,0 +1,107 @@
+"""게시글 직렬화 벤치마크
+
+100개짜리 게시글 페이지를 기존 formatters + 표준 json(jsonify와 같은 설정)으로 만들 때와
+serializers + dumps로 만들 때의 시간을 비교합니다. DB 없이 메모리 객체로 측정합니다.
+
+사용법:
+    python -m benchmarks.serializer_bench
+    python -m benchmarks.serializer_bench --page-size 100 --repeat 200
+"""
+import argparse
+import json
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from src.utils import serializers
+from src.utils.formatters import get_post_data
+from src.utils.reference_cache import (
+    ReferenceData, CountryRef, SchoolRef, CollegeRef, DepartmentRef
+)
+
+
+def build_fixture(page_size):
+    """참조 데이터와 (Post, 집계값...) 행 목록을 만듭니다."""
+    country = CountryRef(1, '대한민국', 'KR')
+    schools = [SchoolRef(i, f'학교{i}', 1) for i in range(1, 4)]
+    colleges = [CollegeRef(i, f'단과대학{i}', (i % 3) + 1) for i in range(1, 10)]
+    departments = [DepartmentRef(i, f'학과{i}', (i % 9) + 1) for i in range(1, 40)]
+    reference = ReferenceData([country], schools, colleges, departments)
+
+    def ref(obj):
+        return SimpleNamespace(**obj._asdict())
+
+    now = datetime(2025, 1, 1)
+    users = []
+    for i in range(1, 21):
+        department = departments[i % len(departments)]
+        college = colleges[department.college_id - 1]
+        school = schools[college.school_id - 1]
+        users.append(SimpleNamespace(
+            id=i, email=f'user{i}@example.com', name=f'사용자{i}',
+            country_id=1, school_id=school.id, college_id=college.id, department_id=department.id,
+            country=ref(country), school=ref(school), college=ref(college), department=ref(department),
+            created_at=now, updated_at=now, deleted_at=None
+        ))
+
+    rows = []
+    for i in range(page_size):
+        user = users[i % len(users)]
+        post = SimpleNamespace(
+            id=i + 1, title=f'제목 {i}', content='본문 ' * 50, category='자유', nickname=f'다람쥐{i}',
+            user=user, school_id=user.school_id, college_id=user.college_id, department_id=user.department_id,
+            school=user.school, college=user.college, department=user.department,
+            created_at=now + timedelta(minutes=i), updated_at=now + timedelta(minutes=i), deleted_at=None
+        )
+        rows.append((post, i * 3, i % 7, i % 11, i % 2, i % 5, 0))
+    return reference, rows
+
+
+def formatters_page(rows):
+    posts = [
+        get_post_data(post, view_count, comment_count, like_count, dislike_count, bool(liked), bool(disliked))
+        for post, view_count, comment_count, like_count, dislike_count, liked, disliked in rows
+    ]
+    # Flask 기본 JSON 공급자 설정 (ensure_ascii=True, sort_keys=True)
+    return json.dumps({'posts': posts}, ensure_ascii=True, sort_keys=True).encode('utf-8')
+
+
+def serializers_page(rows, reference):
+    posts = [
+        serializers.serialize_post(
+            post, view_count, comment_count, like_count, dislike_count, bool(liked), bool(disliked),
+            reference=reference
+        )
+        for post, view_count, comment_count, like_count, dislike_count, liked, disliked in rows
+    ]
+    return serializers.dumps({'posts': posts})
+
+
+def timeit(func, repeat):
+    func()  # 워밍업
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - started) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description='게시글 직렬화 벤치마크')
+    parser.add_argument('--page-size', type=int, default=100)
+    parser.add_argument('--repeat', type=int, default=200)
+    args = parser.parse_args()
+
+    reference, rows = build_fixture(args.page_size)
+
+    baseline = timeit(lambda: formatters_page(rows), args.repeat)
+    current = timeit(lambda: serializers_page(rows, reference), args.repeat)
+
+    backend = 'orjson' if serializers.orjson is not None else 'json'
+    print(f'page_size={args.page_size} repeat={args.repeat} backend={backend}')
+    print(f'formatters + json.dumps : {baseline * 1000:8.3f} ms/page  ({len(formatters_page(rows))} bytes)')
+    print(f'serializers + dumps     : {current * 1000:8.3f} ms/page  ({len(serializers_page(rows, reference))} bytes)')
+    print(f'speedup                 : {baseline / current:8.2f}x')
+
+
+if __name__ == '__main__':
+    main()
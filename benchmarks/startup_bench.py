@@ -0,0 +1,78 @@
+"""콜드 스타트 벤치마크
+
+새 프로세스에서 `import app`에 걸리는 시간과 첫 요청 응답 시간을 측정합니다.
+기존 모드(FAST_START=False)와 빠른 시작 모드(FAST_START=True)를 각각 여러 번 실행해 비교합니다.
+
+DATABASE_URL이나 DB_NAME이 없으면 sqlite 메모리 DB를 사용합니다. 기본 경로(/api/v1/users/me,
+토큰 없음)는 DB에 접속하지 않으므로 앱 초기화와 라우팅 비용만 측정됩니다.
+
+사용법:
+    python -m benchmarks.startup_bench
+    python -m benchmarks.startup_bench --runs 20 --path /api/v1/countries
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+# 자식 프로세스에서 실행할 코드
+CHILD = '''
+import json, sys, time
+started = time.perf_counter()
+import app as module
+imported = time.perf_counter()
+from werkzeug.test import Client
+client_ready = time.perf_counter()
+response = Client(module.app).get(sys.argv[1])
+finished = time.perf_counter()
+print(json.dumps({
+    'import_ms': (imported - started) * 1000,
+    'first_request_ms': (finished - client_ready) * 1000,
+    'status': response.status_code
+}))
+'''
+
+
+def run_once(fast_start, path):
+    env = dict(os.environ)
+    env['FAST_START'] = str(fast_start)
+    if not env.get('DATABASE_URL') and not env.get('DB_NAME'):
+        env['DATABASE_URL'] = 'sqlite://'
+
+    output = subprocess.run(
+        [sys.executable, '-c', CHILD, path],
+        env=env, capture_output=True, text=True, check=True
+    ).stdout
+    # 마지막 줄이 결과 (앱이 출력하는 로그는 무시)
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def summarize(label, results):
+    import_ms = [result['import_ms'] for result in results]
+    request_ms = [result['first_request_ms'] for result in results]
+    total_ms = [a + b for a, b in zip(import_ms, request_ms)]
+    print(
+        f'{label:<18} import {statistics.median(import_ms):8.1f} ms   '
+        f'first request {statistics.median(request_ms):8.1f} ms   '
+        f'total {statistics.median(total_ms):8.1f} ms   '
+        f'(median of {len(results)}, status {results[0]["status"]})'
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description='콜드 스타트 벤치마크')
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--path', default='/api/v1/users/me')
+    args = parser.parse_args()
+
+    # 바이트코드 캐시 생성 등 첫 실행 비용 제거
+    run_once(False, args.path)
+
+    summarize('FAST_START=False', [run_once(False, args.path) for _ in range(args.runs)])
+    summarize('FAST_START=True', [run_once(True, args.path) for _ in range(args.runs)])
+
+
+if __name__ == '__main__':
+    main()
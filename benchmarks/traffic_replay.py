@@ -0,0 +1,450 @@
+"""수집한 운영 트래픽 재생
+
+TRAFFIC_CAPTURE_RATE로 수집한 JSONL(src/utils/traffic_capture.py)을 읽어, 실행 중인 로컬 서버에
+같은 엔드포인트 비율로 요청을 보냅니다. 정해진 속도(--rate) 또는 원래 간격(--speed)에 맞춰
+보내고(open loop), 동시에 처리 중인 요청 수는 --concurrency로 제한합니다.
+
+운영 DB의 ID는 로컬에 없으므로 경로와 쿼리의 ID를 로컬 DB의 ID로 바꿉니다. 같은 운영 ID는
+항상 같은 로컬 ID로 바뀌므로 인기 게시글 쏠림이 유지됩니다. (학교는 바뀐 국가의 학교 중에서,
+댓글은 바뀐 게시글의 댓글 중에서 고름) 인증된 요청은 `flask seed-data`로 만든 사용자들로
+로그인해 번갈아 보냅니다.
+
+요청 본문은 수집하지 않으므로 본문을 만들 수 있는 요청만 재생합니다. 다른 사람의 글을 수정/삭제하거나
+계정을 바꾸는 요청(가입, 탈퇴, 비밀번호 변경, 로그아웃 등)은 건너뜁니다.
+
+결과 JSON은 endpoint_bench compare로 비교할 수 있습니다. (요청당 SQL 수는 서버를 SQL_SERVER_TIMING=True로
+실행했을 때 Server-Timing 헤더에서 읽음)
+
+사용법:
+    TRAFFIC_CAPTURE_RATE=0.01 gunicorn app:app        # 운영에서 수집 → traffic.jsonl
+    SQL_SERVER_TIMING=True flask run --port 5000       # 로컬 서버 (seed-data로 채운 DB, 요청당 SQL 수 헤더 켬)
+    python -m benchmarks.traffic_replay traffic.jsonl --base-url http://127.0.0.1:5000 --rate 50 --concurrency 8
+    python -m benchmarks.traffic_replay traffic.jsonl --speed 2 --writes --output replay.json
+"""
+import argparse
+import http.client
+import json
+import re
+import sys
+import threading
+import time
+import zlib
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from urllib.parse import urlencode, urlsplit
+
+from benchmarks.endpoint_bench import percentile
+
+# --writes일 때 재생하는 쓰기 요청과 본문 생성 함수 (None이면 본문 없음)
+WRITE_BODIES = {
+    'post.create_post': lambda source, key: {'title': '재생', 'content': '재생 본문\n' * 10, 'category': '자유'},
+    'comment.create_comment': lambda source, key: {'content': '재생 댓글'},
+    'like.like_post': None,
+    'like.unlike_post': None,
+    'like.dislike_post': None,
+    'like.undislike_post': None,
+}
+
+# 데이터를 바꾸지 않는 POST
+READ_BODIES = {
+    'auth.login': lambda source, key: {
+        'email': source.emails[key % len(source.emails)], 'password': source.password
+    },
+    'like.lookup_reactions': lambda source, key: {'post_ids': source.ids.sample('post_id', key, 20)},
+}
+
+PARAM_PATTERN = re.compile(r'<(?:[^:<>]+:)?([^<>]+)>')
+REDACTED_PATTERN = re.compile(r'^<str:(\d+)>$')
+# 가려진 검색어 대신 보낼 글자 (seed-data 본문에 자주 나오는 단어로 시작해 결과가 있도록 함)
+SEARCH_TEXT = '오늘 시험 과제 교수님 학식 도서관 동아리 수강신청 기숙사 축제 '
+SQL_COUNT_PATTERN = re.compile(r'desc="(\d+) queries"')
+
+
+def _bucket(name, value):
+    """운영 ID를 고정된 정수로 바꿉니다. (실행마다 같은 결과)"""
+    return zlib.crc32(f'{name}:{value}'.encode('utf-8'))
+
+
+class IdMap:
+    """운영 ID를 로컬 DB의 ID로 바꿉니다."""
+
+    def __init__(self, countries, schools, colleges, departments, posts, comments):
+        self.countries = countries
+        # 상위 ID → 하위 ID 목록
+        self.schools = schools
+        self.colleges = colleges
+        self.departments = departments
+        self.posts = posts
+        self.comments = comments
+        self.all = {
+            'country_id': countries,
+            'school_id': [i for ids in schools.values() for i in ids],
+            'college_id': [i for ids in colleges.values() for i in ids],
+            'department_id': [i for ids in departments.values() for i in ids],
+            'post_id': posts,
+            'comment_id': [i for ids in comments.values() for i in ids],
+        }
+
+    @staticmethod
+    def _pick(candidates, name, value):
+        if not candidates:
+            return None
+        return candidates[_bucket(name, value) % len(candidates)]
+
+    def sample(self, name, key, count):
+        candidates = self.all[name]
+        return [self._pick(candidates, name, f'{key}:{i}') for i in range(min(count, len(candidates)))]
+
+    def map_view_args(self, view_args):
+        """경로 인자를 상위 자원과 맞는 로컬 ID로 바꿉니다. 바꿀 수 없으면 None"""
+        mapped = {}
+        parents = (
+            ('country_id', None, None),
+            ('school_id', 'country_id', self.schools),
+            ('college_id', 'school_id', self.colleges),
+            ('department_id', 'college_id', self.departments),
+            ('post_id', None, None),
+            ('comment_id', 'post_id', self.comments),
+        )
+        for name, parent, children in parents:
+            if name not in view_args:
+                continue
+            if parent in mapped:
+                candidates = children.get(mapped[parent], [])
+            else:
+                candidates = self.all[name]
+            mapped[name] = self._pick(candidates, name, view_args[name])
+            if mapped[name] is None:
+                return None
+
+        for name, value in view_args.items():
+            mapped.setdefault(name, value)
+        return mapped
+
+    def map_query(self, query):
+        mapped = {}
+        for name, values in query.items():
+            if name in self.all:
+                values = [self._pick(self.all[name], name, value) for value in values]
+                values = [value for value in values if value is not None]
+            else:
+                values = [_unredact(value) for value in values]
+            mapped[name] = values
+        return mapped
+
+
+def _unredact(value):
+    """수집 시 '<str:길이>'로 가려진 값을 같은 길이의 검색어로 바꿉니다."""
+    match = REDACTED_PATTERN.match(value)
+    if not match:
+        return value
+    length = int(match.group(1))
+    return (SEARCH_TEXT * (length // len(SEARCH_TEXT) + 1))[:length]
+
+
+def load_local_data(user_count):
+    """로컬 DB에서 재생에 쓸 ID 목록과 로그인할 사용자 이메일을 읽습니다."""
+    from app import create_app
+    from src.config.env import FLASK_ENV
+    from src.models import db, Country, School, College, Department, Post, PostComment, User
+
+    def group(rows):
+        result = defaultdict(list)
+        for parent_id, child_id in rows:
+            result[parent_id].append(child_id)
+        return dict(result)
+
+    app = create_app(FLASK_ENV)
+    with app.app_context():
+        query = db.session.query
+        id_map = IdMap(
+            countries=[i for i, in query(Country.id).order_by(Country.id)],
+            schools=group(query(School.country_id, School.id).order_by(School.id)),
+            colleges=group(query(College.school_id, College.id).order_by(College.id)),
+            departments=group(query(Department.college_id, Department.id).order_by(Department.id)),
+            posts=[i for i, in query(Post.id).filter(Post.deleted_at == None).order_by(Post.id)],
+            comments=group(
+                query(PostComment.post_id, PostComment.id)
+                .filter(PostComment.parent_id == None, PostComment.deleted_at == None)
+                .order_by(PostComment.id)
+            )
+        )
+        emails = [
+            email for email, in query(User.email)
+            .filter(User.deleted_at == None)
+            .order_by(User.id)
+            .limit(user_count)
+        ]
+    if not id_map.posts:
+        raise SystemExit('로컬 DB에 게시글이 없습니다. 먼저 `flask seed-data`를 실행하세요.')
+    return id_map, emails
+
+
+class Client:
+    """스레드마다 keep-alive 연결을 하나씩 씁니다."""
+
+    def __init__(self, base_url, timeout):
+        parts = urlsplit(base_url)
+        self.host = parts.hostname
+        self.port = parts.port
+        self.https = parts.scheme == 'https'
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _connection(self):
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            cls = http.client.HTTPSConnection if self.https else http.client.HTTPConnection
+            connection = self._local.connection = cls(self.host, self.port, timeout=self.timeout)
+        return connection
+
+    def send(self, method, path, headers, body=None):
+        """(상태 코드, Server-Timing 헤더, 본문)을 반환합니다."""
+        payload = None
+        headers = dict(headers)
+        if body is not None:
+            payload = json.dumps(body).encode('utf-8')
+            headers['Content-Type'] = 'application/json'
+
+        for attempt in range(2):
+            connection = self._connection()
+            try:
+                connection.request(method, path, body=payload, headers=headers)
+                response = connection.getresponse()
+                return response.status, response.getheader('Server-Timing'), response.read()
+            except (http.client.HTTPException, ConnectionError):
+                # 서버가 닫은 keep-alive 연결이면 한 번 다시 연결
+                connection.close()
+                self._local.connection = None
+                if attempt:
+                    raise
+
+
+def login_all(client, emails, password):
+    tokens = []
+    for email in emails:
+        status, _, body = client.send('POST', '/api/v1/auth/login', {}, {'email': email, 'password': password})
+        if status == 200:
+            tokens.append(json.loads(body)['access_token'])
+    if not tokens:
+        raise SystemExit('로그인할 수 있는 사용자가 없습니다. --password를 확인하세요.')
+    return tokens
+
+
+class Plan:
+    """재생할 요청 하나입니다."""
+
+    __slots__ = ('offset', 'name', 'method', 'path', 'auth', 'body')
+
+    def __init__(self, offset, name, method, path, auth, body):
+        self.offset = offset
+        self.name = name
+        self.method = method
+        self.path = path
+        self.auth = auth
+        self.body = body
+
+
+def build_plans(records, source, writes):
+    """수집 기록을 재생할 요청 목록으로 바꿉니다. (건너뛴 엔드포인트별 개수도 반환)"""
+    plans = []
+    skipped = defaultdict(int)
+    started = None
+
+    for index, record in enumerate(records):
+        name = record.get('endpoint')
+        method = record['method']
+        if not name or not record.get('rule'):
+            skipped[name or '(404)'] += 1
+            continue
+
+        if method in ('GET', 'HEAD'):
+            make_body = None
+        elif name in READ_BODIES:
+            make_body = READ_BODIES[name]
+        elif writes and name in WRITE_BODIES:
+            make_body = WRITE_BODIES[name]
+        else:
+            skipped[name] += 1
+            continue
+
+        view_args = source.ids.map_view_args(record.get('view_args') or {})
+        if view_args is None:
+            skipped[name] += 1
+            continue
+        path = PARAM_PATTERN.sub(lambda match: str(view_args[match.group(1)]), record['rule'])
+        query = source.ids.map_query(record.get('query') or {})
+        if query:
+            path += '?' + urlencode(query, doseq=True)
+
+        ts = datetime.fromisoformat(record['ts']).timestamp()
+        if started is None:
+            started = ts
+        plans.append(Plan(
+            ts - started, name, method, path, record.get('auth', 'anonymous'),
+            make_body(source, index) if make_body else None
+        ))
+    return plans, skipped
+
+
+class Results:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.samples = defaultdict(list)
+        self.statements = defaultdict(int)
+        self.statuses = defaultdict(lambda: defaultdict(int))
+        self.max_lag = 0.0
+
+    def record(self, name, elapsed, status, server_timing, lag):
+        match = SQL_COUNT_PATTERN.search(server_timing or '')
+        with self._lock:
+            self.samples[name].append(elapsed)
+            self.statuses[name][status] += 1
+            if match:
+                self.statements[name] += int(match.group(1))
+            self.max_lag = max(self.max_lag, lag)
+
+    def endpoints(self):
+        endpoints = {}
+        for name, samples in sorted(self.samples.items()):
+            ordered = sorted(samples)
+            endpoints[name] = {
+                'requests': len(ordered),
+                'p50_ms': percentile(ordered, 50) * 1000,
+                'p95_ms': percentile(ordered, 95) * 1000,
+                'p99_ms': percentile(ordered, 99) * 1000,
+                'mean_ms': sum(ordered) / len(ordered) * 1000,
+                'sql_per_request': self.statements[name] / len(ordered),
+                'statuses': {str(status): count for status, count in sorted(self.statuses[name].items())}
+            }
+        return endpoints
+
+
+def replay(client, plans, tokens, args):
+    results = Results()
+    cycle = [0]
+    cycle_lock = threading.Lock()
+
+    def headers_for(auth):
+        if auth == 'user':
+            with cycle_lock:
+                cycle[0] += 1
+                return {'Authorization': f'Bearer {tokens[cycle[0] % len(tokens)]}'}
+        if auth == 'invalid':
+            return {'Authorization': 'Bearer invalid'}
+        return {}
+
+    def execute(plan, due):
+        lag = max(0.0, time.perf_counter() - due)
+        started = time.perf_counter()
+        try:
+            status, server_timing, _ = client.send(plan.method, plan.path, headers_for(plan.auth), plan.body)
+        except OSError:
+            status, server_timing = 'error', None
+        results.record(plan.name, time.perf_counter() - started, status, server_timing, lag)
+
+    # 동시 실행 수를 넘으면 제출을 멈춰, 서버가 느릴 때 대기열이 무한히 쌓이지 않게 함
+    slots = threading.BoundedSemaphore(args.concurrency)
+
+    def run(plan, due):
+        try:
+            execute(plan, due)
+        finally:
+            slots.release()
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        for index, plan in enumerate(plans):
+            if args.rate:
+                due = started + index / args.rate
+            elif args.speed:
+                due = started + plan.offset / args.speed
+            else:
+                due = started
+            delay = due - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            slots.acquire()
+            executor.submit(run, plan, due)
+    return results, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description='수집한 운영 트래픽 재생')
+    parser.add_argument('capture', help='TRAFFIC_CAPTURE_PATH로 수집한 JSONL 파일')
+    parser.add_argument('--base-url', default='http://127.0.0.1:5000')
+    parser.add_argument('--rate', type=float, default=0, help='초당 요청 수 (지정하면 --speed 무시)')
+    parser.add_argument('--speed', type=float, default=1.0, help='원래 간격 대비 배속 (0 = 최대한 빠르게)')
+    parser.add_argument('--concurrency', type=int, default=8, help='동시에 처리 중인 최대 요청 수')
+    parser.add_argument('--limit', type=int, help='앞에서부터 이만큼만 재생')
+    parser.add_argument('--loops', type=int, default=1, help='수집 파일을 반복 재생할 횟수')
+    parser.add_argument('--writes', action='store_true', help='글/댓글 작성, 좋아요 등 쓰기 요청도 재생')
+    parser.add_argument('--users', type=int, default=50, help='인증 요청에 번갈아 쓸 사용자 수')
+    parser.add_argument('--password', default='password1234', help='seed-data로 만든 사용자의 비밀번호')
+    parser.add_argument('--timeout', type=float, default=30)
+    parser.add_argument('--output', help='결과 JSON 경로 (endpoint_bench compare로 비교 가능)')
+    args = parser.parse_args()
+
+    with open(args.capture, encoding='utf-8') as f:
+        records = [json.loads(line) for line in f if line.strip()]
+    records.sort(key=lambda record: record['ts'])
+    if args.limit:
+        records = records[:args.limit]
+
+    id_map, emails = load_local_data(args.users)
+    source = SimpleNamespace(ids=id_map, emails=emails, password=args.password)
+    plans, skipped = build_plans(records, source, args.writes)
+    if not plans:
+        raise SystemExit('재생할 요청이 없습니다.')
+    if args.loops > 1:
+        span = plans[-1].offset + 1
+        plans = [
+            Plan(plan.offset + loop * span, plan.name, plan.method, plan.path, plan.auth, plan.body)
+            for loop in range(args.loops) for plan in plans
+        ]
+
+    client = Client(args.base_url, args.timeout)
+    tokens = []
+    if any(plan.auth == 'user' for plan in plans):
+        tokens = login_all(client, emails, args.password)
+
+    print(f'{len(plans)}개 요청 재생 (건너뜀 {sum(skipped.values())}개), 사용자 {len(tokens)}명')
+    results, elapsed = replay(client, plans, tokens, args)
+    endpoints = results.endpoints()
+
+    print(f"{'endpoint':<32} {'n':>6} {'p50':>8} {'p95':>8} {'p99':>8} {'sql':>6}  statuses")
+    for name, result in endpoints.items():
+        print(
+            f"{name:<32} {result['requests']:>6} {result['p50_ms']:>8.2f} {result['p95_ms']:>8.2f} "
+            f"{result['p99_ms']:>8.2f} {result['sql_per_request']:>6.1f}  {result['statuses']}"
+        )
+    print(f'{elapsed:.1f}초, {len(plans) / elapsed:.1f} req/s, 최대 지연 시작 {results.max_lag * 1000:.1f} ms')
+    for name, count in sorted(skipped.items()):
+        print(f'건너뜀: {name} {count}개')
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({
+                'meta': {
+                    'created_at': datetime.now(timezone.utc).isoformat(),
+                    'capture': args.capture,
+                    'base_url': args.base_url,
+                    'requests': len(plans),
+                    'rate': args.rate,
+                    'speed': args.speed,
+                    'concurrency': args.concurrency,
+                    'writes': args.writes,
+                    'elapsed_s': elapsed,
+                    'skipped': dict(skipped)
+                },
+                'endpoints': endpoints
+            }, f, ensure_ascii=False, indent=2)
+        print(f'결과 저장: {args.output}')
+
+    return 1 if any('error' in result['statuses'] for result in endpoints.values()) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
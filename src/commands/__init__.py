@@ -0,0 +1,23 @@
+def init_commands(app):
+    """애플리케이션의 모든 CLI 명령을 등록합니다. (flask <명령>)"""
+    from src.commands.excerpt_commands import backfill_excerpts
+    from src.commands.seed_commands import seed_data
+    from src.commands.profile_commands import profile_token, profile_report
+    from src.commands.slow_query_commands import slow_query_report
+    from src.commands.reference_commands import reload_reference_data_command
+
+    # 게시글 미리보기 채우기
+    app.cli.add_command(backfill_excerpts)
+
+    # 성능 측정용 합성 데이터 생성
+    app.cli.add_command(seed_data)
+
+    # 요청 프로파일링 토큰 발급, 프로파일 확인
+    app.cli.add_command(profile_token)
+    app.cli.add_command(profile_report)
+
+    # 느린 쿼리 기록 요약
+    app.cli.add_command(slow_query_report)
+
+    # 참조 데이터(국가/학교/단과대/학과) 캐시 다시 불러오기
+    app.cli.add_command(reload_reference_data_command)
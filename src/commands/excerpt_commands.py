@@ -0,0 +1,40 @@
+import click
+from flask.cli import with_appcontext
+from sqlalchemy import update, bindparam
+from src.models import db, Post
+from src.utils.formatters import make_excerpt
+
+
+@click.command('backfill-excerpts')
+@click.option('--batch-size', default=1000, show_default=True, help='한 번에 처리할 게시글 수')
+@click.option('--all', 'recompute_all', is_flag=True, help='이미 채워진 게시글도 다시 계산')
+@with_appcontext
+def backfill_excerpts(batch_size, recompute_all):
+    """excerpt가 비어 있는 게시글의 미리보기를 채웁니다."""
+    last_id = 0
+    total = 0
+
+    while True:
+        query = db.session.query(Post.id, Post.content).filter(Post.id > last_id)
+        if not recompute_all:
+            query = query.filter(Post.excerpt == None)
+        rows = query.order_by(Post.id.asc()).limit(batch_size).all()
+
+        if not rows:
+            break
+
+        # updated_at은 그대로 유지 (onupdate 방지)
+        posts = Post.__table__
+        db.session.execute(
+            update(posts)
+            .where(posts.c.id == bindparam('post_id'))
+            .values(excerpt=bindparam('post_excerpt'), updated_at=posts.c.updated_at),
+            [{'post_id': post_id, 'post_excerpt': make_excerpt(content)} for post_id, content in rows]
+        )
+        db.session.commit()
+
+        last_id = rows[-1].id
+        total += len(rows)
+        click.echo(f'{total}개 게시글 처리 (마지막 id: {last_id})')
+
+    click.echo(f'완료: {total}개 게시글의 미리보기를 채웠습니다')
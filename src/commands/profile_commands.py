@@ -0,0 +1,30 @@
+import io
+import pstats
+import click
+from src.utils.profiling import make_profile_token
+
+
+@click.command('profile-token')
+@click.option('--ttl', default=600, show_default=True, help='유효 시간 (초)')
+def profile_token(ttl):
+    """요청 프로파일링용 X-Profile-Token 값을 만듭니다."""
+    try:
+        click.echo(make_profile_token(ttl))
+    except ValueError as e:
+        raise click.ClickException(str(e))
+
+
+@click.command('profile-report')
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--sort', default='cumulative', show_default=True,
+              type=click.Choice(['cumulative', 'tottime', 'ncalls']), help='정렬 기준')
+@click.option('--limit', default=30, show_default=True, help='출력할 함수 수')
+@click.option('--filter', 'pattern', help='함수/파일 이름 정규식 (예: src/)')
+def profile_report(path, sort, limit, pattern):
+    """내려받은 프로파일(pstats)에서 시간이 많이 걸린 함수를 출력합니다."""
+    output = io.StringIO()
+    stats = pstats.Stats(path, stream=output)
+    stats.sort_stats(sort)
+    # 패턴이 있으면 경로로 거른 뒤 상위 limit개
+    stats.print_stats(*([pattern] if pattern else []), limit)
+    click.echo(output.getvalue())
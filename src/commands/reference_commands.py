@@ -0,0 +1,22 @@
+import click
+from flask.cli import with_appcontext
+from src.utils.reference_cache import reload_reference_data
+
+from src.config.env import (
+    REFERENCE_VERSION_CHECK_INTERVAL
+)
+
+
+@click.command('reload-reference-data')
+@with_appcontext
+def reload_reference_data_command():
+    """국가/학교/단과대/학과 참조 데이터 버전을 올려 실행 중인 서버들이 캐시를 다시 불러오게 합니다.
+
+    각 서버는 REFERENCE_VERSION_CHECK_INTERVAL마다 버전을 확인하므로 그 안에 반영됩니다.
+    """
+    data = reload_reference_data()
+    click.echo(
+        f'국가 {len(data.countries)}개, 학교 {len(data.schools)}개, '
+        f'단과대학 {len(data.colleges)}개, 학과 {len(data.departments)}개를 불러왔습니다'
+    )
+    click.echo(f'실행 중인 서버에는 최대 {REFERENCE_VERSION_CHECK_INTERVAL}초 뒤에 반영됩니다')
@@ -0,0 +1,325 @@
+import csv
+import io
+import random
+import time
+from datetime import datetime, timedelta
+import click
+from flask.cli import with_appcontext
+from sqlalchemy import func, text
+from src.models import (
+    db, Country, School, College, Department, User, Post, PostComment, PostLike, PostView, Nickname
+)
+from src.utils.formatters import make_excerpt
+from src.utils.password import hash_password
+
+# 배율 1.0 기준 행 수
+BASE_SCHOOLS = 40
+BASE_USERS = 10_000
+BASE_POSTS = 50_000
+BASE_COMMENTS = 250_000
+BASE_LIKES = 500_000
+BASE_VIEWS = 2_000_000
+
+REPLY_RATIO = 0.3          # 댓글 중 대댓글 비율
+DISLIKE_RATIO = 0.15       # 반응 중 싫어요 비율
+ANONYMOUS_VIEW_RATIO = 0.2  # 비로그인(IP) 조회 비율
+POPULARITY_SKEW = 1.1      # 게시글 인기도 Zipf 지수 (클수록 소수 게시글에 집중)
+DATE_RANGE_DAYS = 365
+
+CATEGORIES = ('자유', '중고', '문의')  # 앱에서 쓰는 게시판 카테고리
+NICKNAME_WORDS = (
+    '다람쥐', '고양이', '강아지', '펭귄', '부엉이', '너구리', '수달', '호랑이', '토끼', '판다',
+    '고래', '돌고래', '여우', '사슴', '코알라', '햄스터', '두더지', '참새', '까치', '거북이'
+)
+NICKNAME_ADJECTIVES = ('용감한', '졸린', '배고픈', '행복한', '조용한', '빠른', '느긋한', '수줍은', '씩씩한', '엉뚱한')
+REGIONS = ('서울', '부산', '대구', '인천', '광주', '대전', '울산', '세종', '경기', '강원', '충북', '충남', '전북', '전남', '경북', '경남', '제주')
+SCHOOL_SUFFIXES = ('대학교', '과학기술원', '교육대학교', '외국어대학교', '예술대학교')
+COLLEGES = ('공과대학', '인문대학', '사회과학대학', '자연과학대학', '경영대학', '사범대학', '의과대학', '예술대학', '농업생명과학대학', '법과대학')
+DEPARTMENT_WORDS = ('컴퓨터', '전자', '기계', '화학', '국어국문', '영어영문', '경제', '경영', '수학', '물리', '생명', '심리', '사회', '정치외교', '건축', '산업', '미디어', '철학', '사학', '통계')
+WORDS = (
+    '오늘', '시험', '과제', '교수님', '학식', '도서관', '동아리', '수강신청', '기숙사', '축제',
+    '중간고사', '기말고사', '조별과제', '알바', '장학금', '휴학', '졸업', '취업', '인턴', '선배',
+    '후배', '동기', '강의', '출석', '레포트', '발표', '카페', '맛집', '셔틀', '주차',
+    '정말', '너무', '혹시', '아무래도', '진짜', '다들', '어떻게', '생각', '질문', '추천'
+)
+
+
+def _scaled(base, scale):
+    return max(1, int(base * scale))
+
+
+def _sentence(rng, min_words, max_words):
+    return ' '.join(rng.choice(WORDS) for _ in range(rng.randint(min_words, max_words)))
+
+
+def _content(rng):
+    """줄 수와 길이가 다양한 본문을 만듭니다."""
+    return '\n'.join(_sentence(rng, 4, 25) for _ in range(rng.randint(1, 8)))
+
+
+def _popularity(rng, count, skew):
+    """무작위 순서로 섞은 Zipf 가중치를 반환합니다. (합계 1)"""
+    weights = [1 / (rank ** skew) for rank in range(1, count + 1)]
+    rng.shuffle(weights)
+    total = sum(weights)
+    return [weight / total for weight in weights]
+
+
+def _allocate(rng, weights, total):
+    """가중치에 비례해 total개를 나눕니다. 소수점 이하는 확률적으로 반올림합니다."""
+    counts = []
+    for weight in weights:
+        expected = weight * total
+        whole = int(expected)
+        counts.append(whole + (1 if rng.random() < expected - whole else 0))
+    return counts
+
+
+class _BulkWriter:
+    """Postgres에서는 COPY, 그 외에는 executemany로 행을 적재합니다."""
+
+    def __init__(self, connection, batch_size):
+        self.connection = connection
+        self.batch_size = batch_size
+        self.use_copy = connection.dialect.name == 'postgresql'
+        self.counts = {}
+
+    def write(self, table, columns, rows):
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= self.batch_size:
+                self._flush(table, columns, batch)
+                batch = []
+        if batch:
+            self._flush(table, columns, batch)
+
+    def _flush(self, table, columns, batch):
+        if self.use_copy:
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            for row in batch:
+                # CSV COPY에서 따옴표 없는 빈 값은 NULL
+                writer.writerow(['' if value is None else value for value in row])
+            buffer.seek(0)
+            cursor = self.connection.connection.driver_connection.cursor()
+            try:
+                cursor.copy_expert(
+                    f'COPY {table.name} ({", ".join(columns)}) FROM STDIN WITH (FORMAT csv)',
+                    buffer
+                )
+            finally:
+                cursor.close()
+        else:
+            self.connection.execute(table.insert(), [dict(zip(columns, row)) for row in batch])
+
+        self.counts[table.name] = self.counts.get(table.name, 0) + len(batch)
+
+    def reset_sequence(self, table):
+        """명시적 id로 적재한 뒤 시퀀스를 최대 id로 맞춥니다."""
+        if self.use_copy:
+            self.connection.execute(text(
+                f"SELECT setval(pg_get_serial_sequence('{table.name}', 'id'), "
+                f"(SELECT COALESCE(MAX(id), 1) FROM {table.name}))"
+            ))
+
+
+def _next_id(connection, model):
+    return (connection.execute(db.select(func.max(model.id))).scalar() or 0) + 1
+
+
+@click.command('seed-data')
+@click.option('--scale', default=1.0, show_default=True, type=float,
+              help=f'배율 (1.0 = 사용자 {BASE_USERS:,}명, 게시글 {BASE_POSTS:,}개, 조회 {BASE_VIEWS:,}건)')
+@click.option('--seed', default=42, show_default=True, help='난수 시드 (같은 시드면 같은 데이터)')
+@click.option('--batch-size', default=10_000, show_default=True, help='한 번에 적재할 행 수')
+@click.option('--password', default='password1234', show_default=True, help='생성되는 모든 사용자의 비밀번호')
+@with_appcontext
+def seed_data(scale, seed, batch_size, password):
+    """성능 측정용 합성 데이터를 대량으로 생성합니다.
+
+    국가/학교/단과대/학과, 닉네임, 사용자, 인기도가 치우친 게시글, 대댓글이 달린 댓글,
+    좋아요/싫어요, 조회 기록을 만듭니다. 기존 데이터 뒤에 이어서 추가합니다.
+    """
+    rng = random.Random(seed)
+    started = time.perf_counter()
+    now = datetime.utcnow().replace(microsecond=0)
+    epoch = now - timedelta(days=DATE_RANGE_DAYS)
+
+    def random_time(after=epoch):
+        span = max(1, int((now - after).total_seconds()))
+        return after + timedelta(seconds=rng.randrange(span))
+
+    with db.engine.begin() as connection:
+        writer = _BulkWriter(connection, batch_size)
+
+        # 국가
+        country = connection.execute(db.select(Country.id).where(Country.code == 'KR')).scalar()
+        if country is None:
+            country = _next_id(connection, Country)
+            writer.write(Country.__table__, ('id', 'name', 'code', 'created_at', 'updated_at'),
+                         [(country, '대한민국', 'KR', now, now)])
+
+        # 닉네임 (게시글/댓글 익명 닉네임의 기본값)
+        existing_nicknames = set(connection.execute(db.select(Nickname.nickname)).scalars())
+        nicknames = [f'{adjective}{word}' for adjective in NICKNAME_ADJECTIVES for word in NICKNAME_WORDS]
+        writer.write(
+            Nickname.__table__, ('nickname', 'created_at', 'updated_at'),
+            ((nickname, now, now) for nickname in nicknames if nickname not in existing_nicknames)
+        )
+
+        # 학교 → 단과대 → 학과
+        school_id = _next_id(connection, School)
+        college_id = _next_id(connection, College)
+        department_id = _next_id(connection, Department)
+        schools, colleges, departments = [], [], []
+        hierarchy = []  # (학교, 단과대, 학과) id
+        for index in range(_scaled(BASE_SCHOOLS, scale)):
+            name = f'{REGIONS[index % len(REGIONS)]}{rng.choice(SCHOOL_SUFFIXES)}{index // len(REGIONS) + 1}'
+            schools.append((school_id, name, country, now, now))
+            for college_name in rng.sample(COLLEGES, rng.randint(4, len(COLLEGES))):
+                colleges.append((college_id, college_name, school_id, now, now))
+                for word in rng.sample(DEPARTMENT_WORDS, rng.randint(2, 6)):
+                    departments.append((department_id, f'{word}학과', college_id, now, now))
+                    hierarchy.append((school_id, college_id, department_id))
+                    department_id += 1
+                college_id += 1
+            school_id += 1
+
+        writer.write(School.__table__, ('id', 'name', 'country_id', 'created_at', 'updated_at'), schools)
+        writer.write(College.__table__, ('id', 'name', 'school_id', 'created_at', 'updated_at'), colleges)
+        writer.write(Department.__table__, ('id', 'name', 'college_id', 'created_at', 'updated_at'), departments)
+        click.echo(f'학교 {len(schools):,}개, 단과대학 {len(colleges):,}개, 학과 {len(departments):,}개')
+
+        # 사용자 (비밀번호 해시는 한 번만 계산해 공유)
+        password_hash = hash_password(password)
+        user_id = _next_id(connection, User)
+        first_user_id = user_id
+        users = []  # (id, 학교 id, 단과대 id, 학과 id)
+        users_by_school = {}
+        user_rows = []
+        for _ in range(_scaled(BASE_USERS, scale)):
+            user_school, user_college, user_department = rng.choice(hierarchy)
+            created_at = random_time()
+            user_rows.append((
+                user_id, f'user{user_id}@example.com', password_hash, f'사용자{user_id}',
+                country, user_school, user_college, user_department, 'USER',
+                None, created_at, created_at
+            ))
+            users.append((user_id, user_school, user_college, user_department))
+            users_by_school.setdefault(user_school, []).append(user_id)
+            user_id += 1
+        writer.write(User.__table__, (
+            'id', 'email', 'password', 'name', 'country_id', 'school_id', 'college_id', 'department_id',
+            'register_type', 'deleted_at', 'created_at', 'updated_at'
+        ), user_rows)
+        all_user_ids = range(first_user_id, user_id)
+        del user_rows
+        click.echo(f'사용자 {len(users):,}명')
+
+        # 게시글 (작성자는 무작위, 인기도는 Zipf 분포)
+        post_id = _next_id(connection, Post)
+        posts = []  # (id, 작성자 id, 학교 id, 닉네임, 작성 시각)
+        post_rows = []
+        for _ in range(_scaled(BASE_POSTS, scale)):
+            author, school, author_college, author_department = rng.choice(users)
+            created_at = random_time()
+            nickname = f'{rng.choice(nicknames)}{rng.randint(1000, 9999)}'
+            content = _content(rng)
+            deleted_at = random_time(created_at) if rng.random() < 0.02 else None
+            post_rows.append((
+                post_id, _sentence(rng, 2, 8)[:200], content, make_excerpt(content), rng.choice(CATEGORIES),
+                author, school, author_college, author_department, nickname, deleted_at, 0,
+                created_at, created_at
+            ))
+            posts.append((post_id, author, school, nickname, created_at))
+            post_id += 1
+        writer.write(Post.__table__, (
+            'id', 'title', 'content', 'excerpt', 'category', 'user_id', 'school_id', 'college_id',
+            'department_id', 'nickname', 'deleted_at', 'stats_version', 'created_at', 'updated_at'
+        ), post_rows)
+        del post_rows, users
+        click.echo(f'게시글 {len(posts):,}개')
+
+        weights = _popularity(rng, len(posts), POPULARITY_SKEW)
+
+        # 댓글과 대댓글 (같은 학교 사용자, 게시글 안에서는 같은 닉네임 유지)
+        comment_id = _next_id(connection, PostComment)
+
+        def comment_rows():
+            nonlocal comment_id
+            for (pid, author, school, post_nickname, post_created), count in zip(
+                posts, _allocate(rng, weights, _scaled(BASE_COMMENTS, scale))
+            ):
+                if not count:
+                    continue
+                members = users_by_school[school]
+                nicknames_by_user = {author: post_nickname}
+                top_level = []
+                for _ in range(count):
+                    commenter = rng.choice(members)
+                    nickname = nicknames_by_user.get(commenter)
+                    if nickname is None:
+                        nickname = nicknames_by_user[commenter] = f'{rng.choice(nicknames)}{rng.randint(1000, 9999)}'
+
+                    parent_id, after = None, post_created
+                    if top_level and rng.random() < REPLY_RATIO:
+                        parent_id, after = rng.choice(top_level)
+                    created_at = random_time(after)
+                    deleted_at = random_time(created_at) if rng.random() < 0.03 else None
+
+                    yield (
+                        comment_id, _sentence(rng, 1, 15), commenter, pid, parent_id,
+                        deleted_at, nickname, created_at, created_at
+                    )
+                    if parent_id is None:
+                        top_level.append((comment_id, created_at))
+                    comment_id += 1
+
+        writer.write(PostComment.__table__, (
+            'id', 'content', 'user_id', 'post_id', 'parent_id', 'deleted_at', 'nickname',
+            'created_at', 'updated_at'
+        ), comment_rows())
+        click.echo(f'댓글 {writer.counts.get(PostComment.__tablename__, 0):,}개')
+
+        # 좋아요/싫어요 (게시글당 사용자 1개, 같은 학교 사용자)
+        def like_rows():
+            for (pid, _, school, _, post_created), count in zip(
+                posts, _allocate(rng, weights, _scaled(BASE_LIKES, scale))
+            ):
+                members = users_by_school[school]
+                for liker in rng.sample(members, min(count, len(members))):
+                    created_at = random_time(post_created)
+                    yield (
+                        liker, pid, 'dislike' if rng.random() < DISLIKE_RATIO else 'like',
+                        created_at, created_at
+                    )
+
+        writer.write(PostLike.__table__, ('user_id', 'post_id', 'type', 'created_at', 'updated_at'), like_rows())
+        click.echo(f'좋아요/싫어요 {writer.counts.get(PostLike.__tablename__, 0):,}개')
+
+        # 조회 기록 (로그인 사용자는 게시글당 한 번, 나머지는 서로 다른 IP)
+        anonymous_ip = 0
+
+        def view_rows():
+            nonlocal anonymous_ip
+            for (pid, _, _, _, post_created), count in zip(
+                posts, _allocate(rng, weights, _scaled(BASE_VIEWS, scale))
+            ):
+                anonymous = int(count * ANONYMOUS_VIEW_RATIO + rng.random())
+                for viewer in rng.sample(all_user_ids, min(count - anonymous, len(all_user_ids))):
+                    created_at = random_time(post_created)
+                    yield (pid, viewer, None, created_at, created_at)
+                for _ in range(anonymous):
+                    anonymous_ip += 1
+                    created_at = random_time(post_created)
+                    ip_address = f'10.{anonymous_ip >> 16 & 255}.{anonymous_ip >> 8 & 255}.{anonymous_ip & 255}'
+                    yield (pid, None, ip_address, created_at, created_at)
+
+        writer.write(PostView.__table__, ('post_id', 'user_id', 'ip_address', 'created_at', 'updated_at'), view_rows())
+        click.echo(f'조회 기록 {writer.counts.get(PostView.__tablename__, 0):,}건')
+
+        for model in (Country, School, College, Department, User, Post, PostComment, PostLike, PostView, Nickname):
+            writer.reset_sequence(model.__table__)
+
+    click.echo(f'완료: {time.perf_counter() - started:.1f}초 (seed={seed}, scale={scale})')
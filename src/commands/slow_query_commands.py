@@ -0,0 +1,68 @@
+import json
+import click
+
+from src.config.env import (
+    SLOW_QUERY_LOG_PATH
+)
+
+
+def _load(path):
+    """느린 쿼리 기록을 지문별로 묶습니다."""
+    groups = {}
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            group = groups.setdefault(record['fingerprint'], {
+                'count': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'sql': None, 'plan': None,
+                'endpoints': {}, 'sample_params': None, 'last_seen': None
+            })
+            if record['type'] == 'plan':
+                group['plan'] = record['plan']
+                continue
+
+            group['count'] += 1
+            group['total_ms'] += record['duration_ms']
+            if record['duration_ms'] >= group['max_ms']:
+                group['max_ms'] = record['duration_ms']
+                group['sample_params'] = record.get('params')
+            group['sql'] = group['sql'] or record.get('sql')
+            group['last_seen'] = record['ts']
+            endpoint = record.get('endpoint') or '-'
+            group['endpoints'][endpoint] = group['endpoints'].get(endpoint, 0) + 1
+    # 실행 계획만 있고 기록이 없는 지문 제외
+    return {key: group for key, group in groups.items() if group['count']}
+
+
+@click.command('slow-query-report')
+@click.argument('path', default=SLOW_QUERY_LOG_PATH, type=click.Path(exists=True, dir_okay=False))
+@click.option('--sort', default='total', show_default=True, type=click.Choice(['total', 'count', 'max']),
+              help='정렬 기준')
+@click.option('--limit', default=10, show_default=True, help='출력할 쿼리 수')
+@click.option('--plans/--no-plans', default=True, show_default=True, help='실행 계획 출력')
+def slow_query_report(path, sort, limit, plans):
+    """느린 쿼리 기록(SLOW_QUERY_LOG_PATH)을 지문별로 묶어 출력합니다."""
+    groups = _load(path)
+    ordered = sorted(groups.items(), key=lambda item: item[1][f'{sort}_ms' if sort != 'count' else 'count'],
+                     reverse=True)
+
+    click.echo(f'지문 {len(groups)}개, 기록 {sum(group["count"] for group in groups.values())}건\n')
+    for key, group in ordered[:limit]:
+        endpoints = ', '.join(
+            f'{endpoint} x{count}'
+            for endpoint, count in sorted(group['endpoints'].items(), key=lambda item: -item[1])
+        )
+        click.echo(
+            f"[{key}] {group['count']}회  합계 {group['total_ms']:.1f} ms  "
+            f"평균 {group['total_ms'] / group['count']:.1f} ms  최대 {group['max_ms']:.1f} ms"
+        )
+        click.echo(f'  엔드포인트: {endpoints}')
+        click.echo(f'  마지막: {group["last_seen"]}')
+        click.echo(f"  SQL: {group['sql'] or '(기록 없음)'}")
+        click.echo(f"  바인드 값 (최대 시간): {json.dumps(group['sample_params'], ensure_ascii=False)}")
+        if plans and group['plan']:
+            click.echo('  실행 계획:')
+            for row in group['plan']:
+                click.echo(f'    {row}')
+        click.echo()
@@ -3,8 +3,20 @@ from .database import DatabaseConfig
 
 __all__ = [
     # env.py의 모든 상수
-    'DB_USERNAME', 'DB_PASSWORD', 'DB_HOST', 'DB_PORT', 'DB_NAME',
-    'SECRET_KEY', 'FLASK_ENV', 'DEBUG',
+    'DB_USERNAME', 'DB_PASSWORD', 'DB_HOST', 'DB_PORT', 'DB_NAME', 'DATABASE_URL',
+    'DB_POOL_MODE', 'DB_POOL_MODE_EXPLICIT', 'DB_POOL_SIZE', 'DB_MAX_OVERFLOW', 'DB_POOL_TIMEOUT', 'DB_POOL_RECYCLE',
+    'DB_POOL_PRE_PING', 'DB_SERVERLESS_POOL_SIZE', 'DB_STATEMENT_TIMEOUT',
+    'SECRET_KEY', 'FLASK_ENV', 'DEBUG', 'FAST_START',
+    'SQL_METRICS_ENABLED', 'SQL_SERVER_TIMING', 'N_PLUS_ONE_MODE', 'N_PLUS_ONE_THRESHOLD',
+    'PARALLEL_READS', 'PARALLEL_READ_WORKERS',
+    'SLOW_QUERY_THRESHOLD_MS', 'SLOW_QUERY_LOG_PATH', 'SLOW_QUERY_EXPLAIN',
+    'METRICS_ENABLED', 'METRICS_TOKEN',
+    'PROFILING_SAMPLE_RATE', 'PROFILING_SECRET', 'PROFILING_DIR', 'PROFILING_MAX_FILES',
+    'TRAFFIC_CAPTURE_RATE', 'TRAFFIC_CAPTURE_PATH',
+    'USER_CACHE_TTL', 'USER_CACHE_MAXSIZE',
+    'PASSWORD_HASH_METHOD', 'PASSWORD_HASH_WORKERS',
+    'TOKEN_REVOCATION_REFRESH_INTERVAL', 'REFERENCE_CACHE_TTL', 'REFERENCE_VERSION_CHECK_INTERVAL',
+    'COMPRESSION_ENABLED', 'COMPRESSION_MIN_SIZE', 'COMPRESSION_LEVEL', 'COMPRESSION_BROTLI_QUALITY',
     
     # database.py의 설정 클래스
     'DatabaseConfig'
@@ -1,23 +1,40 @@
+from urllib.parse import urlsplit
 from src.config.env import (
     DB_USERNAME,
     DB_PASSWORD,
     DB_HOST,
     DB_PORT,
-    DB_NAME
+    DB_NAME,
+    DATABASE_URL,
+    DB_POOL_MODE,
+    DB_POOL_MODE_EXPLICIT,
+    DB_POOL_SIZE,
+    DB_MAX_OVERFLOW,
+    DB_POOL_TIMEOUT,
+    DB_POOL_RECYCLE,
+    DB_POOL_PRE_PING,
+    DB_SERVERLESS_POOL_SIZE,
+    DB_STATEMENT_TIMEOUT
 )
 
+# 풀러 없이 serverless 모드를 쓸 때 컨테이너당 연결 수
+DEFAULT_SERVERLESS_POOL_SIZE = 1
+
+
 class DatabaseConfig:
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     
     def __init__(self):
-        if DB_USERNAME and DB_PASSWORD:
-            self.SQLALCHEMY_DATABASE_URI = f"postgresql://{DB_USERNAME}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
-        else:
-            self.SQLALCHEMY_DATABASE_URI = f"postgresql://{DB_HOST}:{DB_PORT}/{DB_NAME}"
+        # 임포트 시점이 아니라 앱을 만들 때 계산
+        self.SQLALCHEMY_DATABASE_URI = self.get_database_url()
+        self.SQLALCHEMY_ENGINE_OPTIONS = self.get_engine_options(self.SQLALCHEMY_DATABASE_URI)
 
     @staticmethod
     def get_database_url():
         """데이터베이스 URL을 생성합니다."""
+        if DATABASE_URL:
+            return DATABASE_URL
+
         if not DB_NAME:
             raise ValueError("DB_NAME은 필수 환경 변수입니다")
             
@@ -26,4 +43,62 @@ class DatabaseConfig:
         
         return f"postgresql://{DB_HOST}:{DB_PORT}/{DB_NAME}"
 
-    SQLALCHEMY_DATABASE_URI = get_database_url() 
\ No newline at end of file
+    @staticmethod
+    def is_pooler_url(url):
+        """RDS Proxy 엔드포인트이거나 PgBouncer 기본 포트(6432)인지 확인합니다."""
+        parsed = urlsplit(url)
+        return '.proxy-' in (parsed.hostname or '') or parsed.port == 6432
+
+    @staticmethod
+    def get_serverless_pool_size(url):
+        """serverless 모드의 컨테이너당 풀 크기를 반환합니다. 0이면 NullPool을 사용합니다.
+
+        외부 풀러 없이 요청마다 새로 연결하지 않도록, 지정하지 않으면 DB_POOL_MODE=serverless를
+        직접 지정했거나 풀러 주소일 때만 0을 사용합니다.
+        """
+        if DB_SERVERLESS_POOL_SIZE is not None:
+            return DB_SERVERLESS_POOL_SIZE
+        if DB_POOL_MODE_EXPLICIT or DatabaseConfig.is_pooler_url(url):
+            return 0
+        return DEFAULT_SERVERLESS_POOL_SIZE
+
+    @staticmethod
+    def get_engine_options(url):
+        """DB_POOL_* 설정으로 create_engine 옵션을 만듭니다."""
+        # 로컬 테스트/벤치마크용 sqlite는 Flask-SQLAlchemy 기본값 사용
+        if url.startswith('sqlite'):
+            return {}
+
+        from src.utils.db_pool import TimedQueuePool, TimedNullPool
+
+        if DB_POOL_MODE == 'queue':
+            options = {
+                'poolclass': TimedQueuePool,
+                'pool_size': DB_POOL_SIZE,
+                'max_overflow': DB_MAX_OVERFLOW,
+                'pool_timeout': DB_POOL_TIMEOUT,
+                'pool_recycle': DB_POOL_RECYCLE,
+                'pool_pre_ping': DB_POOL_PRE_PING
+            }
+        elif DB_POOL_MODE == 'serverless':
+            pool_size = DatabaseConfig.get_serverless_pool_size(url)
+            if pool_size > 0:
+                # 컨테이너당 연결 수를 고정 (overflow 없음)
+                options = {
+                    'poolclass': TimedQueuePool,
+                    'pool_size': pool_size,
+                    'max_overflow': 0,
+                    'pool_timeout': DB_POOL_TIMEOUT,
+                    'pool_recycle': DB_POOL_RECYCLE,
+                    'pool_pre_ping': DB_POOL_PRE_PING
+                }
+            else:
+                # 체크아웃마다 새 연결 (풀링은 외부 풀러가 담당하므로 pre-ping/recycle 불필요)
+                options = {'poolclass': TimedNullPool}
+        else:
+            raise ValueError(f"알 수 없는 DB_POOL_MODE입니다: {DB_POOL_MODE}")
+
+        if DB_STATEMENT_TIMEOUT > 0:
+            options['connect_args'] = {'options': f'-c statement_timeout={DB_STATEMENT_TIMEOUT}'}
+
+        return options
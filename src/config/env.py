@@ -1,17 +1,22 @@
+import logging
 import os
-from dotenv import load_dotenv
+
+logger = logging.getLogger(__name__)
 
 ENV = os.getenv('ENV', 'local')
 # 환경 변수 파일 경로 설정
 FLASK_ENV = ENV
 env_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), f'.env.{FLASK_ENV}')
 
-# 환경 변수 파일이 존재하는지 확인하고 로드
+# 빠른 시작 모드: Lambda(Zappa)처럼 콜드 스타트가 잦은 곳에서 앱 생성을 첫 요청까지 미룹니다. (app.py 참고)
+# 지정하지 않으면 Lambda에서 실행 중일 때 켜집니다.
+FAST_START = os.getenv('FAST_START', str('AWS_LAMBDA_FUNCTION_NAME' in os.environ)).lower() == 'true'
+
+# 환경 변수 파일이 존재하는지 확인하고 로드 (Zappa 번들에 .env 파일을 포함하는 경우도 있으므로 빠른 시작 모드에서도 읽음)
 if os.path.exists(env_path):
+    from dotenv import load_dotenv
     load_dotenv(env_path, override=True)
-    print(f"환경 변수 파일 로드: {env_path}")
-else:
-    print(f"Warning: {env_path} 파일을 찾을 수 없습니다.")
+    logger.debug('환경 변수 파일 로드: %s', env_path)
 
 # 환경 변수 로드 후 설정
 DB_USERNAME = os.getenv('DB_USERNAME')
@@ -19,21 +24,82 @@ DB_PASSWORD = os.getenv('DB_PASSWORD')
 DB_HOST = os.getenv('DB_HOST', 'localhost')
 DB_PORT = os.getenv('DB_PORT', '5432')
 DB_NAME = os.getenv('DB_NAME')
-SECRET_KEY = os.getenv('SECRET_KEY', 'your-secret-key')
+DATABASE_URL = os.getenv('DATABASE_URL')  # 지정하면 DB_* 값 대신 사용
+
+# 커넥션 풀 설정
+# queue: 프로세스마다 QueuePool 유지 (일반 서버)
+# serverless: Lambda처럼 컨테이너가 많은 환경용 (Lambda의 기본값). 컨테이너당 작은 고정 풀을 쓰고,
+#             DB_SERVERLESS_POOL_SIZE가 0이면 NullPool로 요청마다 연결하므로
+#             RDS Proxy/PgBouncer 같은 외부 풀러 뒤에서만 사용합니다.
+DB_POOL_MODE = os.getenv('DB_POOL_MODE', 'serverless' if 'AWS_LAMBDA_FUNCTION_NAME' in os.environ else 'queue')
+DB_POOL_MODE_EXPLICIT = 'DB_POOL_MODE' in os.environ
+DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', '5'))
+DB_MAX_OVERFLOW = int(os.getenv('DB_MAX_OVERFLOW', '10'))
+DB_POOL_TIMEOUT = float(os.getenv('DB_POOL_TIMEOUT', '30'))  # 초, 체크아웃 대기 한도
+DB_POOL_RECYCLE = int(os.getenv('DB_POOL_RECYCLE', '1800'))  # 초, -1이면 재생성하지 않음
+DB_POOL_PRE_PING = os.getenv('DB_POOL_PRE_PING', 'True').lower() == 'true'
+# 0이면 NullPool. 비우면 DB_POOL_MODE=serverless를 직접 지정했거나 외부 풀러 주소일 때만 0, 그 외에는 1
+DB_SERVERLESS_POOL_SIZE = int(os.getenv('DB_SERVERLESS_POOL_SIZE')) if os.getenv('DB_SERVERLESS_POOL_SIZE') else None
+# 밀리초, 0이면 설정하지 않음. 연결 시작 옵션으로 전달하므로 PgBouncer에서는
+# ignore_startup_parameters에 options를 추가하거나 DB 역할에 직접 설정하고 0으로 둡니다.
+DB_STATEMENT_TIMEOUT = int(os.getenv('DB_STATEMENT_TIMEOUT', '0'))
+
+# 로컬 외 환경에서는 기본값으로 토큰을 서명하지 않도록 시작 시 실패
+SECRET_KEY = os.getenv('SECRET_KEY') or ('your-secret-key' if ENV == 'local' else None)
+if not SECRET_KEY:
+    raise ValueError(f"SECRET_KEY는 필수 환경 변수입니다 (ENV={ENV})")
 DEBUG = os.getenv('DEBUG', 'False').lower() == 'true'
 
-# 디버깅을 위한 출력
-print(f"현재 환경: {FLASK_ENV}")
-print("DB_USERNAME", DB_USERNAME)
-print("DB_PASSWORD", DB_PASSWORD)
-print("DB_HOST", DB_HOST)
-print("DB_PORT", DB_PORT)
-print("DB_NAME", DB_NAME)
-print("SECRET_KEY", SECRET_KEY)
-print("DEBUG", DEBUG)
-
-# 파일 경로와 내용 재확인
-print(f"환경 변수 파일 경로: {os.path.abspath(env_path)}")
-if os.path.exists(env_path):
-    with open(env_path, 'r') as f:
-        print(f"환경 변수 파일 내용:\n{f.read()}")
\ No newline at end of file
+# 요청 단위 SQL 계측 (쿼리 수/DB 시간), SQL_SERVER_TIMING이면 Server-Timing 헤더로도 내려줌
+# 헤더는 모든 클라이언트에게 보이므로 로컬 측정(benchmarks/traffic_replay.py 등)에서만 켬
+SQL_METRICS_ENABLED = os.getenv('SQL_METRICS_ENABLED', 'True').lower() == 'true'
+SQL_SERVER_TIMING = os.getenv('SQL_SERVER_TIMING', 'False').lower() == 'true'
+
+# N+1 쿼리 감지 (off/warn/raise, 비우면 테스트는 raise, DEBUG는 warn, 그 외 off)
+N_PLUS_ONE_MODE = os.getenv('N_PLUS_ONE_MODE', '').lower()
+N_PLUS_ONE_THRESHOLD = int(os.getenv('N_PLUS_ONE_THRESHOLD', '5'))  # 같은 SELECT 반복 횟수
+
+# 한 요청 안의 독립적인 조회(목록/개수 등)를 동시에 실행. 요청당 커넥션이 작업 수 + 1개까지 필요
+PARALLEL_READS = os.getenv('PARALLEL_READS', 'False').lower() == 'true'
+PARALLEL_READ_WORKERS = int(os.getenv('PARALLEL_READ_WORKERS', '4'))
+
+# 느린 쿼리 기록 (기준 ms, 0이면 끔). 지문마다 한 번 별도 커넥션에서 EXPLAIN
+SLOW_QUERY_THRESHOLD_MS = float(os.getenv('SLOW_QUERY_THRESHOLD_MS', '0'))
+SLOW_QUERY_LOG_PATH = os.getenv('SLOW_QUERY_LOG_PATH', 'slow_queries.jsonl')  # '-'이면 'slow_query' 로거
+SLOW_QUERY_EXPLAIN = os.getenv('SLOW_QUERY_EXPLAIN', 'True').lower() == 'true'
+
+# 런타임 지표 (Prometheus 형식). /metrics는 토큰을 지정해야 열리며 'Authorization: Bearer <토큰>' 필요
+METRICS_ENABLED = os.getenv('METRICS_ENABLED', 'True').lower() == 'true'
+METRICS_TOKEN = os.getenv('METRICS_TOKEN', '')
+
+# 요청 프로파일링 (cProfile). 비율 0이고 비밀 키가 없으면 끔. Lambda에서는 /tmp 아래만 쓰기 가능
+PROFILING_SAMPLE_RATE = float(os.getenv('PROFILING_SAMPLE_RATE', '0'))
+PROFILING_SECRET = os.getenv('PROFILING_SECRET', '')  # X-Profile-Token 서명 키
+PROFILING_DIR = os.getenv('PROFILING_DIR', '/tmp/profiles')
+PROFILING_MAX_FILES = int(os.getenv('PROFILING_MAX_FILES', '100'))
+
+# 트래픽 샘플 수집 (0~1 비율, 0이면 끔). 경로가 '-'이면 파일 대신 'traffic' 로거로 기록
+TRAFFIC_CAPTURE_RATE = float(os.getenv('TRAFFIC_CAPTURE_RATE', '0'))
+TRAFFIC_CAPTURE_PATH = os.getenv('TRAFFIC_CAPTURE_PATH', 'traffic.jsonl')
+
+# 인증 사용자 캐시 설정
+USER_CACHE_TTL = int(os.getenv('USER_CACHE_TTL', '60'))  # 초
+USER_CACHE_MAXSIZE = int(os.getenv('USER_CACHE_MAXSIZE', '10000'))
+
+# 비밀번호 해시 설정 (werkzeug 형식, 예: scrypt:32768:8:1, pbkdf2:sha256:600000)
+PASSWORD_HASH_METHOD = os.getenv('PASSWORD_HASH_METHOD', 'scrypt:32768:8:1')
+PASSWORD_HASH_WORKERS = int(os.getenv('PASSWORD_HASH_WORKERS', str(os.cpu_count() or 1)))
+
+# 토큰 폐기 목록 동기화 주기
+TOKEN_REVOCATION_REFRESH_INTERVAL = float(os.getenv('TOKEN_REVOCATION_REFRESH_INTERVAL', '5'))  # 초
+
+# 국가/학교/단과대/학과 참조 데이터 캐시 유지 시간과 버전 확인 주기
+# (flask reload-reference-data가 올린 버전을 실행 중인 서버가 확인 주기 안에 반영)
+REFERENCE_CACHE_TTL = float(os.getenv('REFERENCE_CACHE_TTL', '3600'))  # 초
+REFERENCE_VERSION_CHECK_INTERVAL = float(os.getenv('REFERENCE_VERSION_CHECK_INTERVAL', '5'))  # 초
+
+# 응답 압축 설정
+COMPRESSION_ENABLED = os.getenv('COMPRESSION_ENABLED', 'True').lower() == 'true'
+COMPRESSION_MIN_SIZE = int(os.getenv('COMPRESSION_MIN_SIZE', '1024'))  # 바이트, 이보다 작으면 압축하지 않음
+COMPRESSION_LEVEL = int(os.getenv('COMPRESSION_LEVEL', '6'))  # gzip 1~9
+COMPRESSION_BROTLI_QUALITY = int(os.getenv('COMPRESSION_BROTLI_QUALITY', '4'))  # brotli 0~11 (brotli 설치 시)
@@ -1,11 +1,12 @@
 from .base import db
 from .user import User
-from .school import Country, School, College, Department
+from .school import Country, School, College, Department, ReferenceDataVersion
 from .post import Post
 from .comment import PostComment
 from .like import PostLike
 from .view import PostView
 from .nickname import Nickname
+from .token_revocation import TokenRevocation
 from .enums import UserType
 
 __all__ = [
@@ -15,10 +16,12 @@ __all__ = [
     'School',
     'College',
     'Department',
+    'ReferenceDataVersion',
     'Post',
     'PostComment',
     'PostLike',
     'PostView',
     'Nickname',
+    'TokenRevocation',
     'UserType'
 ]
\ No newline at end of file
@@ -2,6 +2,10 @@ from .base import db, TimestampMixin
 
 class PostLike(db.Model, TimestampMixin):
     __tablename__ = 'post_likes'
+    __table_args__ = (
+        # 사용자별 반응 상태 일괄 조회 (user_id = ? AND post_id IN (...))
+        db.Index('ix_post_likes_user_id_post_id', 'user_id', 'post_id'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
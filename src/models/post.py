@@ -6,6 +6,7 @@ class Post(db.Model, TimestampMixin):
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(200), nullable=False)
     content = db.Column(db.Text, nullable=False)
+    excerpt = db.Column(db.String(255), nullable=True)  # 목록용 미리보기 (content 앞부분)
     category = db.Column(db.String(50), nullable=False)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
     school_id = db.Column(db.Integer, db.ForeignKey('schools.id'), nullable=False)
@@ -13,6 +14,8 @@ class Post(db.Model, TimestampMixin):
     department_id = db.Column(db.Integer, db.ForeignKey('departments.id'), nullable=False)
     nickname = db.Column(db.String(100), nullable=False)  # 랜덤 닉네임
     deleted_at = db.Column(db.DateTime, nullable=True)
+    # 조회/댓글/좋아요 등 집계 값이 바뀔 때마다 증가 (ETag 검증자용, updated_at은 바꾸지 않음)
+    stats_version = db.Column(db.Integer, nullable=False, default=0, server_default='0')
 
     # Relationships
     post_comments = db.relationship('PostComment', backref='post', lazy=True)
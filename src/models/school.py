@@ -1,3 +1,4 @@
+from datetime import datetime
 from .base import db, TimestampMixin
 
 class Country(db.Model, TimestampMixin):
@@ -56,4 +57,15 @@ class Department(db.Model, TimestampMixin):
     posts = db.relationship('Post', backref='department', lazy=True)
 
     def __repr__(self):
-        return f'<Department {self.name}>'
\ No newline at end of file
+        return f'<Department {self.name}>'
+
+class ReferenceDataVersion(db.Model):
+    """국가/학교/단과대/학과 데이터의 버전 (한 행). 값이 바뀌면 각 서버가 참조 데이터 캐시를 다시 불러옵니다."""
+    __tablename__ = 'reference_data_versions'
+
+    id = db.Column(db.Integer, primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f'<ReferenceDataVersion {self.version}>'
@@ -0,0 +1,16 @@
+from datetime import datetime
+from .base import db
+
+class TokenRevocation(db.Model):
+    __tablename__ = 'token_revocations'
+
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    # jti가 있으면 해당 토큰만, 없으면 not_before 이전에 발급된 사용자의 모든 토큰을 폐기
+    jti = db.Column(db.String(64), nullable=True, unique=True)
+    not_before = db.Column(db.DateTime, nullable=True)
+    expires_at = db.Column(db.DateTime, nullable=False)  # 이 시각 이후에는 토큰 자체가 만료됨
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f'<TokenRevocation user_id={self.user_id}, jti={self.jti}>'
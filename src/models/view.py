@@ -2,6 +2,10 @@ from .base import db, TimestampMixin
 
 class PostView(db.Model, TimestampMixin):
     __tablename__ = 'post_views'
+    __table_args__ = (
+        # 게시글별 조회 기록 확인과 마지막 조회 ID(상세 응답 ETag) 조회
+        db.Index('ix_post_views_post_id_id', 'post_id', 'id'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     post_id = db.Column(db.Integer, db.ForeignKey('posts.id'), nullable=False)
@@ -1,13 +1,13 @@
-from flask import Blueprint
-from src.routes.v1.auth_routes import auth_bp
-from src.routes.v1.post_routes import post_bp
-from src.routes.v1.comment_routes import comment_bp
-from src.routes.v1.school_routes import school_bp
-from src.routes.v1.user_routes import user_bp
-from src.routes.v1.like_routes import like_bp
-
 def init_routes(app):
     """애플리케이션의 모든 라우트를 등록합니다."""
+
+    # 라우트 모듈(서비스/모델 포함)은 앱을 만들 때 임포트 (빠른 시작 모드에서 첫 요청까지 지연)
+    from src.routes.v1.auth_routes import auth_bp
+    from src.routes.v1.post_routes import post_bp
+    from src.routes.v1.comment_routes import comment_bp
+    from src.routes.v1.school_routes import school_bp
+    from src.routes.v1.user_routes import user_bp
+    from src.routes.v1.like_routes import like_bp
     
     # API v1 라우트
     
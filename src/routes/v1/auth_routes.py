@@ -1,5 +1,6 @@
 from flask import Blueprint, request, jsonify
 from src.services.auth_service import AuthService
+from src.utils.auth import token_required, get_auth_context
 
 auth_bp = Blueprint('auth', __name__)
 
@@ -50,3 +51,12 @@ def login():
         return jsonify({'error': str(e)}), 401
     except Exception as e:
         return jsonify({'error': '서버 오류가 발생했습니다'}), 500
+
+@auth_bp.route('/logout', methods=['POST'])
+@token_required
+def logout(current_user):
+    try:
+        AuthService.logout(get_auth_context().token_data)
+        return '', 204
+    except Exception as e:
+        return jsonify({'error': '서버 오류가 발생했습니다'}), 500
@@ -1,6 +1,8 @@
 from flask import Blueprint, request, jsonify
 from src.services.comment_service import CommentService
 from src.utils.auth import token_required
+from src.utils.serializers import json_response, parse_fields, COMMENT_FIELDS
+from src.utils.http_cache import make_weak_etag, etag_matches, not_modified
 from flask import current_app
 
 comment_bp = Blueprint('comment', __name__)
@@ -9,10 +11,23 @@ comment_bp = Blueprint('comment', __name__)
 def get_post_comments(post_id):
     page = request.args.get('page', 1, type=int)
     per_page = request.args.get('per_page', 10, type=int)
+
+    try:
+        fields = parse_fields(request.args.get('fields'), COMMENT_FIELDS)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     
     try:
-        result = CommentService.get_comments(post_id, page, per_page)
-        return jsonify(result), 200
+        # 본문보다 먼저 읽은 검증자를 사용 (그 사이 변경이 있으면 다음 요청에서 다시 200)
+        headers = {'Cache-Control': 'no-cache'}
+        version = CommentService.get_comments_validator(post_id)
+        if version is not None:
+            headers['ETag'] = make_weak_etag('comments', post_id, version)
+            if etag_matches(request.headers.get('If-None-Match'), headers['ETag']):
+                return not_modified(headers['ETag'], headers)
+
+        result = CommentService.get_comments(post_id, page, per_page, fields)
+        return json_response(result, 200, headers)
     except ValueError as e:
         return jsonify({'error': str(e)}), 404
     except Exception as e:
@@ -78,8 +93,17 @@ def get_comment_replies(post_id, comment_id):
     
     try:
         current_app.logger.debug(f"Fetching replies for post_id: {post_id}, comment_id: {comment_id}")
-        result = CommentService.get_replies(post_id, comment_id, page, per_page)
-        return jsonify(result), 200
+        fields = parse_fields(request.args.get('fields'), COMMENT_FIELDS)
+
+        headers = {'Cache-Control': 'no-cache'}
+        version = CommentService.get_comments_validator(post_id)
+        if version is not None:
+            headers['ETag'] = make_weak_etag('replies', post_id, comment_id, version)
+            if etag_matches(request.headers.get('If-None-Match'), headers['ETag']):
+                return not_modified(headers['ETag'], headers)
+
+        result = CommentService.get_replies(post_id, comment_id, page, per_page, fields)
+        return json_response(result, 200, headers)
     except ValueError as e:
         current_app.logger.error(f"ValueError in get_comment_replies: {str(e)}")
         return jsonify({'error': str(e)}), 404 if '존재하지 않는' in str(e) else 400
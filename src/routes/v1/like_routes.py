@@ -1,9 +1,25 @@
-from flask import Blueprint, jsonify
+from flask import Blueprint, request, jsonify
 from src.services.like_service import LikeService
 from src.utils.auth import token_required
 
 like_bp = Blueprint('like', __name__)
 
+@like_bp.route('/reactions:lookup', methods=['POST'])
+@token_required
+def lookup_reactions(current_user):
+    data = request.get_json(silent=True) or {}
+
+    if 'post_ids' not in data:
+        return jsonify({'error': 'post_ids는 필수 항목입니다'}), 400
+
+    try:
+        reactions = LikeService.get_reaction_statuses(current_user.id, data['post_ids'])
+        return jsonify({'reactions': reactions}), 200
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
 @like_bp.route('/<int:post_id>/like', methods=['POST'])
 @token_required
 def like_post(current_user, post_id):
@@ -1,8 +1,8 @@
 from flask import Blueprint, current_app, request, jsonify
 from src.services.post_service import PostService
-from src.utils.auth import token_required
-import jwt
-from src.services.user_service import UserService
+from src.utils.auth import token_required, get_optional_school_id, get_optional_user_id
+from src.utils.serializers import json_response, parse_fields, POST_FIELDS
+from src.utils.http_cache import make_weak_etag, etag_matches, not_modified
 
 post_bp = Blueprint('post', __name__)
 
@@ -21,27 +21,44 @@ def get_posts():
         'department_id': request.args.get('department_id', type=int)
     }
     
-    # 현재 사용자의 학교 정보와 ID 가져오기
-    current_user_school_id = UserService.get_user_school_id(request.headers)
-    current_user_id = UserService.get_user_id(request.headers)
+    # 현재 사용자의 학교 정보와 ID 가져오기 (토큰 클레임 사용, 구버전 토큰만 사용자 조회)
+    current_user_school_id = get_optional_school_id()
+    current_user_id = get_optional_user_id()
     
     try:
-        result = PostService.get_posts(page, per_page, current_user_school_id, current_user_id, **filters)
-        return jsonify(result), 200
+        # 응답 필드 선택 (?fields=id,title,...)
+        fields = parse_fields(request.args.get('fields'), POST_FIELDS)
+        result = PostService.get_posts(page, per_page, current_user_school_id, current_user_id, fields, **filters)
+        return json_response(result, 200)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @post_bp.route('/<int:post_id>', methods=['GET'])
 def get_post(post_id):
     # 현재 사용자 정보 가져오기
-    user_id = UserService.get_user_id(request.headers)
+    user_id = get_optional_user_id()
     
     # IP 주소 가져오기
     ip_address = request.remote_addr
+
+    # 좋아요/싫어요 여부가 사용자마다 다르므로 공유 캐시에는 저장하지 않음
+    headers = {'Cache-Control': 'private, no-cache', 'Vary': 'Authorization'}
     
     try:
-        result = PostService.get_post(post_id, user_id, ip_address)
-        return jsonify(result), 200
+        # 변경되지 않았으면 집계 쿼리 없이 304 응답
+        if_none_match = request.headers.get('If-None-Match')
+        if if_none_match:
+            validator = PostService.get_post_validator(post_id)
+            if validator:
+                etag = make_weak_etag('post', post_id, user_id or 0, *validator)
+                if etag_matches(if_none_match, etag):
+                    return not_modified(etag, headers)
+
+        result, validator = PostService.get_post_with_validator(post_id, user_id, ip_address)
+        headers['ETag'] = make_weak_etag('post', post_id, user_id or 0, *validator)
+        return json_response(result, 200, headers)
     except ValueError as e:
         return jsonify({'error': str(e)}), 404
     except Exception as e:
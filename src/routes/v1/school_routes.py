@@ -3,6 +3,21 @@ from src.services.school_service import SchoolService
 
 school_bp = Blueprint('school', __name__)
 
+@school_bp.route('/snapshot', methods=['GET'])
+def get_hierarchy_snapshot():
+    country_id = request.args.get('country_id', type=int)
+
+    if country_id is None:
+        return jsonify({'error': 'country_id는 필수 항목입니다'}), 400
+
+    try:
+        snapshot = SchoolService.get_hierarchy_snapshot(country_id)
+        return snapshot.make_response(request, headers={'Cache-Control': 'no-cache'})
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 404
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
 @school_bp.route('/', methods=['GET'])
 def get_countries():
     page = request.args.get('page', 1, type=int)
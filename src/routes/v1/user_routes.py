@@ -2,6 +2,8 @@ from flask import Blueprint, request, jsonify
 from src.services.user_service import UserService
 from src.utils.auth import token_required
 from src.utils.formatters import get_current_user_data
+from src.utils.serializers import json_response, parse_fields, POST_FIELDS, COMMENT_FIELDS
+from src.utils.http_cache import make_weak_etag, etag_matches, not_modified
 
 user_bp = Blueprint('user', __name__)
 
@@ -9,7 +11,15 @@ user_bp = Blueprint('user', __name__)
 @token_required
 def get_current_user(current_user):
     try:
-        return jsonify(get_current_user_data(current_user)), 200
+        # 인증 시 읽은 사용자 스냅샷의 버전을 사용하므로 추가 조회가 없음
+        headers = {
+            'ETag': make_weak_etag('me', current_user.id, current_user.version),
+            'Cache-Control': 'private, no-cache'
+        }
+        if etag_matches(request.headers.get('If-None-Match'), headers['ETag']):
+            return not_modified(headers['ETag'], headers)
+
+        return json_response(get_current_user_data(current_user), 200, headers)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -57,8 +67,9 @@ def get_my_posts(current_user):
     per_page = request.args.get('per_page', 10, type=int)
     
     try:
-        result = UserService.get_my_posts(current_user.id, page, per_page)
-        return jsonify(result), 200
+        fields = parse_fields(request.args.get('fields'), POST_FIELDS)
+        result = UserService.get_my_posts(current_user.id, page, per_page, fields)
+        return json_response(result, 200)
     except ValueError as e:
         return jsonify({'error': str(e)}), 400
     except Exception as e:
@@ -71,8 +82,9 @@ def get_my_comments(current_user):
     per_page = request.args.get('per_page', 10, type=int)
     
     try:
-        result = UserService.get_my_comments(current_user.id, page, per_page)
-        return jsonify(result), 200
+        fields = parse_fields(request.args.get('fields'), COMMENT_FIELDS)
+        result = UserService.get_my_comments(current_user.id, page, per_page, fields)
+        return json_response(result, 200)
     except ValueError as e:
         return jsonify({'error': str(e)}), 400
     except Exception as e:
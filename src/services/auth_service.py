@@ -1,8 +1,20 @@
-from datetime import datetime, timedelta
-from werkzeug.security import generate_password_hash, check_password_hash
+from datetime import datetime
+from uuid import uuid4
 import jwt
 from flask import current_app
-from src.models import db, User, Country, School, College, Department
+from src.models import db, User
+from src.utils.reference_cache import get_reference_data
+from src.utils.user_cache import user_version
+from src.utils.password import hash_password, verify_password, needs_rehash
+from src.utils.revocation import (
+    ACCESS_TOKEN_LIFETIME, revocation_list, revoke_token, revoke_user_tokens, to_timestamp
+)
+
+# 액세스 토큰 형식 버전
+# 1: user_id, email
+# 2: 1 + country_id, school_id, college_id, department_id, uv(사용자 버전 스탬프)
+# 3: 2 + jti, iat (토큰 폐기용)
+TOKEN_VERSION = 3
 
 class AuthService:
     @staticmethod
@@ -11,38 +23,33 @@ class AuthService:
         if User.query.filter_by(email=data['email']).first():
             raise ValueError('이미 존재하는 이메일입니다')
         
+        reference = get_reference_data()
+
         # 국가 존재 여부 확인
-        country = Country.query.get(data['country_id'])
-        if not country:
+        if data['country_id'] not in reference.countries:
             raise ValueError('유효하지 않은 국가 ID입니다')
         
         # 학교 존재 여부와 국가 관계 확인
-        school = School.query.get(data['school_id'])
+        school = reference.schools.get(data['school_id'])
         if not school:
             raise ValueError('유효하지 않은 학교 ID입니다')
         if school.country_id != data['country_id']:
             raise ValueError('해당 국가의 학교가 아닙니다')
             
         # 단과대학 존재 여부와 학교 관계 확인
-        college = College.query.filter_by(
-            id=data['college_id'], 
-            school_id=data['school_id']
-        ).first()
-        if not college:
+        college = reference.colleges.get(data['college_id'])
+        if not college or college.school_id != data['school_id']:
             raise ValueError('유효하지 않은 단과대학 ID이거나 해당 학교에 속하지 않는 단과대학입니다')
             
         # 학과 존재 여부와 단과대학 관계 확인
-        department = Department.query.filter_by(
-            id=data['department_id'], 
-            college_id=data['college_id']
-        ).first()
-        if not department:
+        department = reference.departments.get(data['department_id'])
+        if not department or department.college_id != data['college_id']:
             raise ValueError('유효하지 않은 학과 ID이거나 해당 단과대학에 속하지 않는 학과입니다')
 
         # 새 사용자 생성
         new_user = User(
             email=data['email'],
-            password=generate_password_hash(data['password']),
+            password=hash_password(data['password']),
             name=data['name'],
             country_id=data['country_id'],
             school_id=data['school_id'],
@@ -58,21 +65,40 @@ class AuthService:
     @staticmethod
     def login(email, password):
         user = User.query.filter_by(email=email).first()
-        if not user or not check_password_hash(user.password, password):
+        if not user or not verify_password(user.password, password):
             raise ValueError('이메일 또는 비밀번호가 잘못되었습니다')
             
         # 삭제된 계정 확인
         if user.is_deleted:
             raise ValueError('삭제된 계정입니다')
+
+        # 해시 파라미터가 현재 설정과 다르면 새 파라미터로 다시 저장
+        if needs_rehash(user.password):
+            try:
+                user.password = hash_password(password)
+                db.session.commit()
+            except Exception as e:
+                db.session.rollback()
+                current_app.logger.warning(f'Failed to rehash password for user {user.id}: {str(e)}')
             
         return user
 
     @staticmethod
     def create_access_token(user):
+        now = datetime.utcnow()
         token_data = {
+            'ver': TOKEN_VERSION,
+            'jti': uuid4().hex,
             'user_id': user.id,
             'email': user.email,
-            'exp': datetime.utcnow() + timedelta(days=30)
+            'country_id': user.country_id,
+            'school_id': user.school_id,
+            'college_id': user.college_id,
+            'department_id': user.department_id,
+            'uv': user_version(user.updated_at),
+            # 초 미만까지 기록 (같은 초에 일어난 사용자 단위 폐기와 구분)
+            'iat': to_timestamp(now),
+            'exp': now + ACCESS_TOKEN_LIFETIME
         }
         
         return jwt.encode(
@@ -81,10 +107,29 @@ class AuthService:
             algorithm='HS256'
         )
 
+    @staticmethod
+    def logout(token_data):
+        """현재 토큰을 폐기합니다."""
+        # jti가 없는 구버전 토큰은 개별 폐기가 불가능하므로 사용자의 모든 토큰을 폐기
+        if token_data.get('jti'):
+            revocation = revoke_token(token_data)
+        else:
+            revocation = revoke_user_tokens(token_data['user_id'])
+
+        try:
+            db.session.commit()
+            revocation_list.apply(revocation)
+        except Exception as e:
+            db.session.rollback()
+            raise e
+
     @staticmethod
     def verify_token(token):
         try:
             data = jwt.decode(token, current_app.config['SECRET_KEY'], algorithms=["HS256"])
+            if revocation_list.is_revoked(data):
+                raise ValueError('폐기된 토큰입니다')
+
             user = User.query.get(data['user_id'])
             
             if not user:
@@ -4,12 +4,26 @@ import logging
 from sqlalchemy import func, distinct, and_
 from src.models import db, Post, PostComment, User
 from src.services.nickname_service import NicknameService
+from src.services.post_service import PostService
 from src.utils.formatters import get_comment_data
+from src.utils.serializers import serialize_comment_rows, comment_load_options
+from src.utils.pagination import paginate_query
 
 class CommentService:
     
     @staticmethod
-    def get_comments(post_id, page, per_page):
+    def get_comments_validator(post_id):
+        """댓글/대댓글 목록 응답의 검증자 (게시글 집계 버전)를 반환합니다.
+
+        댓글 작성/수정/삭제 시 게시글의 stats_version이 올라가므로 기본 키 조회 한 번으로 충분합니다.
+        없거나 삭제된 게시글이면 None을 반환합니다.
+        """
+        return db.session.query(Post.stats_version)\
+            .filter(Post.id == post_id, Post.deleted_at == None)\
+            .scalar()
+
+    @staticmethod
+    def get_comments(post_id, page, per_page, fields=None):
         try:
             # 게시글 존재 여부 확인
             post = Post.query.get(post_id)
@@ -37,24 +51,19 @@ class CommentService:
             ).filter(
                 PostComment.post_id == post_id,
                 PostComment.parent_id.is_(None)  # 최상위 댓글만
+            ).options(
+                *comment_load_options(fields)
             ).order_by(PostComment.created_at.desc())
             
-            # SQL 쿼리 로깅
-            current_app.logger.debug(f"Generated SQL Query: {str(comments_query)}")
-            
-            # 페이지네이션 적용
-            pagination = comments_query.paginate(page=page, per_page=per_page, error_out=False)
-            
-            # 결과 포맷팅
-            comments = [
-                get_comment_data(comment, reply_count)
-                for comment, reply_count in pagination.items
-            ]
+            # 페이지네이션 적용 (현재 페이지 조회와 전체 개수 조회를 동시에 실행)
+            comments, total, pages = paginate_query(
+                comments_query, page, per_page, lambda rows: serialize_comment_rows(rows, fields)
+            )
             
             return {
                 'comments': comments,
-                'total': pagination.total,
-                'pages': pagination.pages,
+                'total': total,
+                'pages': pages,
                 'current_page': page,
                 'per_page': per_page
             }
@@ -84,7 +93,7 @@ class CommentService:
         return get_comment_data(comment, 0)  # reply_count는 필요 없으므로 0으로 전달
     
     @staticmethod
-    def get_replies(post_id, comment_id, page, per_page):
+    def get_replies(post_id, comment_id, page, per_page, fields=None):
         try:
             # 디버그 로깅 추가
             current_app.logger.debug(f"Starting get_replies for post_id: {post_id}, comment_id: {comment_id}")
@@ -114,21 +123,21 @@ class CommentService:
             # 대댓글 쿼리
             replies_query = PostComment.query.filter(
                 PostComment.parent_id == comment_id
+            ).options(
+                *comment_load_options(fields)
             ).order_by(PostComment.created_at.desc())
             
-            # 페이지네이션 적용
-            pagination = replies_query.paginate(page=page, per_page=per_page, error_out=False)
-            
-            # 결과 포맷팅
-            replies = [
-                get_comment_data(reply, 0)  # 대댓글에는 reply_count가 항상 0
-                for reply in pagination.items
-            ]
+            # 페이지네이션 적용 (현재 페이지 조회와 전체 개수 조회를 동시에 실행)
+            # 대댓글에는 reply_count가 항상 0
+            replies, total, pages = paginate_query(
+                replies_query, page, per_page,
+                lambda rows: serialize_comment_rows(((reply, 0) for reply in rows), fields)
+            )
 
             return {
                 'replies': replies,
-                'total': pagination.total,
-                'pages': pagination.pages,
+                'total': total,
+                'pages': pages,
                 'current_page': page,
                 'per_page': per_page
             }
@@ -177,6 +186,7 @@ class CommentService:
         )
         
         db.session.add(new_comment)
+        PostService.bump_stats_version(post_id)
         db.session.commit()
         
         # 대댓글 수 조회
@@ -206,6 +216,7 @@ class CommentService:
             raise ValueError('삭제된 댓글입니다')
         
         comment.content = content
+        PostService.bump_stats_version(post_id)
         db.session.commit()
         
         # 대댓글 수 조회
@@ -232,6 +243,7 @@ class CommentService:
             raise ValueError('이미 삭제된 댓글입니다')
         
         comment.deleted_at = datetime.utcnow()
+        PostService.bump_stats_version(post_id)
         db.session.commit()
 
     
@@ -2,8 +2,38 @@ from datetime import datetime
 from sqlalchemy import func, case, distinct, and_
 from src.models import db, Post, PostLike, PostComment, PostView
 from src.utils.formatters import get_post_data
+from src.services.post_service import PostService
+
+# 반응 상태 일괄 조회 시 한 번에 받을 수 있는 최대 게시글 수
+MAX_REACTION_LOOKUP_IDS = 300
 
 class LikeService:
+    @staticmethod
+    def get_reaction_statuses(user_id, post_ids):
+        """여러 게시글에 대한 사용자의 좋아요/싫어요 상태를 한 번에 조회합니다."""
+        if not isinstance(post_ids, list):
+            raise ValueError('post_ids는 배열이어야 합니다')
+
+        if len(post_ids) > MAX_REACTION_LOOKUP_IDS:
+            raise ValueError(f'post_ids는 최대 {MAX_REACTION_LOOKUP_IDS}개까지 조회할 수 있습니다')
+
+        if not all(isinstance(post_id, int) and not isinstance(post_id, bool) for post_id in post_ids):
+            raise ValueError('post_ids는 정수 배열이어야 합니다')
+
+        unique_post_ids = set(post_ids)
+        if not unique_post_ids:
+            return {}
+
+        # (user_id, post_id) 인덱스를 타는 단일 쿼리
+        rows = db.session.query(PostLike.post_id, PostLike.type)\
+            .filter(
+                PostLike.user_id == user_id,
+                PostLike.post_id.in_(unique_post_ids)
+            ).all()
+
+        # 반응이 없는 게시글은 응답에서 생략
+        return {str(post_id): like_type for post_id, like_type in rows}
+
     @staticmethod
     def _get_post_data(post_id, user_id):
         """게시글 데이터를 조회합니다."""
@@ -81,6 +111,7 @@ class LikeService:
                 type='like'
             )
             db.session.add(new_like)
+        PostService.bump_stats_version(post_id)
 
         try:
             db.session.commit()
@@ -112,6 +143,7 @@ class LikeService:
 
         try:
             db.session.delete(like)
+            PostService.bump_stats_version(post_id)
             db.session.commit()
             return LikeService._get_post_data(post_id, user.id)
         except Exception as e:
@@ -153,6 +185,7 @@ class LikeService:
                 type='dislike'
             )
             db.session.add(new_like)
+        PostService.bump_stats_version(post_id)
 
         try:
             db.session.commit()
@@ -184,6 +217,7 @@ class LikeService:
 
         try:
             db.session.delete(like)
+            PostService.bump_stats_version(post_id)
             db.session.commit()
             return LikeService._get_post_data(post_id, user.id)
         except Exception as e:
@@ -1,31 +1,40 @@
 from datetime import datetime
 from flask import current_app
-from sqlalchemy import func, case, distinct, and_, or_
-from src.models import (
-    db, Post, PostComment, PostLike, PostView,
-    School, College, Department, User
-)
+from sqlalchemy import func, case, distinct, and_, or_, update
+from src.models import db, Post, PostComment, PostLike, PostView, User
 from src.utils.formatters import (
     get_post_data, get_school_data, get_college_data, 
-    get_department_data
+    get_department_data, make_excerpt
 )
 from src.services.nickname_service import NicknameService
+from src.utils.reference_cache import get_reference_data
+from src.utils.pagination import paginate_query
+from src.utils.parallel import run_parallel
+from src.utils.serializers import (
+    serialize_post, serialize_post_rows, post_load_options, FEED_DEFAULT_FIELDS
+)
 
 class PostService:
     @staticmethod
-    def get_posts(page, per_page, current_user_school_id=None, current_user_id=None, **filters):
-        """게시글 목록을 조회합니다."""
+    def get_posts(page, per_page, current_user_school_id=None, current_user_id=None, fields=None, **filters):
+        """게시글 목록을 조회합니다. fields가 주어지면 해당 필드에 필요한 컬럼만 읽습니다.
+
+        기본 응답은 content 대신 미리보기(excerpt)를 포함합니다.
+        """
+        if fields is None:
+            fields = FEED_DEFAULT_FIELDS
         school_id = filters.get('school_id')
         college_id = filters.get('college_id')
         department_id = filters.get('department_id')
         category = filters.get('category')
         search = filters.get('search', '')
 
+        reference = get_reference_data()
+
         # 학교 ID가 지정되지 않았고 로그인하지 않은 경우 첫 번째 학교 선택
         if not school_id and not current_user_school_id:
-            default_school = School.query.first()
-            if default_school:
-                school_id = default_school.id
+            if reference.default_school:
+                school_id = reference.default_school.id
 
         # 게시물 쿼리 생성
         posts_query = db.session.query(
@@ -45,7 +54,8 @@ class PostService:
         ).outerjoin(PostView, Post.id == PostView.post_id)\
         .outerjoin(PostComment, Post.id == PostComment.post_id)\
         .outerjoin(PostLike, Post.id == PostLike.post_id)\
-        .filter(Post.deleted_at == None)
+        .filter(Post.deleted_at == None)\
+        .options(*post_load_options(fields))
 
         # 필터 적용
         if school_id:
@@ -73,23 +83,10 @@ class PostService:
         posts_query = posts_query.group_by(Post.id)\
         .order_by(Post.created_at.desc())
 
-        # 페이지네이션 적용
-        pagination = posts_query.paginate(page=page, per_page=per_page, error_out=False)
-
-        # 결과 포맷팅
-        posts = [
-            get_post_data(
-                post, 
-                view_count, 
-                comment_count, 
-                like_count, 
-                dislike_count,
-                bool(user_like_status),
-                bool(user_dislike_status)
-            )
-            for post, view_count, comment_count, like_count, dislike_count, user_like_status, user_dislike_status 
-            in pagination.items
-        ]
+        # 페이지네이션 적용 (현재 페이지 조회와 전체 개수 조회를 동시에 실행)
+        posts, total, pages = paginate_query(
+            posts_query, page, per_page, lambda rows: serialize_post_rows(rows, fields)
+        )
 
         # 현재 적용된 필터의 학교/단과대/학과 정보 가져오기
         current_school = None
@@ -97,20 +94,24 @@ class PostService:
         current_department = None
 
         if school_id:
-            current_school = School.query.get(school_id)
+            current_school = reference.schools.get(school_id)
         elif current_user_school_id:
-            current_school = School.query.get(current_user_school_id)
+            current_school = reference.schools.get(current_user_school_id)
 
         if college_id and current_school:
-            current_college = College.query.filter_by(id=college_id, school_id=current_school.id).first()
+            current_college = reference.colleges.get(college_id)
+            if current_college and current_college.school_id != current_school.id:
+                current_college = None
 
         if department_id and current_college:
-            current_department = Department.query.filter_by(id=department_id, college_id=current_college.id).first()
+            current_department = reference.departments.get(department_id)
+            if current_department and current_department.college_id != current_college.id:
+                current_department = None
 
         return {
             'posts': posts,
-            'total': pagination.total,
-            'pages': pagination.pages,
+            'total': total,
+            'pages': pages,
             'current_page': page,
             'per_page': per_page,
             'current_filters': {
@@ -122,58 +123,102 @@ class PostService:
             }
         }
 
+    @staticmethod
+    def bump_stats_version(post_id):
+        """게시글의 집계 버전을 올립니다. updated_at은 바꾸지 않으며 커밋은 호출하는 쪽에서 합니다."""
+        db.session.execute(
+            update(Post)
+            .where(Post.id == post_id)
+            .values(stats_version=Post.stats_version + 1, updated_at=Post.updated_at)
+            .execution_options(synchronize_session=False)
+        )
+
+    @staticmethod
+    def get_post_validator(post_id):
+        """게시글 상세 응답의 검증자 (게시글 updated_at, 집계 버전, 작성자 updated_at, 마지막 조회 ID)를 반환합니다.
+
+        집계 쿼리 없이 기본 키 조회와 (post_id, id) 인덱스의 MAX 조회로 계산합니다.
+        조회 기록은 posts 행을 바꾸지 않으므로 조회수 변화는 마지막 조회 ID로 반영합니다.
+        없거나 삭제된 게시글이면 None을 반환합니다.
+        """
+        last_view_id = db.session.query(func.max(PostView.id))\
+            .filter(PostView.post_id == Post.id)\
+            .scalar_subquery()
+        return db.session.query(Post.updated_at, Post.stats_version, User.updated_at, last_view_id)\
+            .join(User, Post.user_id == User.id)\
+            .filter(Post.id == post_id, Post.deleted_at == None)\
+            .first()
+
     @staticmethod
     def get_post(post_id, user_id=None, ip_address=None):
         """특정 게시글을 조회합니다."""
-        post_query = db.session.query(
-            Post,
-            func.count(distinct(PostView.id)).label('view_count'),
-            func.count(distinct(case(
-                (PostComment.parent_id == None, PostComment.id)
-            ))).label('comment_count'),
-            func.count(distinct(case((PostLike.type == 'like', PostLike.id)))).label('like_count'),
-            func.count(distinct(case((PostLike.type == 'dislike', PostLike.id)))).label('dislike_count'),
-            func.count(distinct(case(
-                (and_(PostLike.type == 'like', PostLike.user_id == user_id), PostLike.id)
-            ))).label('user_like_status'),
-            func.count(distinct(case(
-                (and_(PostLike.type == 'dislike', PostLike.user_id == user_id), PostLike.id)
-            ))).label('user_dislike_status')
-        ).outerjoin(PostView, Post.id == PostView.post_id)\
-        .outerjoin(PostComment, Post.id == PostComment.post_id)\
-        .outerjoin(PostLike, Post.id == PostLike.post_id)\
-        .filter(Post.id == post_id)\
-        .group_by(Post.id)\
-        .first()
+        return PostService.get_post_with_validator(post_id, user_id, ip_address)[0]
+
+    @staticmethod
+    def get_post_with_validator(post_id, user_id=None, ip_address=None):
+        """특정 게시글과 응답을 만든 시점의 검증자를 함께 반환합니다. (get_post_validator와 같은 형태)"""
+        def load_post():
+            return db.session.query(
+                Post,
+                func.count(distinct(PostView.id)).label('view_count'),
+                func.max(PostView.id).label('last_view_id'),
+                func.count(distinct(case(
+                    (PostComment.parent_id == None, PostComment.id)
+                ))).label('comment_count'),
+                func.count(distinct(case((PostLike.type == 'like', PostLike.id)))).label('like_count'),
+                func.count(distinct(case((PostLike.type == 'dislike', PostLike.id)))).label('dislike_count'),
+                func.count(distinct(case(
+                    (and_(PostLike.type == 'like', PostLike.user_id == user_id), PostLike.id)
+                ))).label('user_like_status'),
+                func.count(distinct(case(
+                    (and_(PostLike.type == 'dislike', PostLike.user_id == user_id), PostLike.id)
+                ))).label('user_dislike_status')
+            ).outerjoin(PostView, Post.id == PostView.post_id)\
+            .outerjoin(PostComment, Post.id == PostComment.post_id)\
+            .outerjoin(PostLike, Post.id == PostLike.post_id)\
+            .filter(Post.id == post_id)\
+            .group_by(Post.id)\
+            .first()
+
+        def load_viewed():
+            return db.session.query(PostView.id).filter(
+                PostView.post_id == post_id,
+                or_(
+                    and_(PostView.user_id == user_id, PostView.user_id != None),
+                    and_(PostView.ip_address == ip_address, PostView.user_id == None)
+                )
+            ).first() is not None
+
+        # 집계 조회와 조회 기록 확인은 서로 독립적이므로 동시에 실행
+        post_query, viewed = run_parallel(load_post, load_viewed)
 
         if not post_query:
             raise ValueError('존재하지 않는 게시글입니다')
 
-        post, view_count, comment_count, like_count, dislike_count, user_like_status, user_dislike_status = post_query
+        (post, view_count, last_view_id, comment_count, like_count, dislike_count,
+         user_like_status, user_dislike_status) = post_query
 
         if post.deleted_at:
             raise ValueError('삭제된 게시글입니다')
 
-        # 조회수 증가 로직
-        existing_view = PostView.query.filter(
-            PostView.post_id == post_id,
-            or_(
-                and_(PostView.user_id == user_id, PostView.user_id != None),
-                and_(PostView.ip_address == ip_address, PostView.user_id == None)
-            )
-        ).first()
+        # 집계와 같은 시점의 값으로 검증자를 만들어야 응답보다 새로운 ETag가 나가지 않음
+        updated_at, stats_version, author_updated_at = post.updated_at, post.stats_version, post.user.updated_at
 
-        if not existing_view:
+        # 조회수 증가 로직
+        if not viewed:
             new_view = PostView(
                 post_id=post_id,
                 user_id=user_id,
                 ip_address=ip_address if not user_id else None
             )
             db.session.add(new_view)
+            # 조회마다 posts 행을 갱신하면 인기 게시글에서 잠금 경합이 생기므로 집계 버전은 올리지 않음.
+            # 검증자의 마지막 조회 ID는 집계 시점 값 그대로 두어 ETag가 응답보다 새로워지지 않게 함
+            # (그 사이 다른 조회가 있었을 수 있으므로 다음 요청은 한 번 200으로 응답)
             db.session.commit()
             view_count += 1
 
-        return get_post_data(
+        data = serialize_post(
             post, 
             view_count, 
             comment_count, 
@@ -182,6 +227,7 @@ class PostService:
             bool(user_like_status),
             bool(user_dislike_status)
         )
+        return data, (updated_at, stats_version, author_updated_at, last_view_id)
 
     @staticmethod
     def create_post(user, title, content, category):
@@ -194,6 +240,7 @@ class PostService:
         new_post = Post(
             title=title,
             content=content,
+            excerpt=make_excerpt(content),
             category=category,
             user_id=user.id,
             nickname=anonymous_nickname,
@@ -230,12 +277,17 @@ class PostService:
             if field in data:
                 setattr(post, field, data[field])
 
+        # 본문이 바뀌면 미리보기도 갱신
+        if 'content' in data:
+            post.excerpt = make_excerpt(data['content'])
+
         try:
             db.session.commit()
 
             post_data = db.session.query(
                 Post,
                 func.count(distinct(PostView.id)).label('view_count'),
+                func.max(PostView.id).label('last_view_id'),
                 func.count(distinct(case(
                     (PostComment.parent_id == None, PostComment.id)
                 ))).label('comment_count'),
@@ -1,38 +1,71 @@
-from src.models import db, Country, School, College, Department
-from sqlalchemy import or_
+import json
 from src.utils.formatters import (
-    get_country_data, get_school_data, 
+    get_country_data, get_school_data,
     get_college_data, get_department_data
 )
+from src.utils.pagination import paginate_items
+from src.utils.reference_cache import get_reference_data
+from src.utils.http_cache import PrecompressedBody
 
 class SchoolService:
+    @staticmethod
+    def _build_hierarchy_snapshot(reference, country_id):
+        """국가의 학교/단과대/학과 전체 트리를 직렬화하고 압축해 둡니다."""
+        tree = {
+            'country': get_country_data(reference.countries[country_id]),
+            'schools': [
+                {
+                    **get_school_data(school),
+                    'colleges': [
+                        {
+                            **get_college_data(college),
+                            'departments': [
+                                get_department_data(department)
+                                for department in reference.get_departments(college.id)
+                            ]
+                        }
+                        for college in reference.get_colleges(school.id)
+                    ]
+                }
+                for school in reference.get_schools(country_id)
+            ]
+        }
+        body = json.dumps(tree, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        return PrecompressedBody(body)
+
+    @staticmethod
+    def get_hierarchy_snapshot(country_id):
+        """국가의 전체 계층 스냅샷을 반환합니다. 참조 데이터가 갱신될 때까지 재사용됩니다."""
+        reference = get_reference_data()
+
+        if country_id not in reference.countries:
+            raise ValueError('존재하지 않는 국가입니다')
+
+        return reference.get_snapshot(country_id, SchoolService._build_hierarchy_snapshot)
+
     @staticmethod
     def get_countries(page, per_page, search=''):
-        # 국가 쿼리 생성
-        countries_query = Country.query
-        
+        reference = get_reference_data()
+
         # 검색어가 있는 경우 필터 적용
+        countries = reference.sorted_countries
         if search:
-            countries_query = countries_query.filter(
-                or_(
-                    Country.name.ilike(f'%{search}%'),
-                    Country.code.ilike(f'%{search}%')
-                )
-            )
-        
-        # 정렬 적용
-        countries_query = countries_query.order_by(Country.name.asc())
-        
+            term = search.lower()
+            countries = [
+                country for country in countries
+                if term in country.name.lower() or term in country.code.lower()
+            ]
+
         # 페이지네이션 적용
-        pagination = countries_query.paginate(page=page, per_page=per_page, error_out=False)
-        
+        items, total, pages = paginate_items(countries, page, per_page)
+
         # 결과 포맷팅
-        countries = [get_country_data(country) for country in pagination.items]
-        
+        countries = [get_country_data(country) for country in items]
+
         return {
             'countries': countries,
-            'total': pagination.total,
-            'pages': pagination.pages,
+            'total': total,
+            'pages': pages,
             'current_page': page,
             'per_page': per_page,
             'search': search
@@ -40,26 +73,25 @@ class SchoolService:
 
     @staticmethod
     def get_schools_by_country(country_id, page, per_page, search=''):
+        reference = get_reference_data()
+
         # 국가 존재 여부 확인
-        country = Country.query.get(country_id)
-        if not country:
+        if country_id not in reference.countries:
             raise ValueError('존재하지 않는 국가입니다')
-        
-        # 학교 쿼리 생성
-        schools_query = School.query.filter_by(country_id=country_id)
-        
+
+        # 검색어가 있으면 자동완성 인덱스 사용 (초성 검색, 접두사 일치 우선)
         if search:
-            schools_query = schools_query.filter(School.name.ilike(f'%{search}%'))
-        
-        schools_query = schools_query.order_by(School.name.asc())
-        pagination = schools_query.paginate(page=page, per_page=per_page, error_out=False)
-        
-        schools = [get_school_data(school) for school in pagination.items]
-        
+            schools = reference.search_schools(country_id, search)
+        else:
+            schools = reference.get_schools(country_id)
+        items, total, pages = paginate_items(schools, page, per_page)
+
+        schools = [get_school_data(school) for school in items]
+
         return {
             'schools': schools,
-            'total': pagination.total,
-            'pages': pagination.pages,
+            'total': total,
+            'pages': pages,
             'current_page': page,
             'per_page': per_page,
             'search': search
@@ -67,33 +99,31 @@ class SchoolService:
 
     @staticmethod
     def get_colleges(country_id, school_id, page, per_page, search=''):
+        reference = get_reference_data()
+
         # 국가 존재 여부 확인
-        country = Country.query.get(country_id)
-        if not country:
+        if country_id not in reference.countries:
             raise ValueError('존재하지 않는 국가입니다')
-        
+
         # 학교 존재 여부와 국가 관계 확인
-        school = School.query.get(school_id)
+        school = reference.schools.get(school_id)
         if not school:
             raise ValueError('존재하지 않는 학교입니다')
         if school.country_id != country_id:
             raise ValueError('해당 국가의 학교가 아닙니다')
-        
-        # 단과대학 쿼리 생성
-        colleges_query = College.query.filter_by(school_id=school_id)
-        
+
         if search:
-            colleges_query = colleges_query.filter(College.name.ilike(f'%{search}%'))
-        
-        colleges_query = colleges_query.order_by(College.name.asc())
-        pagination = colleges_query.paginate(page=page, per_page=per_page, error_out=False)
-        
-        colleges = [get_college_data(college) for college in pagination.items]
-        
+            colleges = reference.search_colleges(school_id, search)
+        else:
+            colleges = reference.get_colleges(school_id)
+        items, total, pages = paginate_items(colleges, page, per_page)
+
+        colleges = [get_college_data(college) for college in items]
+
         return {
             'colleges': colleges,
-            'total': pagination.total,
-            'pages': pagination.pages,
+            'total': total,
+            'pages': pages,
             'current_page': page,
             'per_page': per_page,
             'search': search
@@ -101,40 +131,38 @@ class SchoolService:
 
     @staticmethod
     def get_departments(country_id, school_id, college_id, page, per_page, search=''):
+        reference = get_reference_data()
+
         # 국가 존재 여부 확인
-        country = Country.query.get(country_id)
-        if not country:
+        if country_id not in reference.countries:
             raise ValueError('존재하지 않는 국가입니다')
-        
+
         # 학교 존재 여부와 국가 관계 확인
-        school = School.query.get(school_id)
+        school = reference.schools.get(school_id)
         if not school:
             raise ValueError('존재하지 않는 학교입니다')
         if school.country_id != country_id:
             raise ValueError('해당 국가의 학교가 아닙니다')
-        
+
         # 단과대학 존재 여부와 학교 관계 확인
-        college = College.query.get(college_id)
+        college = reference.colleges.get(college_id)
         if not college:
             raise ValueError('존재하지 않는 단과대학입니다')
         if college.school_id != school_id:
             raise ValueError('해당 학교의 단과대학이 아닙니다')
-        
-        # 학과 쿼리 생성
-        departments_query = Department.query.filter_by(college_id=college_id)
-        
+
         if search:
-            departments_query = departments_query.filter(Department.name.ilike(f'%{search}%'))
-        
-        departments_query = departments_query.order_by(Department.name.asc())
-        pagination = departments_query.paginate(page=page, per_page=per_page, error_out=False)
-        
-        departments = [get_department_data(department) for department in pagination.items]
-        
+            departments = reference.search_departments(college_id, search)
+        else:
+            departments = reference.get_departments(college_id)
+        items, total, pages = paginate_items(departments, page, per_page)
+
+        departments = [get_department_data(department) for department in items]
+
         return {
             'departments': departments,
-            'total': pagination.total,
-            'pages': pagination.pages,
+            'total': total,
+            'pages': pages,
             'current_page': page,
             'per_page': per_page,
             'search': search
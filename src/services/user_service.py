@@ -1,46 +1,33 @@
 from flask import current_app
-import jwt
 from src.models import User, Post, PostComment, PostView, PostLike
 from datetime import datetime
-from werkzeug.security import generate_password_hash, check_password_hash
 from src.models import db
 from sqlalchemy import func, case, distinct, and_
-from src.utils.formatters import get_post_data, get_comment_data
+from src.utils.serializers import (
+    serialize_post_rows, serialize_comment_rows,
+    post_load_options, comment_load_options
+)
+from src.utils.user_cache import invalidate_user
+from src.utils.auth import AuthContext
+from src.utils.password import hash_password, verify_password
+from src.utils.revocation import revocation_list, revoke_user_tokens
 
 class UserService:
     @staticmethod
     def get_user_from_token(token):
         """토큰으로부터 사용자 정보를 조회합니다."""
-        try:
-            token = token.split(" ")[1]  # "Bearer " 제거
-            data = jwt.decode(token, current_app.config['SECRET_KEY'], algorithms=["HS256"])
-            user = User.query.get(data['user_id'])
-            if user and not user.is_deleted:
-                return user
-            return None
-        except:
-            return None
+        return AuthContext.from_headers({'Authorization': token}).active_user
 
     @staticmethod
     def get_user_school_id(headers):
         """요청 헤더에서 사용자의 학교 ID를 조회합니다."""
-        if 'Authorization' not in headers:
-            return None
-            
-        user = UserService.get_user_from_token(headers['Authorization'])
+        user = AuthContext.from_headers(headers).active_user
         return user.school_id if user else None
 
     @staticmethod
     def get_user_id(headers):
         """Authorization 헤더에서 사용자 ID를 추출합니다."""
-        try:
-            if 'Authorization' in headers:
-                token = headers['Authorization'].split(" ")[1]
-                data = jwt.decode(token, current_app.config['SECRET_KEY'], algorithms=["HS256"])
-                return data['user_id']
-        except:
-            pass
-        return None
+        return AuthContext.from_headers(headers).user_id
 
     @staticmethod
     def validate_password(password):
@@ -72,22 +59,27 @@ class UserService:
         if user.is_deleted:
             raise ValueError('삭제된 사용자입니다')
             
-        if not check_password_hash(user.password, current_password):
+        if not verify_password(user.password, current_password):
             raise ValueError('현재 비밀번호가 일치하지 않습니다')
             
         # 새 비밀번호 유효성 검사
         UserService.validate_password(new_password)
         
-        # 현재 비밀번호와 동일한지 확인
-        if check_password_hash(user.password, new_password):
+        # 현재 비밀번호와 동일한지 확인 (이미 검증된 현재 비밀번호와 비교하므로 해시 불필요)
+        if new_password == current_password:
             raise ValueError('새 비밀번호는 현재 비밀번호와 달라야 합니다')
             
         # 비밀번호 변경
-        user.password = generate_password_hash(new_password)
+        user.password = hash_password(new_password)
         user.updated_at = datetime.utcnow()
+
+        # 기존에 발급된 모든 토큰 폐기
+        revocation = revoke_user_tokens(user_id)
         
         try:
             db.session.commit()
+            invalidate_user(user_id)
+            revocation_list.apply(revocation)
             current_app.logger.info(f'User {user_id} changed password successfully')
         except Exception as e:
             db.session.rollback()
@@ -109,7 +101,10 @@ class UserService:
             # 이메일 앞에 "deleted:" 접두어 추가
             user.email = f"deleted:{user.email}"
             user.deleted_at = datetime.utcnow()
+            revocation = revoke_user_tokens(user_id)
             db.session.commit()
+            invalidate_user(user_id)
+            revocation_list.apply(revocation)
         except Exception as e:
             db.session.rollback()
             raise e
@@ -149,7 +144,7 @@ class UserService:
         return comments
 
     @staticmethod
-    def get_my_posts(user_id, page, per_page):
+    def get_my_posts(user_id, page, per_page, fields=None):
         """사용자가 작성한 게시글 목록을 조회합니다."""
         # 사용자 존재 여부 확인
         user = User.query.get(user_id)
@@ -179,6 +174,7 @@ class UserService:
         .outerjoin(PostLike, Post.id == PostLike.post_id)\
         .filter(Post.user_id == user_id)\
         .filter(Post.deleted_at == None)\
+        .options(*post_load_options(fields))\
         .group_by(Post.id)\
         .order_by(Post.created_at.desc())
         
@@ -186,19 +182,7 @@ class UserService:
         pagination = posts_query.paginate(page=page, per_page=per_page, error_out=False)
         
         # 결과 포맷팅
-        posts = [
-            get_post_data(
-                post, 
-                view_count, 
-                comment_count, 
-                like_count, 
-                dislike_count,
-                bool(user_like_status),
-                bool(user_dislike_status)
-            )
-            for post, view_count, comment_count, like_count, dislike_count, user_like_status, user_dislike_status 
-            in pagination.items
-        ]
+        posts = serialize_post_rows(pagination.items, fields)
         
         return {
             'posts': posts,
@@ -209,7 +193,7 @@ class UserService:
         }
 
     @staticmethod
-    def get_my_comments(user_id, page, per_page):
+    def get_my_comments(user_id, page, per_page, fields=None):
         """사용자가 작성한 댓글 목록을 조회합니다."""
         user = User.query.get(user_id)
         
@@ -227,6 +211,8 @@ class UserService:
         .filter(
             PostComment.user_id == user_id,
             PostComment.deleted_at == None  # 삭제되지 않은 댓글만 조회
+        ).options(
+            *comment_load_options(fields)
         ).group_by(
             PostComment.id
         ).order_by(PostComment.created_at.desc())
@@ -235,10 +221,7 @@ class UserService:
         pagination = comments_query.paginate(page=page, per_page=per_page, error_out=False)
         
         # 결과 포맷팅
-        comments = [
-            get_comment_data(comment, reply_count)
-            for comment, reply_count in pagination.items
-        ]
+        comments = serialize_comment_rows(pagination.items, fields)
         
         return {
             'comments': comments,
@@ -1,42 +1,137 @@
 from functools import wraps
-from flask import request, jsonify
+from flask import request, jsonify, g
 import jwt
-from src.models import User
+from src.utils.user_cache import get_auth_user
+from src.utils.revocation import revocation_list
 
 from src.config.env import (
     SECRET_KEY
 )
 
 
+class AuthContext:
+    """요청 단위 인증 정보입니다.
+
+    토큰은 요청당 한 번만 디코딩하고, 사용자는 처음 필요할 때 한 번만 조회합니다.
+    """
+
+    def __init__(self, token_data=None, error=None):
+        self.token_data = token_data
+        self.error = error
+        self._user = None
+        self._user_loaded = False
+
+    @classmethod
+    def from_headers(cls, headers):
+        if 'Authorization' not in headers:
+            return cls(error='토큰이 필요합니다')
+
+        try:
+            token = headers['Authorization'].split(" ")[1]
+        except IndexError:
+            return cls(error='유효하지 않은 토큰 형식입니다')
+
+        if not token:
+            return cls(error='토큰이 필요합니다')
+
+        try:
+            data = jwt.decode(token, SECRET_KEY, algorithms=["HS256"])
+        except jwt.InvalidTokenError:
+            return cls(error='유효하지 않은 토큰입니다')
+
+        # 로그아웃/비밀번호 변경 등으로 폐기된 토큰 (메모리 사본으로 확인)
+        if revocation_list.is_revoked(data):
+            return cls(error='폐기된 토큰입니다')
+
+        return cls(token_data=data)
+
+    @property
+    def user_id(self):
+        return self.token_data.get('user_id') if self.token_data else None
+
+    @property
+    def token_version(self):
+        if not self.token_data:
+            return None
+        return self.token_data.get('ver', 1)
+
+    @property
+    def has_hierarchy_claims(self):
+        """토큰에 학교/단과대/학과 클레임이 포함되어 있는지 확인합니다."""
+        return (self.token_version or 0) >= 2
+
+    @property
+    def school_id(self):
+        """사용자의 학교 ID를 반환합니다. 클레임이 있으면 사용자를 조회하지 않습니다."""
+        if self.has_hierarchy_claims:
+            return self.token_data.get('school_id')
+        user = self.active_user
+        return user.school_id if user else None
+
+    @property
+    def user(self):
+        """토큰의 사용자를 반환합니다. 존재하지 않으면 None을 반환합니다.
+
+        토큰의 버전 스탬프보다 오래된 캐시는 무시하고 DB에서 다시 불러옵니다.
+        """
+        if not self._user_loaded:
+            self._user_loaded = True
+            if self.user_id is not None:
+                min_version = self.token_data.get('uv') if self.has_hierarchy_claims else None
+                self._user = get_auth_user(self.user_id, min_version=min_version)
+        return self._user
+
+    @property
+    def active_user(self):
+        """삭제되지 않은 사용자만 반환합니다."""
+        user = self.user
+        return user if user and not user.is_deleted else None
+
+
+def get_auth_context():
+    """현재 요청의 인증 정보를 반환합니다. 처음 호출될 때 토큰을 디코딩합니다."""
+    if 'auth' not in g:
+        g.auth = AuthContext.from_headers(request.headers)
+    return g.auth
+
+
+def get_optional_user():
+    """로그인한 경우 사용자를, 아니면 None을 반환합니다."""
+    return get_auth_context().active_user
+
+
+def get_optional_school_id():
+    """로그인한 경우 사용자의 학교 ID를 반환합니다. 서명된 클레임을 신뢰합니다."""
+    return get_auth_context().school_id
+
+
+def get_optional_user_id():
+    """토큰의 사용자 ID를 반환합니다. 사용자 조회는 하지 않습니다."""
+    return get_auth_context().user_id
+
+
 # JWT 토큰 검증을 위한 데코레이터
 def token_required(f):
     @wraps(f)
     def decorated(*args, **kwargs):
-        token = None
-        if 'Authorization' in request.headers:
-            auth_header = request.headers['Authorization']
-            try:
-                token = auth_header.split(" ")[1]
-            except IndexError:
-                return jsonify({'error': '유효하지 않은 토큰 형식입니다'}), 401
+        auth = get_auth_context()
 
-        if not token:
-            return jsonify({'error': '토큰이 필요합니다'}), 401
+        if auth.error:
+            return jsonify({'error': auth.error}), 401
 
         try:
-            data = jwt.decode(token, SECRET_KEY, algorithms=["HS256"])
-            current_user = User.query.get(data['user_id'])
-            
+            current_user = auth.user
+
             # 유저가 존재하지 않거나 삭제된 경우 확인
             if not current_user:
                 return jsonify({'error': '존재하지 않는 사용자입니다'}), 401
-            
+
             if current_user.is_deleted:
                 return jsonify({'error': '삭제된 사용자입니다'}), 401
-                
+
         except:
             return jsonify({'error': '유효하지 않은 토큰입니다'}), 401
 
         return f(current_user, *args, **kwargs)
 
-    return decorated
\ No newline at end of file
+    return decorated
@@ -0,0 +1,75 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class TTLCache:
+    """최대 크기와 만료 시간이 있는 스레드 안전 LRU 캐시입니다."""
+
+    def __init__(self, maxsize=1024, ttl=60):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, default=None):
+        """키에 해당하는 값을 반환합니다. 없거나 만료된 경우 default를 반환합니다."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+
+            value, expires_at = entry
+            if expires_at <= now:
+                del self._data[key]
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value):
+        """값을 저장합니다. 최대 크기를 넘으면 가장 오래 사용되지 않은 항목을 제거합니다."""
+        expires_at = time.monotonic() + self.ttl
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        """키를 캐시에서 제거합니다."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        """모든 항목과 통계를 초기화합니다."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self):
+        """캐시 적중률 통계를 반환합니다."""
+        with self._lock:
+            return {
+                'size': len(self._data),
+                'maxsize': self.maxsize,
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hit_rate
+            }
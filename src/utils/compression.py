@@ -0,0 +1,112 @@
+import gzip
+from flask import request
+
+from src.config.env import (
+    COMPRESSION_ENABLED,
+    COMPRESSION_MIN_SIZE,
+    COMPRESSION_LEVEL,
+    COMPRESSION_BROTLI_QUALITY
+)
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - 선택적 의존성
+    brotli = None
+
+# 압축할 응답 타입
+COMPRESSIBLE_MIMETYPES = frozenset([
+    'application/json',
+    'text/html',
+    'text/plain',
+    'text/css',
+    'application/javascript'
+])
+
+# 서버가 선호하는 순서
+SUPPORTED_ENCODINGS = ('br', 'gzip') if brotli is not None else ('gzip',)
+
+
+def accepts_encoding(accept_encoding, encoding):
+    """Accept-Encoding 헤더가 주어진 인코딩을 허용하는지 확인합니다."""
+    for value in (accept_encoding or '').split(','):
+        coding, *params = [part.strip() for part in value.split(';')]
+        if coding.lower() not in (encoding, '*'):
+            continue
+        for param in params:
+            name, _, quality = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    return float(quality) > 0
+                except ValueError:
+                    return False
+        return True
+    return False
+
+
+def choose_encoding(accept_encoding):
+    """클라이언트가 허용하는 인코딩 중 서버가 선호하는 것을 반환합니다. 없으면 None을 반환합니다."""
+    if not accept_encoding:
+        return None
+    for encoding in SUPPORTED_ENCODINGS:
+        if accepts_encoding(accept_encoding, encoding):
+            return encoding
+    return None
+
+
+def compress(body, encoding):
+    """설정된 압축 수준으로 본문을 압축합니다."""
+    if encoding == 'br':
+        return brotli.compress(body, quality=COMPRESSION_BROTLI_QUALITY)
+    if encoding == 'gzip':
+        return gzip.compress(body, compresslevel=COMPRESSION_LEVEL, mtime=0)
+    raise ValueError(f'지원하지 않는 인코딩입니다: {encoding}')
+
+
+def _add_vary(response):
+    vary = {value.strip().lower() for value in response.headers.get('Vary', '').split(',') if value.strip()}
+    if 'accept-encoding' not in vary:
+        response.headers.add('Vary', 'Accept-Encoding')
+
+
+def compress_response(response):
+    """Accept-Encoding에 맞춰 응답을 압축합니다. (after_request 훅)"""
+    if (
+        response.status_code < 200
+        or response.status_code >= 300
+        or response.status_code == 204
+        or response.direct_passthrough
+        or response.is_streamed
+        or 'Content-Encoding' in response.headers
+        or response.mimetype not in COMPRESSIBLE_MIMETYPES
+    ):
+        return response
+
+    # 크기와 상관없이 인코딩에 따라 응답이 달라질 수 있음을 캐시에 알림
+    _add_vary(response)
+
+    if response.content_length is not None and response.content_length < COMPRESSION_MIN_SIZE:
+        return response
+
+    encoding = choose_encoding(request.headers.get('Accept-Encoding'))
+    if encoding is None:
+        return response
+
+    body = response.get_data()
+    if len(body) < COMPRESSION_MIN_SIZE:
+        return response
+
+    response.set_data(compress(body, encoding))
+    response.headers['Content-Encoding'] = encoding
+
+    # 강한 ETag는 표현(인코딩)마다 달라야 함
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(f'{etag}-{encoding}')
+
+    return response
+
+
+def init_compression(app):
+    """응답 압축을 등록합니다."""
+    if COMPRESSION_ENABLED:
+        app.after_request(compress_response)
@@ -0,0 +1,77 @@
+"""커넥션 풀 설정과 체크아웃 대기 시간 측정
+
+SQLAlchemy 풀 클래스를 감싸 pool.connect()에 걸린 시간(대기 + 새 연결 생성 + pre-ping)을 기록합니다.
+"""
+import bisect
+import threading
+import time
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import NullPool, QueuePool
+
+# 체크아웃 시간 히스토그램 구간 (초)
+CHECKOUT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class PoolMetrics:
+    """커넥션 체크아웃 시간 통계입니다."""
+
+    def __init__(self, buckets=CHECKOUT_BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self.clear()
+
+    def record(self, seconds, timed_out=False):
+        index = bisect.bisect_left(self.buckets, seconds)
+        with self._lock:
+            self.checkouts += 1
+            self.wait_total += seconds
+            if seconds > self.wait_max:
+                self.wait_max = seconds
+            self.bucket_counts[index] += 1
+            if timed_out:
+                self.timeouts += 1
+
+    def clear(self):
+        """모든 통계를 초기화합니다."""
+        with self._lock:
+            self.checkouts = 0
+            self.timeouts = 0
+            self.wait_total = 0.0
+            self.wait_max = 0.0
+            # 마지막 칸은 가장 큰 구간을 넘는 값 (+Inf)
+            self.bucket_counts = [0] * (len(self.buckets) + 1)
+
+    def stats(self):
+        """체크아웃 횟수, 타임아웃 수, 대기 시간 합계/평균/최대, 구간별 횟수를 반환합니다."""
+        with self._lock:
+            return {
+                'checkouts': self.checkouts,
+                'timeouts': self.timeouts,
+                'wait_total': self.wait_total,
+                'wait_avg': self.wait_total / self.checkouts if self.checkouts else 0.0,
+                'wait_max': self.wait_max,
+                'buckets': dict(zip(self.buckets + (float('inf'),), self.bucket_counts))
+            }
+
+
+pool_metrics = PoolMetrics()
+
+
+class _TimedCheckoutMixin:
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except PoolTimeoutError:
+            pool_metrics.record(time.perf_counter() - started, timed_out=True)
+            raise
+        pool_metrics.record(time.perf_counter() - started)
+        return connection
+
+
+class TimedQueuePool(_TimedCheckoutMixin, QueuePool):
+    """체크아웃 시간을 기록하는 QueuePool입니다."""
+
+
+class TimedNullPool(_TimedCheckoutMixin, NullPool):
+    """체크아웃(=새 연결 생성) 시간을 기록하는 NullPool입니다."""
@@ -1,5 +1,27 @@
 from datetime import datetime
 
+# 게시글 미리보기 최대 길이와 줄 수
+EXCERPT_MAX_LENGTH = 120
+EXCERPT_MAX_LINES = 2
+
+def make_excerpt(content, max_length=EXCERPT_MAX_LENGTH, max_lines=EXCERPT_MAX_LINES):
+    """게시글 본문의 앞 몇 줄을 한 줄 미리보기로 만듭니다."""
+    if not content:
+        return ''
+
+    lines = []
+    for line in content.splitlines():
+        line = ' '.join(line.split())
+        if line:
+            lines.append(line)
+        if len(lines) >= max_lines:
+            break
+
+    excerpt = ' '.join(lines)
+    if len(excerpt) > max_length:
+        excerpt = excerpt[:max_length - 1].rstrip() + '…'
+    return excerpt
+
 def get_country_data(country):
     return {
         'id': country.id,
@@ -0,0 +1,78 @@
+import hashlib
+from flask import Response
+from src.utils.compression import SUPPORTED_ENCODINGS, choose_encoding, compress
+
+
+def make_etag(body):
+    """본문 바이트로부터 강한 ETag 값을 만듭니다. (따옴표 포함)"""
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def make_weak_etag(*parts):
+    """updated_at, 버전 번호 등 검증자 값으로 약한 ETag를 만듭니다.
+
+    본문을 만들지 않고도 계산할 수 있으므로, 조건부 요청에서 전체 조회를 건너뛸 수 있습니다.
+    """
+    return 'W/' + make_etag(':'.join(str(part) for part in parts).encode('utf-8'))
+
+
+def etag_matches(if_none_match, etag):
+    """If-None-Match 헤더 값에 ETag가 포함되어 있는지 확인합니다."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    candidates = [value.strip() for value in if_none_match.split(',')]
+    # 약한 비교 (W/ 접두사 무시)
+    etag = etag.removeprefix('W/')
+    return any(candidate.removeprefix('W/') == etag for candidate in candidates)
+
+
+def not_modified(etag, headers=None):
+    """본문 없는 304 응답을 만듭니다."""
+    response = Response(status=304)
+    response.headers['ETag'] = etag
+    for key, value in (headers or {}).items():
+        response.headers[key] = value
+    return response
+
+
+class PrecompressedBody:
+    """직렬화와 압축을 미리 끝낸 JSON 응답 본문입니다.
+
+    지원하는 모든 인코딩으로 한 번만 압축해 두므로, 요청 시에는 조건부 요청 확인과
+    인코딩 선택만 하고 직렬화나 압축 비용이 없습니다.
+    """
+
+    __slots__ = ('body', 'etag', 'variants')
+
+    def __init__(self, body):
+        self.body = body
+        self.etag = make_etag(body)
+        # 인코딩이 다르면 표현이 다르므로 강한 ETag도 구분
+        self.variants = {
+            encoding: (compress(body, encoding), self.etag[:-1] + f'-{encoding}"')
+            for encoding in SUPPORTED_ENCODINGS
+        }
+
+    def make_response(self, request, status=200, headers=None):
+        """요청의 If-None-Match와 Accept-Encoding에 맞는 응답을 만듭니다."""
+        encoding = choose_encoding(request.headers.get('Accept-Encoding'))
+        body, etag = self.variants[encoding] if encoding else (self.body, self.etag)
+
+        response_headers = {'Vary': 'Accept-Encoding'}
+        response_headers.update(headers or {})
+
+        if_none_match = request.headers.get('If-None-Match')
+        if etag_matches(if_none_match, self.etag) or any(
+            etag_matches(if_none_match, variant_etag) for _, variant_etag in self.variants.values()
+        ):
+            return not_modified(etag, response_headers)
+
+        response = Response(body, status=status, mimetype='application/json')
+        if encoding:
+            response.headers['Content-Encoding'] = encoding
+        response.headers['ETag'] = etag
+        for key, value in response_headers.items():
+            response.headers[key] = value
+        return response
@@ -0,0 +1,23 @@
+import json
+import logging
+import threading
+
+
+class JsonlWriter:
+    """레코드를 한 줄에 하나씩 JSON으로 파일에 추가합니다. 경로가 '-'이면 로거로 내보냅니다. (Lambda 등)"""
+
+    def __init__(self, path, logger_name):
+        self.path = path
+        self.logger = logging.getLogger(logger_name)
+        self._lock = threading.Lock()
+        self._file = None
+
+    def write(self, record):
+        line = json.dumps(record, ensure_ascii=False, separators=(',', ':'), default=str)
+        if self.path == '-':
+            self.logger.info(line)
+            return
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, 'a', encoding='utf-8', buffering=1)
+            self._file.write(line + '\n')
@@ -0,0 +1,281 @@
+"""프로세스 내 런타임 지표와 /metrics 엔드포인트 (Prometheus 텍스트 형식)
+
+엔드포인트별 응답 시간 히스토그램, 상태 코드별 요청 수, DB 시간/쿼리 수를 기록하고
+조회 시점에 캐시 적중률과 커넥션 풀 체크아웃 통계를 함께 내보냅니다.
+
+요청마다 잠금을 잡지 않도록 스레드마다 자기 카운터(_Shard)에만 쓰고, /metrics 요청 때 모든
+스레드의 카운터를 합칩니다. 잠금은 스레드가 처음 기록할 때 한 번과 조회할 때만 사용합니다.
+끝난 스레드의 카운터는 그때 공용 합계로 옮기므로 요청마다 스레드를 만들어도 목록이 늘지 않습니다.
+
+/metrics는 METRICS_TOKEN을 지정해야 등록되며 'Authorization: Bearer <토큰>'으로 요청합니다.
+가장 느린 SQL 문장은 같은 토큰으로 /debug/sql에서 확인합니다. (src/utils/sql_metrics.py)
+"""
+import bisect
+import hmac
+import threading
+import time
+from flask import Response, g, request
+
+from src.config.env import (
+    METRICS_ENABLED,
+    METRICS_TOKEN
+)
+
+# 응답 시간 히스토그램 구간 (초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+class _Shard:
+    """한 스레드가 기록하는 카운터입니다. 해당 스레드만 씁니다."""
+    __slots__ = ('latency', 'statuses', 'db')
+
+    def __init__(self):
+        # (endpoint, method) → [구간별 횟수..., +Inf 횟수, 합계, 횟수]
+        self.latency = {}
+        # (endpoint, method, status) → 횟수
+        self.statuses = {}
+        # endpoint → [DB 시간 합계, 쿼리 수]
+        self.db = {}
+
+
+def _merge(total, shard):
+    """shard의 카운터를 total에 더합니다."""
+    # dict.copy()는 GIL 아래에서 원자적이므로 기록 중인 스레드와 충돌하지 않음
+    for key, entry in shard.latency.copy().items():
+        merged = total.latency.setdefault(key, [0] * len(entry))
+        for index, value in enumerate(list(entry)):
+            merged[index] += value
+    for key, count in shard.statuses.copy().items():
+        total.statuses[key] = total.statuses.get(key, 0) + count
+    for key, entry in shard.db.copy().items():
+        merged = total.db.setdefault(key, [0.0, 0])
+        merged[0] += entry[0]
+        merged[1] += entry[1]
+
+
+class RequestMetrics:
+    """엔드포인트별 응답 시간, 상태 코드, DB 시간 누적 지표입니다."""
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # (스레드, 카운터) 목록과 끝난 스레드들의 카운터 합계
+        self._shards = []
+        self._retired = _Shard()
+
+    def _shard(self):
+        shard = getattr(self._local, 'shard', None)
+        if shard is None:
+            shard = self._local.shard = _Shard()
+            with self._lock:
+                # 요청마다 스레드를 만드는 서버에서도 목록이 계속 늘지 않도록 정리
+                self._fold_finished()
+                self._shards.append((threading.current_thread(), shard))
+        return shard
+
+    def _fold_finished(self):
+        """끝난 스레드의 카운터를 합계에 더하고 목록에서 뺍니다. 잠금을 잡은 채 호출합니다."""
+        alive = []
+        for thread, shard in self._shards:
+            if thread.is_alive():
+                alive.append((thread, shard))
+            else:
+                # 끝난 스레드는 더 이상 기록하지 않음
+                _merge(self._retired, shard)
+        self._shards = alive
+
+    def record(self, endpoint, method, status, seconds, db_time=None, statements=0):
+        shard = self._shard()
+
+        key = (endpoint, method)
+        entry = shard.latency.get(key)
+        if entry is None:
+            entry = shard.latency[key] = [0] * (len(self.buckets) + 1) + [0.0, 0]
+        entry[bisect.bisect_left(self.buckets, seconds)] += 1
+        entry[-2] += seconds
+        entry[-1] += 1
+
+        key = (endpoint, method, status)
+        shard.statuses[key] = shard.statuses.get(key, 0) + 1
+
+        if db_time is not None:
+            entry = shard.db.get(endpoint)
+            if entry is None:
+                entry = shard.db[endpoint] = [0.0, 0]
+            entry[0] += db_time
+            entry[1] += statements
+
+    def snapshot(self):
+        """모든 스레드의 카운터를 합쳐 (latency, statuses, db)를 반환합니다.
+
+        다른 스레드가 기록 중일 수 있으므로 진행 중인 요청 한 건 정도는 빠질 수 있습니다.
+        """
+        total = _Shard()
+        with self._lock:
+            self._fold_finished()
+            _merge(total, self._retired)
+            shards = [shard for _, shard in self._shards]
+
+        for shard in shards:
+            _merge(total, shard)
+        return total.latency, total.statuses, total.db
+
+    def clear(self):
+        with self._lock:
+            for shard in [self._retired] + [shard for _, shard in self._shards]:
+                shard.latency.clear()
+                shard.statuses.clear()
+                shard.db.clear()
+
+
+request_metrics = RequestMetrics()
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(**labels):
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + '}'
+
+
+def _bound(value):
+    return '+Inf' if value == float('inf') else repr(float(value))
+
+
+def render_metrics():
+    """현재 지표를 Prometheus 텍스트 형식으로 만듭니다."""
+    from src.utils.db_pool import pool_metrics
+    from src.utils.reference_cache import reference_cache
+    from src.utils.sql_metrics import sql_summary
+    from src.utils.user_cache import user_cache
+
+    latency, statuses, db = request_metrics.snapshot()
+    bounds = request_metrics.buckets + (float('inf'),)
+    lines = []
+
+    lines.append('# HELP http_request_duration_seconds 엔드포인트별 응답 시간')
+    lines.append('# TYPE http_request_duration_seconds histogram')
+    for (endpoint, method), entry in sorted(latency.items()):
+        cumulative = 0
+        for bound, count in zip(bounds, entry):
+            cumulative += count
+            lines.append(
+                'http_request_duration_seconds_bucket'
+                f'{_labels(endpoint=endpoint, method=method, le=_bound(bound))} {cumulative}'
+            )
+        labels = _labels(endpoint=endpoint, method=method)
+        lines.append(f'http_request_duration_seconds_sum{labels} {entry[-2]}')
+        lines.append(f'http_request_duration_seconds_count{labels} {entry[-1]}')
+
+    lines.append('# HELP http_requests_total 엔드포인트/상태 코드별 요청 수')
+    lines.append('# TYPE http_requests_total counter')
+    for (endpoint, method, status), count in sorted(statuses.items()):
+        lines.append(f'http_requests_total{_labels(endpoint=endpoint, method=method, status=status)} {count}')
+
+    lines.append('# HELP db_query_seconds_total 엔드포인트별 SQL 실행 시간 합계')
+    lines.append('# TYPE db_query_seconds_total counter')
+    for endpoint, (db_time, _) in sorted(db.items()):
+        lines.append(f'db_query_seconds_total{_labels(endpoint=endpoint)} {db_time}')
+    lines.append('# HELP db_queries_total 엔드포인트별 SQL 실행 수')
+    lines.append('# TYPE db_queries_total counter')
+    for endpoint, (_, statements) in sorted(db.items()):
+        lines.append(f'db_queries_total{_labels(endpoint=endpoint)} {statements}')
+
+    caches = {'user': user_cache.stats(), 'reference': reference_cache.stats()}
+    lines.append('# HELP cache_hits_total 캐시 적중 수')
+    lines.append('# TYPE cache_hits_total counter')
+    for name, cache in caches.items():
+        lines.append(f'cache_hits_total{_labels(cache=name)} {cache["hits"]}')
+    lines.append('# HELP cache_misses_total 캐시 미스 수')
+    lines.append('# TYPE cache_misses_total counter')
+    for name, cache in caches.items():
+        lines.append(f'cache_misses_total{_labels(cache=name)} {cache["misses"]}')
+    lines.append('# HELP cache_hit_ratio 캐시 적중률')
+    lines.append('# TYPE cache_hit_ratio gauge')
+    for name, cache in caches.items():
+        lines.append(f'cache_hit_ratio{_labels(cache=name)} {cache["hit_rate"]}')
+    lines.append('# HELP cache_entries 캐시 항목 수')
+    lines.append('# TYPE cache_entries gauge')
+    for name, cache in caches.items():
+        lines.append(f'cache_entries{_labels(cache=name)} {cache["size"]}')
+
+    summary = sql_summary.snapshot()
+    lines.append('# HELP db_request_max_queries 엔드포인트별 한 요청의 최대 SQL 실행 수')
+    lines.append('# TYPE db_request_max_queries gauge')
+    for endpoint, entry in sorted(summary.items()):
+        lines.append(f'db_request_max_queries{_labels(endpoint=endpoint)} {entry["max_statements"]}')
+    lines.append('# HELP db_slowest_query_seconds 엔드포인트별 가장 느린 SQL 실행 시간')
+    lines.append('# TYPE db_slowest_query_seconds gauge')
+    for endpoint, entry in sorted(summary.items()):
+        lines.append(f'db_slowest_query_seconds{_labels(endpoint=endpoint)} {entry["slowest"]}')
+
+    pool = pool_metrics.stats()
+    lines.append('# HELP db_pool_checkout_seconds 커넥션 체크아웃 대기 시간')
+    lines.append('# TYPE db_pool_checkout_seconds histogram')
+    cumulative = 0
+    for bound, count in pool['buckets'].items():
+        cumulative += count
+        lines.append(f'db_pool_checkout_seconds_bucket{_labels(le=_bound(bound))} {cumulative}')
+    lines.append(f'db_pool_checkout_seconds_sum {pool["wait_total"]}')
+    lines.append(f'db_pool_checkout_seconds_count {pool["checkouts"]}')
+    lines.append('# HELP db_pool_timeouts_total 커넥션 체크아웃 타임아웃 수')
+    lines.append('# TYPE db_pool_timeouts_total counter')
+    lines.append(f'db_pool_timeouts_total {pool["timeouts"]}')
+
+    return '\n'.join(lines) + '\n'
+
+
+def require_metrics_token():
+    """METRICS_TOKEN이 맞지 않으면 401 응답을, 맞으면 None을 반환합니다."""
+    expected = f'Bearer {METRICS_TOKEN}'
+    if not METRICS_TOKEN or not hmac.compare_digest(request.headers.get('Authorization', ''), expected):
+        return Response('unauthorized\n', status=401, mimetype='text/plain')
+    return None
+
+
+def metrics_view():
+    """Prometheus 수집용 지표를 반환합니다."""
+    denied = require_metrics_token()
+    if denied:
+        return denied
+    return Response(render_metrics(), content_type=CONTENT_TYPE)
+
+
+def _start_request():
+    g.metrics_started = time.perf_counter()
+
+
+def _finish_request(response):
+    started = g.pop('metrics_started', None)
+    if started is None:
+        return response
+
+    # sql_metrics의 after_request보다 먼저 실행되므로 요청의 SQL 통계를 읽을 수 있음
+    stats = g.get('sql_stats')
+    request_metrics.record(
+        request.endpoint or 'unmatched',
+        request.method,
+        response.status_code,
+        time.perf_counter() - started,
+        stats.total if stats is not None else None,
+        stats.count if stats is not None else 0
+    )
+    return response
+
+
+def init_metrics(app):
+    """요청 지표 수집과 /metrics 엔드포인트를 등록합니다.
+
+    지표가 공개되지 않도록 /metrics는 METRICS_TOKEN이 있을 때만 등록합니다.
+    """
+    if not METRICS_ENABLED:
+        return
+
+    app.before_request(_start_request)
+    app.after_request(_finish_request)
+    if METRICS_TOKEN:
+        app.add_url_rule('/metrics', 'metrics', metrics_view, methods=['GET'])
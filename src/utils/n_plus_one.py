@@ -0,0 +1,130 @@
+"""N+1 쿼리 감지 (개발/테스트용)
+
+한 요청 안에서 같은 파라미터화된 SELECT가 임계값 이상 반복되면 지연 로딩 관계를
+행마다 읽는 N+1 패턴으로 보고, 처음 임계값에 도달한 호출 위치와 함께 경고하거나 예외를 발생시킵니다.
+
+엔드포인트별 설정은 뷰 함수에 @n_plus_one(threshold=..., mode=...)을 붙여 바꿉니다. 임계값이 0이면 감지하지 않습니다.
+"""
+import os
+import sysconfig
+import traceback
+from flask import current_app, g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from src.config.env import (
+    N_PLUS_ONE_MODE,
+    N_PLUS_ONE_THRESHOLD
+)
+
+MODES = ('off', 'warn', 'raise')
+
+# 호출 위치를 찾을 때 건너뛸 프레임 (이 모듈, 표준 라이브러리, 설치된 패키지)
+_THIS_FILE = os.path.abspath(__file__)
+_LIBRARY_DIRS = tuple({
+    os.path.abspath(sysconfig.get_paths()[name]) for name in ('stdlib', 'platstdlib', 'purelib', 'platlib')
+})
+
+
+class NPlusOneError(AssertionError):
+    """raise 모드에서 N+1 쿼리가 감지되면 발생합니다."""
+
+
+def n_plus_one(threshold=None, mode=None):
+    """뷰 함수의 N+1 감지 설정을 바꿉니다. (예: 의도적으로 반복 조회하는 엔드포인트는 mode='off')"""
+    if mode is not None and mode not in MODES:
+        raise ValueError(f'알 수 없는 N+1 감지 모드입니다: {mode}')
+
+    def decorator(f):
+        f.n_plus_one_threshold = threshold
+        f.n_plus_one_mode = mode
+        return f
+
+    return decorator
+
+
+class _RequestDetector:
+    __slots__ = ('mode', 'threshold', 'counts', 'findings')
+
+    def __init__(self, mode, threshold):
+        self.mode = mode
+        self.threshold = threshold
+        self.counts = {}
+        self.findings = []
+
+
+def _call_site():
+    """라이브러리가 아닌 코드 중 쿼리를 일으킨 가장 안쪽 프레임을 반환합니다."""
+    for frame in reversed(traceback.extract_stack()):
+        filename = os.path.abspath(frame.filename)
+        if frame.filename.startswith('<') or filename == _THIS_FILE or filename.startswith(_LIBRARY_DIRS):
+            continue
+        return f'{frame.filename}:{frame.lineno} in {frame.name}'
+    return '알 수 없음'
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if executemany or not has_request_context():
+        return
+    detector = g.get('n_plus_one')
+    if detector is None or not statement.lstrip()[:6].upper() == 'SELECT':
+        return
+
+    count = detector.counts.get(statement, 0) + 1
+    detector.counts[statement] = count
+    if count == detector.threshold:
+        finding = (statement, _call_site())
+        detector.findings.append(finding)
+        if detector.mode == 'warn':
+            current_app.logger.warning(_format(request.endpoint, detector.threshold, *finding))
+
+
+def _format(endpoint, threshold, statement, call_site):
+    return (
+        f'N+1 쿼리 의심: 같은 SELECT가 {threshold}번 이상 실행되었습니다 ({endpoint})\n'
+        f'  호출 위치: {call_site}\n'
+        f'  SQL: {" ".join(statement.split())[:300]}'
+    )
+
+
+def _default_mode(app):
+    # 테스트 설정(TESTING)은 create_app 이후에 바뀔 수 있으므로 요청마다 확인
+    return N_PLUS_ONE_MODE or ('raise' if app.testing else 'warn' if app.debug else 'off')
+
+
+def _start_request():
+    view = current_app.view_functions.get(request.endpoint)
+    mode = getattr(view, 'n_plus_one_mode', None)
+    if mode is None:
+        mode = _default_mode(current_app)
+    threshold = getattr(view, 'n_plus_one_threshold', None)
+    if threshold is None:
+        threshold = N_PLUS_ONE_THRESHOLD
+    if mode != 'off':
+        if not event.contains(Engine, 'after_cursor_execute', _after_cursor_execute):
+            event.listen(Engine, 'after_cursor_execute', _after_cursor_execute)
+        g.n_plus_one = _RequestDetector(mode, threshold)
+
+
+def _finish_request(response):
+    detector = g.pop('n_plus_one', None)
+    if detector is not None and detector.mode == 'raise' and detector.findings:
+        raise NPlusOneError('\n'.join(
+            _format(request.endpoint, detector.threshold, *finding) for finding in detector.findings
+        ))
+    return response
+
+
+def init_n_plus_one(app):
+    """N+1 감지를 등록합니다.
+
+    N_PLUS_ONE_MODE가 없으면 요청마다 테스트 앱은 raise, 디버그 앱은 warn, 그 외에는 꺼짐으로 정합니다.
+    N_PLUS_ONE_MODE=off이면 아무 훅도 등록하지 않습니다.
+    """
+    if N_PLUS_ONE_MODE and N_PLUS_ONE_MODE not in MODES:
+        raise ValueError(f'알 수 없는 N+1 감지 모드입니다: {N_PLUS_ONE_MODE}')
+    if N_PLUS_ONE_MODE == 'off':
+        return
+
+    app.before_request(_start_request)
+    app.after_request(_finish_request)
@@ -0,0 +1,91 @@
+"""학교/단과대/학과 이름 자동완성 인덱스
+
+한글 초성 검색(예: 'ㅅㅇㄷ' → 서울대학교)을 지원하며, 접두사 일치를 먼저 보여줍니다.
+"""
+from operator import itemgetter
+
+_HANGUL_BASE = 0xAC00
+_HANGUL_LAST = 0xD7A3
+_CHOSUNG_PERIOD = 21 * 28
+CHOSUNG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+_CHOSUNG_SET = frozenset(CHOSUNG)
+
+
+def normalize(text):
+    """대소문자와 공백을 무시하도록 정규화합니다."""
+    return ''.join(text.lower().split())
+
+
+def to_chosung(text):
+    """한글 음절을 초성으로 바꿉니다. 한글이 아닌 문자는 그대로 둡니다."""
+    chars = []
+    for char in text:
+        code = ord(char)
+        if _HANGUL_BASE <= code <= _HANGUL_LAST:
+            chars.append(CHOSUNG[(code - _HANGUL_BASE) // _CHOSUNG_PERIOD])
+        else:
+            chars.append(char)
+    return ''.join(chars)
+
+
+def _find_mixed(name_key, chosung_key, query, query_chosung):
+    """'서ㅇ'처럼 음절과 초성이 섞인 검색어의 일치 위치를 찾습니다. 없으면 -1을 반환합니다.
+
+    초성 문자열에서 후보 위치를 찾은 뒤 음절이 실제로 같은지만 확인합니다.
+    """
+    start = chosung_key.find(query_chosung)
+    while start >= 0:
+        if all(
+            char in _CHOSUNG_SET or char == name_key[start + offset]
+            for offset, char in enumerate(query)
+        ):
+            return start
+        start = chosung_key.find(query_chosung, start + 1)
+    return -1
+
+
+class NameIndex:
+    """이름 목록에 대한 부분 문자열/초성 검색 인덱스입니다.
+
+    항목마다 정규화된 이름과 초성 문자열을 미리 계산해 두고,
+    검색 시에는 str.find만으로 일치 위치를 찾습니다.
+    refs는 이름순으로 정렬되어 있어야 합니다.
+    """
+
+    __slots__ = ('_entries',)
+
+    def __init__(self, refs):
+        entries = []
+        for ref in refs:
+            name_key = normalize(ref.name)
+            entries.append((name_key, to_chosung(name_key), ref))
+        self._entries = entries
+
+    def search(self, term):
+        """검색어와 일치하는 항목을 접두사 일치 → 앞쪽 일치 → 이름 순으로 반환합니다."""
+        query = normalize(term)
+        if not query:
+            return [ref for _, _, ref in self._entries]
+
+        jamo = [char in _CHOSUNG_SET for char in query]
+        if all(jamo):
+            matches = (
+                (chosung_key.find(query), ref)
+                for _, chosung_key, ref in self._entries
+            )
+        elif any(jamo):
+            query_chosung = to_chosung(query)
+            matches = (
+                (_find_mixed(name_key, chosung_key, query, query_chosung), ref)
+                for name_key, chosung_key, ref in self._entries
+            )
+        else:
+            matches = (
+                (name_key.find(query), ref)
+                for name_key, _, ref in self._entries
+            )
+
+        # 이름순 입력에 대한 안정 정렬이므로 같은 위치끼리는 이름순이 유지됨
+        ranked = [match for match in matches if match[0] >= 0]
+        ranked.sort(key=itemgetter(0))
+        return [ref for _, ref in ranked]
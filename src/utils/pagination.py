@@ -0,0 +1,44 @@
+from math import ceil
+
+
+def paginate_items(items, page, per_page):
+    """메모리에 있는 목록을 Flask-SQLAlchemy paginate(error_out=False)와 같은 규칙으로 나눕니다.
+
+    (현재 페이지 항목, 전체 개수, 전체 페이지 수)를 반환합니다.
+    """
+    if page < 1:
+        page = 1
+    if per_page < 1:
+        per_page = 20
+
+    total = len(items)
+    pages = ceil(total / per_page) if total else 0
+    start = (page - 1) * per_page
+
+    return items[start:start + per_page], total, pages
+
+
+def paginate_query(query, page, per_page, serialize):
+    """쿼리를 Flask-SQLAlchemy paginate(error_out=False)와 같은 규칙으로 나누되, 현재 페이지 조회와
+    전체 개수 조회를 run_parallel로 동시에 실행합니다.
+
+    (직렬화한 현재 페이지 항목, 전체 개수, 전체 페이지 수)를 반환합니다.
+    """
+    from src.models import db
+    from src.utils.parallel import run_parallel
+
+    if page < 1:
+        page = 1
+    if per_page < 1:
+        per_page = 20
+
+    def load_items():
+        return serialize(query.limit(per_page).offset((page - 1) * per_page).all())
+
+    def load_total():
+        # 작업 스레드에서는 그 스레드의 세션으로 실행
+        return query.with_session(db.session()).order_by(None).count()
+
+    items, total = run_parallel(load_items, load_total)
+    pages = ceil(total / per_page) if total else 0
+    return items, total, pages
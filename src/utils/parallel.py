@@ -0,0 +1,129 @@
+"""한 요청 안의 독립적인 조회를 동시에 실행
+
+PARALLEL_READS가 켜져 있으면 run_parallel에 넘긴 함수들을 작은 스레드 풀에서 동시에 실행합니다.
+첫 번째 함수는 현재 스레드에서 실행하고, 나머지는 각자 새 앱 컨텍스트(= 별도 세션과 커넥션)에서 실행합니다.
+따라서 나머지 함수는 request에 접근하지 말고, 세션이 닫혀도 쓸 수 있는 값(직렬화한 dict, 숫자 등)을 반환해야 합니다.
+
+꺼져 있으면 같은 함수들을 순서대로 실행하므로 결과는 같습니다.
+요청 스레드가 커넥션을 쥔 채 작업 스레드를 기다리므로, 풀이 모자라면 서로 기다리다 타임아웃이 날 수 있습니다.
+이를 막기 위해 다음 경우에는 기다리지 않고 순서대로 실행합니다.
+  - 동시에 병렬 조회 중인 요청 수가 (풀 최대 크기 - PARALLEL_READ_WORKERS)에 도달한 경우
+  - 풀에 남은 커넥션이 작업 스레드에 필요한 수보다 적은 경우
+풀 최대 크기(DB_POOL_SIZE + DB_MAX_OVERFLOW)가 PARALLEL_READ_WORKERS 이하이면 항상 순서대로 실행합니다.
+"""
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from flask import current_app, g
+from sqlalchemy.pool import NullPool, QueuePool
+
+from src.config.env import (
+    PARALLEL_READS,
+    PARALLEL_READ_WORKERS
+)
+
+_executor = None
+_executor_lock = threading.Lock()
+
+# 엔진 → 동시에 병렬 조회를 쓸 수 있는 요청 수 (None이면 제한 없음)
+_request_slots = weakref.WeakKeyDictionary()
+_request_slots_lock = threading.Lock()
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=PARALLEL_READ_WORKERS, thread_name_prefix='parallel-read')
+    return _executor
+
+
+def _pool_capacity(pool):
+    """풀이 동시에 내줄 수 있는 최대 커넥션 수입니다. 제한이 없으면 None을 반환합니다."""
+    if isinstance(pool, NullPool):
+        return None
+    if isinstance(pool, QueuePool):
+        max_overflow = pool._max_overflow
+        return None if max_overflow < 0 else pool.size() + max_overflow
+    # StaticPool/SingletonThreadPool(sqlite 메모리 DB 등)은 스레드끼리 같은 DB를 나눠 쓸 수 없음
+    return 0
+
+
+def _get_request_slots(engine):
+    if engine not in _request_slots:
+        with _request_slots_lock:
+            if engine not in _request_slots:
+                capacity = _pool_capacity(engine.pool)
+                # 요청 스레드들이 쥔 커넥션만으로 풀이 차지 않도록 작업 스레드 몫을 남김
+                _request_slots[engine] = None if capacity is None else threading.BoundedSemaphore(
+                    max(0, capacity - PARALLEL_READ_WORKERS)
+                )
+    return _request_slots[engine]
+
+
+def _has_free_connections(pool, count):
+    capacity = _pool_capacity(pool)
+    return capacity is None or capacity - pool.checkedout() >= count
+
+
+def _run_in_app_context(app, func, collect_sql):
+    from src.utils.sql_metrics import RequestSQLStats
+
+    with app.app_context():
+        # 작업 스레드의 SQL도 요청 통계에 합치기 위해 따로 모았다가 돌려줌
+        stats = RequestSQLStats() if collect_sql else None
+        if stats is not None:
+            g.sql_stats = stats
+        return func(), stats
+
+
+def run_parallel(*funcs):
+    """인자 없는 함수들을 실행하고 결과를 같은 순서의 리스트로 반환합니다. 예외는 그대로 전파합니다."""
+    if not PARALLEL_READS or len(funcs) < 2:
+        return [func() for func in funcs]
+
+    from src.models import db
+
+    # 풀이 모자라면 작업 스레드가 커넥션을 기다리지 않도록 순서대로 실행
+    engine = db.engine
+    slots = _get_request_slots(engine)
+    if slots is not None and not slots.acquire(blocking=False):
+        return [func() for func in funcs]
+    try:
+        if _has_free_connections(engine.pool, len(funcs) - 1):
+            return _run_concurrently(funcs)
+    finally:
+        if slots is not None:
+            slots.release()
+    return [func() for func in funcs]
+
+
+def _run_concurrently(funcs):
+    app = current_app._get_current_object()
+    parent_stats = g.get('sql_stats')
+    futures = [
+        _get_executor().submit(_run_in_app_context, app, func, parent_stats is not None)
+        for func in funcs[1:]
+    ]
+
+    try:
+        first = funcs[0]()
+    finally:
+        # 첫 함수가 실패해도 작업 스레드가 끝난 뒤에 반환 (요청이 끝난 뒤 커넥션을 쓰지 않도록)
+        outcomes = []
+        for future in futures:
+            try:
+                outcomes.append((future.result(), None))
+            except Exception as e:
+                outcomes.append((None, e))
+
+    results = [first]
+    for outcome, error in outcomes:
+        if error is not None:
+            raise error
+        result, stats = outcome
+        if stats is not None:
+            parent_stats.merge(stats)
+        results.append(result)
+    return results
@@ -0,0 +1,36 @@
+import threading
+from functools import lru_cache
+from werkzeug.security import generate_password_hash, check_password_hash
+
+from src.config.env import (
+    PASSWORD_HASH_METHOD,
+    PASSWORD_HASH_WORKERS
+)
+
+# 동시에 실행되는 KDF 수 제한
+# hashlib의 scrypt/pbkdf2는 GIL을 해제하므로 요청 스레드 수와 무관하게 코어 수 이내로 제한합니다.
+# 요청 스레드는 해시가 끝날 때까지 (차례를 기다리는 시간 포함) 그대로 블록됩니다.
+_hash_slots = threading.BoundedSemaphore(PASSWORD_HASH_WORKERS)
+
+
+def hash_password(password, method=PASSWORD_HASH_METHOD):
+    """설정된 파라미터로 비밀번호를 해시합니다."""
+    with _hash_slots:
+        return generate_password_hash(password, method)
+
+
+def verify_password(password_hash, password):
+    """비밀번호가 저장된 해시와 일치하는지 확인합니다."""
+    with _hash_slots:
+        return check_password_hash(password_hash, password)
+
+
+@lru_cache(maxsize=None)
+def _normalized_method(method):
+    """'scrypt'처럼 생략된 설정을 werkzeug가 실제로 저장하는 형식으로 바꿉니다."""
+    return generate_password_hash('', method).split('$', 1)[0]
+
+
+def needs_rehash(password_hash, method=PASSWORD_HASH_METHOD):
+    """저장된 해시의 파라미터가 현재 설정과 다른지 확인합니다."""
+    return password_hash.split('$', 1)[0] != _normalized_method(method)
@@ -0,0 +1,166 @@
+"""요청 단위 프로파일링
+
+서명된 X-Profile-Token 헤더가 있거나 PROFILING_SAMPLE_RATE 비율에 뽑힌 요청을 cProfile로 실행하고
+pstats 파일로 PROFILING_DIR에 저장합니다. 저장한 파일 이름은 X-Profile-Id 응답 헤더로 알려 줍니다.
+토큰이 있어도 다른 요청을 프로파일링 중이면 건너뛰고 X-Profile-Skipped: busy 헤더로 알려 줍니다.
+저장된 프로파일은 /debug/profiles 에서 같은 토큰으로 내려받을 수 있습니다. (flask profile-report로 확인)
+
+토큰은 `flask profile-token`으로 만듭니다. 형식은 '<만료 시각>.<HMAC-SHA256 서명>' 입니다.
+샘플링 비율이 0이고 PROFILING_SECRET이 없으면 훅을 등록하지 않으므로 추가 비용이 없습니다.
+"""
+import cProfile
+import hashlib
+import hmac
+import os
+import random
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from flask import g, jsonify, request, send_from_directory
+
+from src.config.env import (
+    PROFILING_SAMPLE_RATE,
+    PROFILING_SECRET,
+    PROFILING_DIR,
+    PROFILING_MAX_FILES
+)
+
+TOKEN_HEADER = 'X-Profile-Token'
+SKIPPED_HEADER = 'X-Profile-Skipped'
+PROFILE_NAME_PATTERN = re.compile(r'^[\w.-]+\.prof$')
+
+# cProfile은 동시에 하나만 켤 수 있으므로 (3.12부터는 인터프리터 전체) 한 번에 한 요청만 프로파일링
+_profiling_lock = threading.Lock()
+
+
+def _sign(expires):
+    return hmac.new(PROFILING_SECRET.encode('utf-8'), f'profile:{expires}'.encode('utf-8'), hashlib.sha256).hexdigest()
+
+
+def make_profile_token(ttl):
+    """ttl초 동안 유효한 프로파일링 토큰을 만듭니다."""
+    if not PROFILING_SECRET:
+        raise ValueError('PROFILING_SECRET이 설정되지 않았습니다')
+    expires = int(time.time()) + ttl
+    return f'{expires}.{_sign(expires)}'
+
+
+def verify_profile_token(token):
+    """토큰의 서명과 만료 시각을 확인합니다."""
+    if not PROFILING_SECRET or not token:
+        return False
+    expires, _, signature = token.partition('.')
+    if not expires.isdigit() or int(expires) < time.time():
+        return False
+    return hmac.compare_digest(signature, _sign(int(expires)))
+
+
+def _prune(directory, keep):
+    """오래된 프로파일을 지워 최대 keep개만 남깁니다."""
+    names = sorted(name for name in os.listdir(directory) if PROFILE_NAME_PATTERN.match(name))
+    for name in names[:-keep] if keep > 0 else []:
+        try:
+            os.remove(os.path.join(directory, name))
+        except FileNotFoundError:
+            pass
+
+
+def _save(profiler):
+    os.makedirs(PROFILING_DIR, exist_ok=True)
+    # 파일 이름이 시간순으로 정렬되도록 시각을 앞에 둠
+    endpoint = re.sub(r'[^\w.-]', '_', request.endpoint or 'unmatched')
+    timestamp = datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S%f')
+    name = f'{timestamp}-{endpoint}-{os.urandom(3).hex()}.prof'
+    profiler.dump_stats(os.path.join(PROFILING_DIR, name))
+    _prune(PROFILING_DIR, PROFILING_MAX_FILES)
+    return name
+
+
+def _start_profile():
+    requested = TOKEN_HEADER in request.headers
+    if requested:
+        if not verify_profile_token(request.headers[TOKEN_HEADER]):
+            return jsonify({'error': '유효하지 않은 프로파일링 토큰입니다'}), 403
+    elif random.random() >= PROFILING_SAMPLE_RATE:
+        return
+
+    # 다른 요청을 프로파일링 중이면 건너뜀 (토큰으로 요청했으면 다시 시도하도록 응답 헤더로 알림)
+    if not _profiling_lock.acquire(blocking=False):
+        if requested:
+            g.profile_skipped = 'busy'
+        return
+    profiler = cProfile.Profile()
+    g.profiler = profiler
+    profiler.enable()
+
+
+def _stop_profile():
+    profiler = g.pop('profiler', None)
+    if profiler is None:
+        return None
+    profiler.disable()
+    _profiling_lock.release()
+    return profiler
+
+
+def _finish_profile(response):
+    profiler = _stop_profile()
+    if profiler is not None:
+        response.headers['X-Profile-Id'] = _save(profiler)
+    elif 'profile_skipped' in g:
+        response.headers[SKIPPED_HEADER] = g.pop('profile_skipped')
+    return response
+
+
+def _teardown_profile(exception):
+    # after_request를 거치지 않고 끝난 요청에서도 프로파일러를 끔
+    _stop_profile()
+
+
+def _require_token():
+    if not verify_profile_token(request.headers.get(TOKEN_HEADER)):
+        return jsonify({'error': '유효하지 않은 프로파일링 토큰입니다'}), 403
+    return None
+
+
+def list_profiles():
+    """저장된 프로파일 목록 (최신순)"""
+    denied = _require_token()
+    if denied:
+        return denied
+    if not os.path.isdir(PROFILING_DIR):
+        return jsonify({'profiles': []})
+
+    profiles = []
+    for name in sorted(os.listdir(PROFILING_DIR), reverse=True):
+        if PROFILE_NAME_PATTERN.match(name):
+            profiles.append({'id': name, 'size': os.path.getsize(os.path.join(PROFILING_DIR, name))})
+    return jsonify({'profiles': profiles})
+
+
+def download_profile(profile_id):
+    """프로파일(pstats) 파일 다운로드"""
+    denied = _require_token()
+    if denied:
+        return denied
+    if not PROFILE_NAME_PATTERN.match(profile_id):
+        return jsonify({'error': '존재하지 않는 프로파일입니다'}), 404
+    return send_from_directory(
+        os.path.abspath(PROFILING_DIR), profile_id,
+        mimetype='application/octet-stream', as_attachment=True
+    )
+
+
+def init_profiling(app):
+    """요청 프로파일링을 등록합니다. 비율이 0이고 비밀 키가 없으면 아무것도 등록하지 않습니다."""
+    if PROFILING_SAMPLE_RATE <= 0 and not PROFILING_SECRET:
+        return
+
+    app.before_request(_start_profile)
+    app.after_request(_finish_profile)
+    app.teardown_request(_teardown_profile)
+
+    if PROFILING_SECRET:
+        app.add_url_rule('/debug/profiles', 'profiles.list', list_profiles, methods=['GET'])
+        app.add_url_rule('/debug/profiles/<profile_id>', 'profiles.download', download_profile, methods=['GET'])
@@ -0,0 +1,210 @@
+import threading
+import time
+from collections import namedtuple
+from datetime import datetime
+from sqlalchemy import update
+from src.models import db, Country, School, College, Department, ReferenceDataVersion
+from src.utils.name_index import NameIndex
+
+from src.config.env import (
+    REFERENCE_CACHE_TTL,
+    REFERENCE_VERSION_CHECK_INTERVAL
+)
+
+CountryRef = namedtuple('CountryRef', ['id', 'name', 'code'])
+SchoolRef = namedtuple('SchoolRef', ['id', 'name', 'country_id'])
+CollegeRef = namedtuple('CollegeRef', ['id', 'name', 'school_id'])
+DepartmentRef = namedtuple('DepartmentRef', ['id', 'name', 'college_id'])
+
+
+def _sort_key(ref):
+    return (ref.name, ref.id)
+
+
+def _group_children(refs, parent_attr):
+    """부모 ID별로 이름순 정렬된 자식 튜플을 만듭니다."""
+    groups = {}
+    for ref in refs:
+        groups.setdefault(getattr(ref, parent_attr), []).append(ref)
+    return {parent_id: tuple(sorted(children, key=_sort_key)) for parent_id, children in groups.items()}
+
+
+class ReferenceData:
+    """국가 → 학교 → 단과대 → 학과 계층 전체의 불변 스냅샷입니다."""
+
+    def __init__(self, countries, schools, colleges, departments):
+        self.countries = {ref.id: ref for ref in countries}
+        self.schools = {ref.id: ref for ref in schools}
+        self.colleges = {ref.id: ref for ref in colleges}
+        self.departments = {ref.id: ref for ref in departments}
+
+        self.sorted_countries = tuple(sorted(countries, key=_sort_key))
+        self.schools_by_country = _group_children(schools, 'country_id')
+        self.colleges_by_school = _group_children(colleges, 'school_id')
+        self.departments_by_college = _group_children(departments, 'college_id')
+
+        # 응답용 {'id', 'name'(, 'code')} 딕셔너리 (행마다 새로 만들지 않도록 미리 생성, 수정 금지)
+        self.country_dicts = {ref.id: {'id': ref.id, 'name': ref.name, 'code': ref.code} for ref in countries}
+        self.school_dicts = {ref.id: {'id': ref.id, 'name': ref.name} for ref in schools}
+        self.college_dicts = {ref.id: {'id': ref.id, 'name': ref.name} for ref in colleges}
+        self.department_dicts = {ref.id: {'id': ref.id, 'name': ref.name} for ref in departments}
+
+        # 기본 학교 (School.query.first()와 동일하게 가장 먼저 생성된 학교)
+        self.default_school = self.schools[min(self.schools)] if self.schools else None
+
+        # 자동완성 인덱스 (부모별로 처음 검색될 때 생성)
+        self._name_indexes = {}
+
+        # 국가별 계층 스냅샷 (처음 요청될 때 생성)
+        self._snapshots = {}
+
+    @classmethod
+    def load(cls):
+        """필요한 컬럼만 네 번의 쿼리로 읽어옵니다."""
+        return cls(
+            [CountryRef(*row) for row in db.session.query(Country.id, Country.name, Country.code)],
+            [SchoolRef(*row) for row in db.session.query(School.id, School.name, School.country_id)],
+            [CollegeRef(*row) for row in db.session.query(College.id, College.name, College.school_id)],
+            [DepartmentRef(*row) for row in db.session.query(Department.id, Department.name, Department.college_id)]
+        )
+
+    def get_schools(self, country_id):
+        return self.schools_by_country.get(country_id, ())
+
+    def get_colleges(self, school_id):
+        return self.colleges_by_school.get(school_id, ())
+
+    def get_departments(self, college_id):
+        return self.departments_by_college.get(college_id, ())
+
+    def _search(self, kind, children, parent_id, term):
+        key = (kind, parent_id)
+        index = self._name_indexes.get(key)
+        if index is None:
+            index = NameIndex(children.get(parent_id, ()))
+            self._name_indexes[key] = index
+        return index.search(term)
+
+    def search_schools(self, country_id, term):
+        """국가의 학교를 이름/초성으로 검색합니다."""
+        return self._search('school', self.schools_by_country, country_id, term)
+
+    def search_colleges(self, school_id, term):
+        """학교의 단과대학을 이름/초성으로 검색합니다."""
+        return self._search('college', self.colleges_by_school, school_id, term)
+
+    def search_departments(self, college_id, term):
+        """단과대학의 학과를 이름/초성으로 검색합니다."""
+        return self._search('department', self.departments_by_college, college_id, term)
+
+    def get_snapshot(self, country_id, build):
+        """국가별 스냅샷을 반환합니다. 없으면 build(self, country_id)로 만들어 보관합니다."""
+        snapshot = self._snapshots.get(country_id)
+        if snapshot is None:
+            snapshot = build(self, country_id)
+            self._snapshots[country_id] = snapshot
+        return snapshot
+
+
+def get_reference_version():
+    """DB에 기록된 참조 데이터 버전을 반환합니다. (기본 키 조회 한 번)"""
+    return db.session.query(ReferenceDataVersion.version).filter(ReferenceDataVersion.id == 1).scalar() or 0
+
+
+def bump_reference_version():
+    """참조 데이터 버전을 올리고 커밋합니다. 실행 중인 서버들은 다음 버전 확인 때 다시 불러옵니다."""
+    updated = db.session.execute(
+        update(ReferenceDataVersion)
+        .where(ReferenceDataVersion.id == 1)
+        .values(version=ReferenceDataVersion.version + 1, updated_at=datetime.utcnow())
+    ).rowcount
+    if not updated:
+        db.session.add(ReferenceDataVersion(id=1, version=1))
+    db.session.commit()
+    return get_reference_version()
+
+
+class ReferenceCache:
+    """참조 데이터 스냅샷을 보관하고 TTL이 지나거나 DB의 버전이 바뀌면 교체합니다.
+
+    버전은 check_interval마다 한 번만 확인하므로 다른 프로세스의 변경은 그 안에 반영됩니다.
+    """
+
+    def __init__(self, ttl=REFERENCE_CACHE_TTL, check_interval=REFERENCE_VERSION_CHECK_INTERVAL):
+        self.ttl = ttl
+        self.check_interval = check_interval
+        self._data = None
+        self._version = None
+        self._expires_at = 0.0
+        self._next_check = 0.0
+        self._lock = threading.Lock()
+        # 적중 수는 잠금 없이 세므로 동시 요청이 많으면 약간 적게 셀 수 있음
+        self.hits = 0
+        self.misses = 0
+
+    def get(self):
+        data = self._data
+        now = time.monotonic()
+        if data is not None and now < self._expires_at and now < self._next_check:
+            self.hits += 1
+            return data
+
+        with self._lock:
+            now = time.monotonic()
+            if self._data is not None and now < self._expires_at:
+                # 다른 스레드가 이미 확인했거나, 버전이 그대로인 경우
+                if now < self._next_check:
+                    self.hits += 1
+                    return self._data
+                self._next_check = now + self.check_interval
+                if get_reference_version() == self._version:
+                    self.hits += 1
+                    return self._data
+            self.misses += 1
+            return self._load()
+
+    def reload(self):
+        """DB에서 즉시 다시 불러옵니다. 참조 데이터를 변경한 뒤 호출합니다."""
+        with self._lock:
+            return self._load()
+
+    def invalidate(self):
+        """다음 조회 시 다시 불러오도록 합니다."""
+        self._expires_at = 0.0
+
+    def stats(self):
+        """캐시 적중률 통계를 반환합니다. (TTLCache.stats()와 같은 형태, size는 불러온 스냅샷 수)"""
+        total = self.hits + self.misses
+        return {
+            'size': 1 if self._data is not None else 0,
+            'maxsize': 1,
+            'ttl': self.ttl,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0
+        }
+
+    def _load(self):
+        # 버전을 먼저 읽어야 그 사이의 변경을 다음 확인 때 놓치지 않음
+        version = get_reference_version()
+        data = ReferenceData.load()
+        self._data = data
+        self._version = version
+        now = time.monotonic()
+        self._expires_at = now + self.ttl
+        self._next_check = now + self.check_interval
+        return data
+
+
+reference_cache = ReferenceCache()
+
+
+def get_reference_data():
+    """현재 참조 데이터 스냅샷을 반환합니다."""
+    return reference_cache.get()
+
+
+def reload_reference_data():
+    """참조 데이터 버전을 올려 모든 서버가 다시 불러오게 하고, 현재 프로세스의 캐시도 바로 교체합니다."""
+    bump_reference_version()
+    return reference_cache.reload()
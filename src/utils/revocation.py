@@ -0,0 +1,137 @@
+import threading
+import time
+from calendar import timegm
+from datetime import datetime, timedelta
+from sqlalchemy import or_
+from src.models import db, TokenRevocation
+
+from src.config.env import (
+    TOKEN_REVOCATION_REFRESH_INTERVAL
+)
+
+# 액세스 토큰 유효 기간 (사용자 단위 폐기 기록도 이 기간이 지나면 의미가 없음)
+ACCESS_TOKEN_LIFETIME = timedelta(days=30)
+
+# id 순서와 다르게 커밋된 행(낮은 id가 나중에 커밋)을 놓치지 않도록 최근 이 기간의 행은 다시 읽음
+REFRESH_OVERLAP = timedelta(seconds=60)
+
+
+def to_timestamp(value):
+    """naive UTC datetime을 초 미만까지 포함한 타임스탬프로 바꿉니다."""
+    return timegm(value.utctimetuple()) + value.microsecond / 1_000_000
+
+
+class RevocationList:
+    """token_revocations 테이블의 프로세스 내 사본입니다.
+
+    요청마다 DB를 조회하지 않고, refresh_interval마다 마지막으로 읽은 id 이후의 행과
+    최근 REFRESH_OVERLAP 동안 만들어진 행만 가져와 갱신합니다. 같은 행을 다시 반영해도 결과는 같습니다.
+    """
+
+    def __init__(self, refresh_interval=TOKEN_REVOCATION_REFRESH_INTERVAL):
+        self.refresh_interval = refresh_interval
+        self._jtis = {}        # jti -> 만료 타임스탬프
+        self._not_before = {}  # user_id -> (이 시각 이전 발급 토큰 폐기, 만료 타임스탬프)
+        self._last_id = 0      # refresh()로 읽은 가장 큰 id (apply()는 바꾸지 않음)
+        self._last_refreshed_at = None
+        self._next_refresh = 0.0
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+
+    def apply(self, revocation):
+        """폐기 기록 한 건을 메모리 사본에 반영합니다."""
+        expires_at = to_timestamp(revocation.expires_at)
+        with self._lock:
+            if revocation.jti:
+                self._jtis[revocation.jti] = expires_at
+            if revocation.not_before:
+                not_before = to_timestamp(revocation.not_before)
+                current = self._not_before.get(revocation.user_id)
+                if current is None or current[0] < not_before:
+                    self._not_before[revocation.user_id] = (not_before, expires_at)
+
+    def _prune(self, now):
+        with self._lock:
+            self._jtis = {jti: exp for jti, exp in self._jtis.items() if exp > now}
+            self._not_before = {
+                user_id: entry for user_id, entry in self._not_before.items() if entry[1] > now
+            }
+
+    def refresh(self, force=False):
+        """주기가 지났으면 새로 추가된 폐기 기록만 불러옵니다."""
+        if not force and time.monotonic() < self._next_refresh:
+            return
+
+        # 다른 스레드가 갱신 중이면 기다리지 않고 현재 사본을 사용
+        if not self._refresh_lock.acquire(blocking=False):
+            return
+
+        try:
+            now = datetime.utcnow()
+            new_rows = TokenRevocation.id > self._last_id
+            if self._last_refreshed_at is not None:
+                new_rows = or_(new_rows, TokenRevocation.created_at >= self._last_refreshed_at - REFRESH_OVERLAP)
+            revocations = TokenRevocation.query.filter(
+                new_rows,
+                TokenRevocation.expires_at > now
+            ).order_by(TokenRevocation.id.asc()).all()
+
+            for revocation in revocations:
+                self.apply(revocation)
+                if revocation.id > self._last_id:
+                    self._last_id = revocation.id
+            self._last_refreshed_at = now
+
+            self._prune(to_timestamp(now))
+            self._next_refresh = time.monotonic() + self.refresh_interval
+        finally:
+            self._refresh_lock.release()
+
+    def is_revoked(self, token_data):
+        """디코딩된 토큰이 폐기되었는지 확인합니다."""
+        self.refresh()
+
+        jti = token_data.get('jti')
+        if jti and jti in self._jtis:
+            return True
+
+        entry = self._not_before.get(token_data.get('user_id'))
+        if entry and token_data.get('iat', 0) < entry[0]:
+            return True
+
+        return False
+
+    def clear(self):
+        with self._lock:
+            self._jtis.clear()
+            self._not_before.clear()
+            self._last_id = 0
+            self._last_refreshed_at = None
+            self._next_refresh = 0.0
+
+
+revocation_list = RevocationList()
+
+
+def revoke_token(token_data):
+    """토큰 한 개를 폐기하는 기록을 세션에 추가합니다. 커밋은 호출한 쪽에서 합니다."""
+    revocation = TokenRevocation(
+        user_id=token_data['user_id'],
+        jti=token_data['jti'],
+        expires_at=datetime.utcfromtimestamp(token_data['exp'])
+    )
+    db.session.add(revocation)
+    return revocation
+
+
+def revoke_user_tokens(user_id):
+    """지금까지 발급된 사용자의 모든 토큰을 폐기하는 기록을 세션에 추가합니다."""
+    now = datetime.utcnow()
+    revocation = TokenRevocation(
+        user_id=user_id,
+        # 토큰의 iat도 초 미만까지 기록하므로 같은 초에 폐기 전/후로 발급된 토큰을 구분함
+        not_before=now,
+        expires_at=now + ACCESS_TOKEN_LIFETIME
+    )
+    db.session.add(revocation)
+    return revocation
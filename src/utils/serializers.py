@@ -0,0 +1,343 @@
+"""목록 응답용 직렬화
+
+formatters의 get_*_data와 같은 형태의 응답을 만들되,
+- 행마다 필요한 컬럼은 미리 만든 attrgetter로 한 번에 꺼내고
+- 학교/단과대/학과/국가 하위 딕셔너리는 참조 데이터 캐시에 미리 만들어 둔 것을 재사용하며
+- orjson이 설치되어 있으면 표준 json 대신 사용해 바로 bytes로 인코딩합니다.
+
+목록 API의 ?fields= (sparse fieldset)도 여기서 처리합니다. 요청되지 않은 필드는
+속성에 접근하지 않으므로, *_load_options로 지연(defer)시킨 컬럼은 DB에서 읽히지 않습니다.
+"""
+import json
+from operator import attrgetter
+from flask import Response
+from sqlalchemy.orm import load_only, selectinload
+from src.models import Post, PostComment
+from src.utils.reference_cache import get_reference_data
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 선택적 의존성
+    orjson = None
+
+
+def dumps(obj):
+    """객체를 JSON bytes로 인코딩합니다."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def json_response(obj, status=200, headers=None):
+    """jsonify 대신 사용하는 응답 생성 함수입니다."""
+    return Response(dumps(obj), status=status, headers=headers, mimetype='application/json')
+
+
+def _ref_dict(dicts, ref_id, load):
+    """캐시된 하위 딕셔너리를 반환합니다. 캐시 이후 추가된 항목이면 ORM 관계에서 만듭니다."""
+    data = dicts.get(ref_id)
+    if data is None:
+        obj = load()
+        data = {'id': obj.id, 'name': obj.name}
+        if hasattr(obj, 'code'):
+            data['code'] = obj.code
+    return data
+
+
+_post_fields = attrgetter(
+    'id', 'title', 'content', 'category', 'nickname',
+    'school_id', 'college_id', 'department_id',
+    'created_at', 'updated_at', 'deleted_at'
+)
+
+_comment_fields = attrgetter(
+    'id', 'content', 'nickname', 'parent_id', 'post_id',
+    'created_at', 'updated_at', 'deleted_at'
+)
+
+_user_fields = attrgetter(
+    'id', 'email', 'name',
+    'country_id', 'school_id', 'college_id', 'department_id',
+    'created_at', 'updated_at', 'deleted_at'
+)
+
+
+def serialize_current_user(user, reference=None):
+    """get_current_user_data와 같은 형태로 직렬화합니다."""
+    reference = reference or get_reference_data()
+    (
+        user_id, email, name,
+        country_id, school_id, college_id, department_id,
+        created_at, updated_at, _
+    ) = _user_fields(user)
+
+    return {
+        'id': user_id,
+        'email': email,
+        'name': name,
+        'country': _ref_dict(reference.country_dicts, country_id, lambda: user.country),
+        'school': _ref_dict(reference.school_dicts, school_id, lambda: user.school),
+        'college': _ref_dict(reference.college_dicts, college_id, lambda: user.college),
+        'department': _ref_dict(reference.department_dicts, department_id, lambda: user.department),
+        'created_at': created_at.isoformat(),
+        'updated_at': updated_at.isoformat()
+    }
+
+
+def serialize_user(user, reference=None):
+    """get_user_data와 같은 형태로 직렬화합니다."""
+    reference = reference or get_reference_data()
+    (
+        user_id, _, _,
+        country_id, school_id, college_id, department_id,
+        _, _, deleted_at
+    ) = _user_fields(user)
+
+    if deleted_at:
+        return {
+            'id': user_id,
+            'country': None,
+            'school': None,
+            'college': None,
+            'department': None,
+            'deleted_at': deleted_at.isoformat()
+        }
+
+    return {
+        'id': user_id,
+        'country': _ref_dict(reference.country_dicts, country_id, lambda: user.country),
+        'school': _ref_dict(reference.school_dicts, school_id, lambda: user.school),
+        'college': _ref_dict(reference.college_dicts, college_id, lambda: user.college),
+        'department': _ref_dict(reference.department_dicts, department_id, lambda: user.department),
+        'deleted_at': None
+    }
+
+
+def serialize_post(post, view_count, comment_count, like_count, dislike_count,
+                   user_like_status=None, user_dislike_status=None, reference=None):
+    """get_post_data와 같은 형태로 직렬화합니다."""
+    reference = reference or get_reference_data()
+    (
+        post_id, title, content, category, nickname,
+        school_id, college_id, department_id,
+        created_at, updated_at, deleted_at
+    ) = _post_fields(post)
+
+    deleted = deleted_at is not None
+    user = None if deleted else post.user
+
+    return {
+        'id': post_id,
+        'title': None if deleted else title,
+        'content': None if deleted else content,
+        'category': category,
+        'user': serialize_current_user(user, reference) if user else None,
+        'nickname': None if deleted else nickname,
+        'school': _ref_dict(reference.school_dicts, school_id, lambda: post.school),
+        'college': _ref_dict(reference.college_dicts, college_id, lambda: post.college),
+        'department': _ref_dict(reference.department_dicts, department_id, lambda: post.department),
+        'view_count': view_count,
+        'comment_count': comment_count,
+        'like_count': like_count,
+        'dislike_count': dislike_count,
+        'user_like_status': user_like_status,
+        'user_dislike_status': user_dislike_status,
+        'created_at': created_at.isoformat(),
+        'updated_at': updated_at.isoformat(),
+        'deleted_at': deleted_at.isoformat() if deleted else None
+    }
+
+
+def serialize_post_rows(rows, fields=None):
+    """집계 쿼리 결과 (Post, 조회수, 댓글수, 좋아요, 싫어요, 내 좋아요, 내 싫어요) 행 목록을 직렬화합니다."""
+    reference = get_reference_data()
+    if fields is not None:
+        return [_serialize_partial(_POST_GETTERS, fields, row, reference) for row in rows]
+    return [
+        serialize_post(
+            post,
+            view_count,
+            comment_count,
+            like_count,
+            dislike_count,
+            bool(user_like_status),
+            bool(user_dislike_status),
+            reference=reference
+        )
+        for post, view_count, comment_count, like_count, dislike_count, user_like_status, user_dislike_status
+        in rows
+    ]
+
+
+def serialize_comment(comment, reply_count, reference=None):
+    """get_comment_data와 같은 형태로 직렬화합니다."""
+    (
+        comment_id, content, nickname, parent_id, post_id,
+        created_at, updated_at, deleted_at
+    ) = _comment_fields(comment)
+
+    if deleted_at:
+        return {
+            'id': comment_id,
+            'content': None,
+            'nickname': None,
+            'parent_id': parent_id,
+            'post_id': post_id,
+            'reply_count': reply_count,
+            'created_at': created_at.isoformat(),
+            'updated_at': updated_at.isoformat(),
+            'deleted_at': deleted_at.isoformat()
+        }
+
+    return {
+        'id': comment_id,
+        'content': content,
+        'user': serialize_user(comment.user, reference or get_reference_data()),
+        'nickname': nickname,
+        'parent_id': parent_id,
+        'post_id': post_id,
+        'reply_count': reply_count,
+        'created_at': created_at.isoformat(),
+        'updated_at': updated_at.isoformat(),
+        'deleted_at': None
+    }
+
+
+def serialize_comment_rows(rows, fields=None):
+    """(PostComment, 대댓글 수) 행 목록을 직렬화합니다."""
+    reference = get_reference_data()
+    if fields is not None:
+        return [_serialize_partial(_COMMENT_GETTERS, fields, row, reference) for row in rows]
+    return [serialize_comment(comment, reply_count, reference) for comment, reply_count in rows]
+
+
+# ---------------------------------------------------------------------------
+# Sparse fieldset (?fields=)
+# ---------------------------------------------------------------------------
+
+def _iso(value):
+    return value.isoformat() if value else None
+
+
+# 필드별 값 계산 함수: (행, 삭제 여부, 참조 데이터) -> 값
+# 삭제된 게시글/댓글은 기존 응답과 같이 내용과 작성자 정보를 숨깁니다.
+_POST_GETTERS = {
+    'id': lambda row, deleted, ref: row[0].id,
+    'title': lambda row, deleted, ref: None if deleted else row[0].title,
+    'content': lambda row, deleted, ref: None if deleted else row[0].content,
+    'excerpt': lambda row, deleted, ref: None if deleted else row[0].excerpt,
+    'category': lambda row, deleted, ref: row[0].category,
+    'user': lambda row, deleted, ref: (
+        None if deleted or not row[0].user else serialize_current_user(row[0].user, ref)
+    ),
+    'nickname': lambda row, deleted, ref: None if deleted else row[0].nickname,
+    'school': lambda row, deleted, ref: _ref_dict(ref.school_dicts, row[0].school_id, lambda: row[0].school),
+    'college': lambda row, deleted, ref: _ref_dict(ref.college_dicts, row[0].college_id, lambda: row[0].college),
+    'department': lambda row, deleted, ref: _ref_dict(
+        ref.department_dicts, row[0].department_id, lambda: row[0].department
+    ),
+    'view_count': lambda row, deleted, ref: row[1],
+    'comment_count': lambda row, deleted, ref: row[2],
+    'like_count': lambda row, deleted, ref: row[3],
+    'dislike_count': lambda row, deleted, ref: row[4],
+    'user_like_status': lambda row, deleted, ref: bool(row[5]),
+    'user_dislike_status': lambda row, deleted, ref: bool(row[6]),
+    'created_at': lambda row, deleted, ref: row[0].created_at.isoformat(),
+    'updated_at': lambda row, deleted, ref: row[0].updated_at.isoformat(),
+    'deleted_at': lambda row, deleted, ref: _iso(row[0].deleted_at),
+}
+
+_COMMENT_GETTERS = {
+    'id': lambda row, deleted, ref: row[0].id,
+    'content': lambda row, deleted, ref: None if deleted else row[0].content,
+    'user': lambda row, deleted, ref: serialize_user(row[0].user, ref),
+    'nickname': lambda row, deleted, ref: None if deleted else row[0].nickname,
+    'parent_id': lambda row, deleted, ref: row[0].parent_id,
+    'post_id': lambda row, deleted, ref: row[0].post_id,
+    'reply_count': lambda row, deleted, ref: row[1],
+    'created_at': lambda row, deleted, ref: row[0].created_at.isoformat(),
+    'updated_at': lambda row, deleted, ref: row[0].updated_at.isoformat(),
+    'deleted_at': lambda row, deleted, ref: _iso(row[0].deleted_at),
+}
+
+POST_FIELDS = tuple(_POST_GETTERS)
+
+# 피드 목록 기본 필드: 본문 전체 대신 미리보기만 내려줌
+FEED_DEFAULT_FIELDS = tuple(field for field in POST_FIELDS if field != 'content')
+COMMENT_FIELDS = tuple(_COMMENT_GETTERS)
+
+# 필드를 만들기 위해 읽어야 하는 컬럼 (id, deleted_at은 항상 읽음)
+_POST_FIELD_COLUMNS = {
+    'title': (Post.title,),
+    'content': (Post.content,),
+    'excerpt': (Post.excerpt,),
+    'category': (Post.category,),
+    'user': (Post.user_id,),
+    'nickname': (Post.nickname,),
+    'school': (Post.school_id,),
+    'college': (Post.college_id,),
+    'department': (Post.department_id,),
+    'created_at': (Post.created_at,),
+    'updated_at': (Post.updated_at,),
+}
+
+_COMMENT_FIELD_COLUMNS = {
+    'content': (PostComment.content,),
+    'user': (PostComment.user_id,),
+    'nickname': (PostComment.nickname,),
+    'parent_id': (PostComment.parent_id,),
+    'post_id': (PostComment.post_id,),
+    'created_at': (PostComment.created_at,),
+    'updated_at': (PostComment.updated_at,),
+}
+
+
+def _serialize_partial(getters, fields, row, reference):
+    deleted = row[0].deleted_at is not None
+    data = {}
+    for field in fields:
+        # 삭제된 댓글은 기존 응답과 같이 user 키를 포함하지 않음
+        if deleted and field == 'user' and getters is _COMMENT_GETTERS:
+            continue
+        data[field] = getters[field](row, deleted, reference)
+    return data
+
+
+def parse_fields(raw, allowed):
+    """?fields=a,b,c 값을 검사해 응답 필드 순서대로 정렬된 튜플을 반환합니다.
+
+    값이 없으면 전체 필드를 의미하는 None을 반환합니다.
+    """
+    if not raw:
+        return None
+
+    requested = {field.strip() for field in raw.split(',') if field.strip()}
+    unknown = requested - set(allowed)
+    if unknown:
+        raise ValueError(f"알 수 없는 필드입니다: {', '.join(sorted(unknown))}")
+
+    return tuple(field for field in allowed if field in requested)
+
+
+def _load_options(entity, field_columns, relationship, fields):
+    if fields is None:
+        return [selectinload(relationship)]
+
+    columns = [entity.id, entity.deleted_at]
+    for field in fields:
+        columns.extend(field_columns.get(field, ()))
+
+    options = [load_only(*columns)]
+    if 'user' in fields:
+        options.append(selectinload(relationship))
+    return options
+
+
+def post_load_options(fields):
+    """요청된 필드에 필요한 Post 컬럼만 읽도록 하는 로더 옵션을 반환합니다."""
+    return _load_options(Post, _POST_FIELD_COLUMNS, Post.user, fields)
+
+
+def comment_load_options(fields):
+    """요청된 필드에 필요한 PostComment 컬럼만 읽도록 하는 로더 옵션을 반환합니다."""
+    return _load_options(PostComment, _COMMENT_FIELD_COLUMNS, PostComment.user, fields)
@@ -0,0 +1,211 @@
+"""느린 쿼리 기록
+
+SLOW_QUERY_THRESHOLD_MS를 넘은 SQL을 정규화한 문장, 지문(fingerprint), 가려진 바인드 값, 엔드포인트와 함께
+SLOW_QUERY_LOG_PATH에 JSONL로 기록합니다. 지문마다 처음 한 번은 별도 커넥션에서 EXPLAIN(실행하지 않음)으로
+실행 계획을 받아 함께 기록합니다. EXPLAIN은 백그라운드 스레드에서 하므로 요청 응답 시간에 영향을 주지 않습니다.
+
+`flask slow-query-report`로 지문별로 묶어 횟수, 합계/최대 시간, 실행 계획을 확인합니다.
+
+기록 형식:
+    {"type": "query", "ts": ..., "fingerprint": "3f2a...", "duration_ms": 812.4, "endpoint": "post.get_post",
+     "params": {"id_1": 12, "search": "<str:4>"}, "sql": "SELECT ... WHERE posts.id = ?"}   # sql은 프로세스에서 처음 볼 때만
+    {"type": "plan", "ts": ..., "fingerprint": "3f2a...", "plan": ["Aggregate ...", "..."]}
+"""
+import hashlib
+import logging
+import queue
+import re
+import threading
+import time
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from flask import has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from src.utils.jsonl_log import JsonlWriter
+
+from src.config.env import (
+    SLOW_QUERY_THRESHOLD_MS,
+    SLOW_QUERY_LOG_PATH,
+    SLOW_QUERY_EXPLAIN
+)
+
+logger = logging.getLogger('slow_query')
+
+# 지문별 정보를 무한히 쌓지 않도록 제한
+MAX_FINGERPRINTS = 10000
+
+EXPLAIN_PREFIX = {
+    'postgresql': 'EXPLAIN (ANALYZE false) ',
+    'sqlite': 'EXPLAIN QUERY PLAN ',
+}
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r'\b\d+(?:\.\d+)?\b')
+_PLACEHOLDER = re.compile(r'%\(\w+\)s|%s|\?')
+_IN_LIST = re.compile(r'\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)', re.IGNORECASE)
+_WHITESPACE = re.compile(r'\s+')
+_EXPLAINABLE = re.compile(r'^\s*(SELECT|INSERT|UPDATE|DELETE|WITH)\b', re.IGNORECASE)
+
+
+def normalize_sql(statement):
+    """리터럴과 바인드 자리를 '?'로 바꾸고 IN 목록과 공백을 정리합니다."""
+    normalized = _STRING_LITERAL.sub('?', statement)
+    normalized = _PLACEHOLDER.sub('?', normalized)
+    normalized = _NUMBER_LITERAL.sub('?', normalized)
+    normalized = _IN_LIST.sub('IN (...)', normalized)
+    return _WHITESPACE.sub(' ', normalized).strip()
+
+
+def fingerprint(normalized):
+    return hashlib.sha1(normalized.encode('utf-8')).hexdigest()[:16]
+
+
+def _redact(value):
+    # 숫자, 날짜, 불리언, NULL은 그대로 두고 문자열/바이트는 길이만 남김
+    if value is None or isinstance(value, (bool, int, float, Decimal, date, datetime)):
+        return value
+    if isinstance(value, str):
+        return f'<str:{len(value)}>'
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return f'<bytes:{len(value)}>'
+    if isinstance(value, (list, tuple)):
+        return [_redact(item) for item in value]
+    return f'<{type(value).__name__}>'
+
+
+def redact_params(parameters, executemany=False):
+    """바인드 값을 가립니다. executemany면 첫 행과 행 수만 남깁니다."""
+    if executemany:
+        rows = list(parameters or [])
+        return {'rows': len(rows), 'first': redact_params(rows[0]) if rows else None}
+    if isinstance(parameters, dict):
+        return {key: _redact(value) for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [_redact(value) for value in parameters]
+    return _redact(parameters)
+
+
+class SlowQueryRecorder:
+    """느린 쿼리를 기록하고 지문마다 한 번씩 실행 계획을 받습니다."""
+
+    def __init__(self, threshold_ms, writer, explain=True):
+        self.threshold = threshold_ms / 1000
+        self.writer = writer
+        self.explain = explain
+        self._lock = threading.Lock()
+        self._seen = set()
+        self._explained = set()
+        self._queue = queue.Queue(maxsize=100)
+        self._worker = None
+
+    def _first_time(self, collection, key, when_full):
+        """처음 보는 지문이면 True. 기억할 수 있는 지문 수를 넘으면 when_full을 반환합니다."""
+        with self._lock:
+            if key in collection:
+                return False
+            if len(collection) >= MAX_FINGERPRINTS:
+                return when_full
+            collection.add(key)
+            return True
+
+    def record(self, conn, statement, parameters, executemany, elapsed):
+        normalized = normalize_sql(statement)
+        key = fingerprint(normalized)
+        entry = {
+            'type': 'query',
+            'ts': datetime.now(timezone.utc).isoformat(),
+            'fingerprint': key,
+            'duration_ms': round(elapsed * 1000, 3),
+            'endpoint': request.endpoint if has_request_context() else None,
+            'params': redact_params(parameters, executemany)
+        }
+        # 더 기억할 수 없으면 매번 SQL을 남김 (보고서에서 문장을 볼 수 있도록)
+        if self._first_time(self._seen, key, when_full=True):
+            entry['sql'] = normalized
+        self.writer.write(entry)
+
+        prefix = EXPLAIN_PREFIX.get(conn.dialect.name)
+        explainable = prefix and not executemany and _EXPLAINABLE.match(statement)
+        if self.explain and explainable and self._first_time(self._explained, key, when_full=False):
+            self._start_worker()
+            try:
+                self._queue.put_nowait((conn.engine, prefix, key, statement, parameters))
+            except queue.Full:
+                with self._lock:
+                    self._explained.discard(key)
+
+    def _start_worker(self):
+        if self._worker is None:
+            with self._lock:
+                if self._worker is None:
+                    self._worker = threading.Thread(target=self._explain_loop, name='slow-query-explain', daemon=True)
+                    self._worker.start()
+
+    def _explain_loop(self):
+        while True:
+            engine, prefix, key, statement, parameters = self._queue.get()
+            try:
+                plan = self._explain(engine, prefix, statement, parameters)
+                self.writer.write({
+                    'type': 'plan',
+                    'ts': datetime.now(timezone.utc).isoformat(),
+                    'fingerprint': key,
+                    'plan': plan
+                })
+            except Exception:
+                logger.exception('실행 계획 조회 실패 (%s)', key)
+
+    @staticmethod
+    def _explain(engine, prefix, statement, parameters):
+        # 요청과 별개인 커넥션에서 실행 (EXPLAIN 자체는 기록하지 않음)
+        with engine.connect() as connection:
+            connection.info['skip_slow_query'] = True
+            try:
+                result = connection.exec_driver_sql(prefix + statement, parameters or ())
+                return [' | '.join(str(column) for column in row) for row in result]
+            finally:
+                connection.rollback()
+                connection.info.pop('skip_slow_query', None)
+
+
+_recorder = None
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault('slow_query_started', []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info['slow_query_started'].pop()
+    if elapsed < _recorder.threshold or conn.info.get('skip_slow_query'):
+        return
+    try:
+        _recorder.record(conn, statement, parameters, executemany, elapsed)
+    except Exception:
+        # 기록 실패가 쿼리 실행에 영향을 주지 않도록 함
+        logger.exception('느린 쿼리 기록 실패')
+
+
+def _handle_error(exception_context):
+    started = exception_context.connection.info.get('slow_query_started') if exception_context.connection else None
+    if started:
+        started.pop()
+
+
+def init_slow_query_log(app):
+    """느린 쿼리 기록을 등록합니다. 기준 시간이 0이면 아무것도 등록하지 않습니다."""
+    global _recorder
+    if SLOW_QUERY_THRESHOLD_MS <= 0:
+        return
+
+    if _recorder is None:
+        _recorder = SlowQueryRecorder(
+            SLOW_QUERY_THRESHOLD_MS, JsonlWriter(SLOW_QUERY_LOG_PATH, 'slow_query'), SLOW_QUERY_EXPLAIN
+        )
+
+    # 모든 엔진에 한 번만 등록
+    if not event.contains(Engine, 'before_cursor_execute', _before_cursor_execute):
+        event.listen(Engine, 'before_cursor_execute', _before_cursor_execute)
+        event.listen(Engine, 'after_cursor_execute', _after_cursor_execute)
+        event.listen(Engine, 'handle_error', _handle_error)
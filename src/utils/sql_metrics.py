@@ -0,0 +1,170 @@
+"""요청 단위 SQL 계측
+
+SQLAlchemy 커서 실행 이벤트로 요청마다 쿼리 수, DB 시간, 가장 느린 쿼리를 기록하고
+- SQL_SERVER_TIMING이 켜져 있으면 Server-Timing 응답 헤더로 내려주며 (로컬 측정용)
+- 엔드포인트별 누적 요약(sql_summary)을 유지합니다.
+요약은 /metrics(요청당 최대 쿼리 수, 가장 느린 쿼리 시간)와 /debug/sql(가장 느린 SQL 문장 포함)로
+내보내며, 둘 다 METRICS_TOKEN이 있을 때만 열립니다.
+이벤트마다 하는 일은 시간 측정과 덧셈뿐이므로 운영 환경에서도 켜 둘 수 있습니다.
+"""
+import threading
+import time
+from flask import g, has_app_context, jsonify, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from src.utils.metrics import require_metrics_token
+
+from src.config.env import (
+    SQL_METRICS_ENABLED,
+    SQL_SERVER_TIMING,
+    METRICS_TOKEN
+)
+
+
+class RequestSQLStats:
+    """한 요청 동안 실행된 SQL 통계입니다."""
+    __slots__ = ('count', 'total', 'slowest', 'slowest_statement')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.slowest = 0.0
+        self.slowest_statement = None
+
+    def record(self, statement, elapsed):
+        self.count += 1
+        self.total += elapsed
+        if elapsed > self.slowest:
+            self.slowest = elapsed
+            self.slowest_statement = statement
+
+    def merge(self, other):
+        """다른 스레드에서 모은 통계를 합칩니다. (run_parallel)"""
+        self.count += other.count
+        self.total += other.total
+        if other.slowest > self.slowest:
+            self.slowest = other.slowest
+            self.slowest_statement = other.slowest_statement
+
+
+class EndpointSQLSummary:
+    """엔드포인트별 요청 수, 쿼리 수, DB 시간 누적 요약입니다."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints = {}
+
+    def record(self, endpoint, stats):
+        with self._lock:
+            entry = self._endpoints.get(endpoint)
+            if entry is None:
+                entry = self._endpoints[endpoint] = {
+                    'requests': 0,
+                    'statements': 0,
+                    'max_statements': 0,
+                    'db_time': 0.0,
+                    'slowest': 0.0,
+                    'slowest_statement': None
+                }
+            entry['requests'] += 1
+            entry['statements'] += stats.count
+            entry['db_time'] += stats.total
+            if stats.count > entry['max_statements']:
+                entry['max_statements'] = stats.count
+            if stats.slowest > entry['slowest']:
+                entry['slowest'] = stats.slowest
+                entry['slowest_statement'] = stats.slowest_statement
+
+    def snapshot(self):
+        """엔드포인트별 요약을 반환합니다. (요청당 평균 쿼리 수/DB 시간 포함)"""
+        with self._lock:
+            endpoints = {endpoint: dict(entry) for endpoint, entry in self._endpoints.items()}
+        for entry in endpoints.values():
+            entry['avg_statements'] = entry['statements'] / entry['requests']
+            entry['avg_db_time'] = entry['db_time'] / entry['requests']
+        return endpoints
+
+    def clear(self):
+        with self._lock:
+            self._endpoints.clear()
+
+
+sql_summary = EndpointSQLSummary()
+
+
+def get_request_sql_stats():
+    """현재 요청의 SQL 통계를 반환합니다. 요청 밖이거나 계측이 꺼져 있으면 None을 반환합니다."""
+    if not has_app_context():
+        return None
+    return g.get('sql_stats')
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault('query_started', []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info['query_started'].pop()
+    stats = get_request_sql_stats()
+    if stats is not None:
+        stats.record(statement, elapsed)
+
+
+def _handle_error(exception_context):
+    # 실패한 쿼리의 시작 시각 제거
+    started = exception_context.connection.info.get('query_started') if exception_context.connection else None
+    if started:
+        started.pop()
+
+
+def _start_request():
+    g.sql_stats = RequestSQLStats()
+    g.request_started = time.perf_counter()
+
+
+def _finish_request(response):
+    stats = g.pop('sql_stats', None)
+    if stats is None:
+        return response
+
+    sql_summary.record(request.endpoint or 'unknown', stats)
+
+    if SQL_SERVER_TIMING:
+        total = time.perf_counter() - g.request_started
+        response.headers.add(
+            'Server-Timing',
+            f'db;dur={stats.total * 1000:.2f};desc="{stats.count} queries", '
+            f'db-slowest;dur={stats.slowest * 1000:.2f}, '
+            f'app;dur={total * 1000:.2f}'
+        )
+    return response
+
+
+def sql_summary_view():
+    """엔드포인트별 SQL 요약을 DB 시간이 큰 순서로 반환합니다."""
+    denied = require_metrics_token()
+    if denied:
+        return denied
+    endpoints = [
+        {'endpoint': endpoint, **entry}
+        for endpoint, entry in sorted(sql_summary.snapshot().items(), key=lambda item: -item[1]['db_time'])
+    ]
+    return jsonify({'endpoints': endpoints})
+
+
+def init_sql_metrics(app):
+    """요청 단위 SQL 계측을 등록합니다. /debug/sql은 METRICS_TOKEN이 있을 때만 등록합니다."""
+    if not SQL_METRICS_ENABLED:
+        return
+
+    # 모든 엔진에 한 번만 등록
+    if not event.contains(Engine, 'before_cursor_execute', _before_cursor_execute):
+        event.listen(Engine, 'before_cursor_execute', _before_cursor_execute)
+        event.listen(Engine, 'after_cursor_execute', _after_cursor_execute)
+        event.listen(Engine, 'handle_error', _handle_error)
+
+    app.before_request(_start_request)
+    app.after_request(_finish_request)
+
+    if METRICS_TOKEN:
+        app.add_url_rule('/debug/sql', 'sql_summary', sql_summary_view, methods=['GET'])
@@ -0,0 +1,90 @@
+"""운영 트래픽 샘플 수집
+
+TRAFFIC_CAPTURE_RATE 비율의 요청을 한 줄에 하나씩 JSON으로 기록합니다. (benchmarks/traffic_replay.py로 재생)
+요청 본문, 토큰, 사용자 ID는 기록하지 않고 인증 여부(anonymous/user/invalid)만 남깁니다.
+쿼리 파라미터는 ID/페이지/카테고리/필드 목록만 그대로 남기고, 검색어 같은 자유 입력은 길이만 남깁니다.
+
+기록 형식:
+    {"ts": "2025-01-01T00:00:00.000000+00:00", "method": "GET", "endpoint": "post.get_post",
+     "rule": "/api/v1/posts/<int:post_id>", "view_args": {"post_id": 12}, "path": "/api/v1/posts/12",
+     "query": {"page": ["1"], "search": ["<str:4>"]}, "auth": "user", "status": 200, "duration_ms": 12.3}
+"""
+import logging
+import random
+import time
+from datetime import datetime, timezone
+import jwt
+from flask import g, request
+from src.utils.jsonl_log import JsonlWriter
+
+from src.config.env import (
+    SECRET_KEY,
+    TRAFFIC_CAPTURE_RATE,
+    TRAFFIC_CAPTURE_PATH
+)
+
+logger = logging.getLogger('traffic')
+
+# 값을 그대로 기록하는 쿼리 파라미터 (나머지는 '<str:길이>'로 가림)
+PLAIN_QUERY_PARAMS = frozenset({
+    'page', 'per_page', 'category', 'fields', 'country_id', 'school_id', 'college_id', 'department_id'
+})
+
+
+def _auth_class():
+    if 'Authorization' not in request.headers:
+        return 'anonymous'
+    # 서명과 만료만 확인 (사용자/폐기 목록 조회 없음)
+    token = request.headers['Authorization'].partition(' ')[2]
+    try:
+        jwt.decode(token, SECRET_KEY, algorithms=["HS256"])
+    except jwt.InvalidTokenError:
+        return 'invalid'
+    return 'user'
+
+
+def _redacted_query():
+    return {
+        name: values if name in PLAIN_QUERY_PARAMS else [f'<str:{len(value)}>' for value in values]
+        for name, values in request.args.lists()
+    }
+
+
+def _start_capture():
+    if random.random() < TRAFFIC_CAPTURE_RATE:
+        g.capture_started = time.perf_counter()
+
+
+def _finish_capture(writer):
+    def finish(response):
+        started = g.pop('capture_started', None)
+        if started is None:
+            return response
+        try:
+            writer.write({
+                'ts': datetime.now(timezone.utc).isoformat(),
+                'method': request.method,
+                'endpoint': request.endpoint,
+                'rule': request.url_rule.rule if request.url_rule else None,
+                'view_args': request.view_args or {},
+                'path': request.path,
+                'query': _redacted_query(),
+                'auth': _auth_class(),
+                'status': response.status_code,
+                'duration_ms': round((time.perf_counter() - started) * 1000, 3)
+            })
+        except Exception:
+            # 수집 실패가 응답에 영향을 주지 않도록 함
+            logger.exception('트래픽 기록 실패')
+        return response
+    return finish
+
+
+def init_traffic_capture(app):
+    """트래픽 샘플 수집을 등록합니다. 비율이 0이면 아무 훅도 등록하지 않습니다."""
+    if TRAFFIC_CAPTURE_RATE <= 0:
+        return
+
+    writer = JsonlWriter(TRAFFIC_CAPTURE_PATH, 'traffic')
+    app.before_request(_start_capture)
+    app.after_request(_finish_capture(writer))
@@ -0,0 +1,97 @@
+from calendar import timegm
+from sqlalchemy.orm import joinedload
+from src.models import db, User
+from src.utils.cache import TTLCache
+
+from src.config.env import (
+    USER_CACHE_TTL,
+    USER_CACHE_MAXSIZE
+)
+
+
+def user_version(updated_at):
+    """사용자 행의 버전 스탬프(updated_at의 밀리초 단위 UTC 타임스탬프)를 반환합니다."""
+    return timegm(updated_at.utctimetuple()) * 1000 + updated_at.microsecond // 1000
+
+
+class _Ref:
+    """국가/학교/단과대/학과의 id, name(, code) 스냅샷입니다."""
+    __slots__ = ('id', 'name', 'code')
+
+    def __init__(self, obj):
+        self.id = obj.id
+        self.name = obj.name
+        self.code = getattr(obj, 'code', None)
+
+
+class AuthUser:
+    """인증과 응답 포맷팅에 필요한 사용자 정보의 스냅샷입니다.
+
+    세션에 묶이지 않으므로 요청 간에 캐시해도 지연 로딩이 발생하지 않습니다.
+    """
+    __slots__ = (
+        'id', 'email', 'name', 'register_type',
+        'country_id', 'school_id', 'college_id', 'department_id',
+        'country', 'school', 'college', 'department',
+        'created_at', 'updated_at', 'deleted_at'
+    )
+
+    def __init__(self, user):
+        self.id = user.id
+        self.email = user.email
+        self.name = user.name
+        self.register_type = user.register_type
+        self.country_id = user.country_id
+        self.school_id = user.school_id
+        self.college_id = user.college_id
+        self.department_id = user.department_id
+        self.country = _Ref(user.country)
+        self.school = _Ref(user.school)
+        self.college = _Ref(user.college)
+        self.department = _Ref(user.department)
+        self.created_at = user.created_at
+        self.updated_at = user.updated_at
+        self.deleted_at = user.deleted_at
+
+    @property
+    def is_deleted(self):
+        return self.deleted_at is not None
+
+    @property
+    def version(self):
+        return user_version(self.updated_at)
+
+    def __repr__(self):
+        return f'<AuthUser {self.id}>'
+
+
+user_cache = TTLCache(maxsize=USER_CACHE_MAXSIZE, ttl=USER_CACHE_TTL)
+
+
+def get_auth_user(user_id, min_version=None):
+    """캐시에서 사용자 스냅샷을 조회하고, 없으면 DB에서 한 번의 쿼리로 불러옵니다.
+
+    min_version이 주어지면 캐시된 스냅샷이 그보다 오래된 경우 DB에서 다시 불러옵니다.
+    """
+    auth_user = user_cache.get(user_id)
+    if auth_user is not None:
+        if min_version is None or auth_user.version >= min_version:
+            return auth_user
+
+    user = db.session.get(User, user_id, options=[
+        joinedload(User.country),
+        joinedload(User.school),
+        joinedload(User.college),
+        joinedload(User.department)
+    ])
+    if not user:
+        return None
+
+    auth_user = AuthUser(user)
+    user_cache.set(user_id, auth_user)
+    return auth_user
+
+
+def invalidate_user(user_id):
+    """사용자 정보가 변경되었을 때 캐시에서 제거합니다."""
+    user_cache.delete(user_id)
@@ -0,0 +1,73 @@
+import os
+import sys
+import tempfile
+
+# 설정 모듈을 임포트하기 전에 테스트용 환경 변수 지정
+_db_dir = tempfile.mkdtemp(prefix='cuty-test-')
+os.environ.update({
+    'ENV': 'test',
+    'FAST_START': 'True',  # app 모듈 임포트 시 앱을 만들지 않음
+    'DATABASE_URL': f'sqlite:///{_db_dir}/test.db',
+    'SECRET_KEY': 'test-secret-key',
+    'PASSWORD_HASH_METHOD': 'pbkdf2:sha256:1000',
+    'COMPRESSION_ENABLED': 'False',
+})
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from app import create_app
+from src.models import db, Country, School, College, Department, Nickname
+
+
+@pytest.fixture
+def app():
+    from src.utils.user_cache import user_cache
+    from src.utils.reference_cache import reference_cache
+    from src.utils.revocation import revocation_list
+
+    app = create_app('test')
+    app.config['TESTING'] = True
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        country = Country(name='대한민국', code='KR')
+        db.session.add(country)
+        db.session.flush()
+        school = School(name='서울대학교', country_id=country.id)
+        db.session.add(school)
+        db.session.flush()
+        college = College(name='공과대학', school_id=school.id)
+        db.session.add(college)
+        db.session.flush()
+        db.session.add(Department(name='컴퓨터공학부', college_id=college.id))
+        db.session.add_all([Nickname(nickname=f'다람쥐{i}') for i in range(20)])
+        db.session.commit()
+
+    # 모듈 단위 캐시는 테스트마다 비움
+    user_cache.clear()
+    reference_cache.invalidate()
+    revocation_list.clear()
+    yield app
+    with app.app_context():
+        db.session.remove()
+        db.engine.dispose()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+def register(client, email='user@example.com', password='password1234'):
+    """사용자를 가입시키고 인증 헤더를 반환합니다."""
+    response = client.post('/api/v1/auth/register', json={
+        'email': email, 'password': password, 'name': '홍길동',
+        'country_id': 1, 'school_id': 1, 'college_id': 1, 'department_id': 1
+    })
+    assert response.status_code == 201, response.get_json()
+    return {'Authorization': f"Bearer {response.get_json()['access_token']}"}
+
+
+@pytest.fixture
+def auth_headers(client):
+    return register(client)
@@ -0,0 +1,31 @@
+import os
+import subprocess
+import sys
+import click
+from app import create_app
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _import_env(**environ):
+    env = {key: value for key, value in os.environ.items() if key not in ('SECRET_KEY', 'ENV')}
+    env.update(environ)
+    return subprocess.run(
+        [sys.executable, '-c', 'import src.config.env'], cwd=ROOT, env=env, capture_output=True, text=True
+    )
+
+
+def test_secret_key_is_required_outside_local():
+    result = _import_env(ENV='prod', FAST_START='True')
+    assert result.returncode != 0
+    assert 'SECRET_KEY' in result.stderr
+
+    assert _import_env(ENV='prod', SECRET_KEY='k').returncode == 0
+    assert _import_env(ENV='local').returncode == 0
+
+
+def test_fast_start_registers_migrate_only_under_cli():
+    assert 'migrate' not in create_app('test').extensions
+
+    with click.Context(click.Command('db')):
+        assert 'migrate' in create_app('test').extensions
@@ -0,0 +1,39 @@
+import pytest
+from src.config import database
+from src.config.database import DatabaseConfig
+from src.utils.db_pool import TimedNullPool, TimedQueuePool
+
+URL = 'postgresql://db.example.com:5432/cuty'
+
+
+@pytest.fixture
+def serverless(monkeypatch):
+    monkeypatch.setattr(database, 'DB_POOL_MODE', 'serverless')
+    monkeypatch.setattr(database, 'DB_POOL_MODE_EXPLICIT', False)
+    monkeypatch.setattr(database, 'DB_SERVERLESS_POOL_SIZE', None)
+    return monkeypatch
+
+
+def test_serverless_default_without_pooler_uses_small_fixed_pool(serverless):
+    options = DatabaseConfig.get_engine_options(URL)
+    assert options['poolclass'] is TimedQueuePool
+    assert options['pool_size'] == 1
+    assert options['max_overflow'] == 0
+
+
+@pytest.mark.parametrize('url', [
+    'postgresql://app.proxy-abc123.ap-northeast-2.rds.amazonaws.com:5432/cuty',
+    'postgresql://pgbouncer:6432/cuty',
+])
+def test_serverless_default_behind_pooler_uses_null_pool(serverless, url):
+    assert DatabaseConfig.get_engine_options(url)['poolclass'] is TimedNullPool
+
+
+def test_explicit_serverless_mode_uses_null_pool(serverless):
+    serverless.setattr(database, 'DB_POOL_MODE_EXPLICIT', True)
+    assert DatabaseConfig.get_engine_options(URL)['poolclass'] is TimedNullPool
+
+
+def test_explicit_serverless_pool_size(serverless):
+    serverless.setattr(database, 'DB_SERVERLESS_POOL_SIZE', 2)
+    assert DatabaseConfig.get_engine_options(URL)['pool_size'] == 2
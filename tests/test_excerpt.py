@@ -0,0 +1,37 @@
+from src.utils.formatters import EXCERPT_MAX_LENGTH, make_excerpt
+from tests.conftest import register
+
+
+def test_excerpt_joins_first_non_blank_lines():
+    assert make_excerpt('첫 줄\n\n  둘째   줄  \n셋째 줄') == '첫 줄 둘째 줄'
+
+
+def test_excerpt_is_truncated_with_ellipsis():
+    excerpt = make_excerpt('가' * 500)
+
+    assert len(excerpt) == EXCERPT_MAX_LENGTH
+    assert excerpt.endswith('…')
+
+
+def test_excerpt_of_short_or_empty_content():
+    assert make_excerpt('짧은 글') == '짧은 글'
+    assert make_excerpt('') == ''
+    assert make_excerpt(None) == ''
+
+
+def test_feed_returns_excerpt_instead_of_content(client):
+    headers = register(client)
+    content = '오늘 학식 메뉴\n돈가스\n김치찌개\n' + '후기 ' * 100
+    response = client.post('/api/v1/posts', headers=headers, json={
+        'title': '학식', 'content': content, 'category': '자유'
+    })
+    post_id = response.get_json()['id']
+
+    post = client.get('/api/v1/posts', headers=headers).get_json()['posts'][0]
+    assert post['excerpt'] == '오늘 학식 메뉴 돈가스'
+    assert 'content' not in post
+
+    # 수정하면 미리보기도 다시 계산
+    client.put(f'/api/v1/posts/{post_id}', headers=headers, json={'content': '바뀐 본문'})
+    post = client.get('/api/v1/posts', headers=headers).get_json()['posts'][0]
+    assert post['excerpt'] == '바뀐 본문'
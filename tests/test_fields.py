@@ -0,0 +1,54 @@
+import pytest
+from src.utils.serializers import COMMENT_FIELDS, POST_FIELDS, parse_fields
+from tests.conftest import register
+
+
+def test_parse_fields_orders_by_allowed_fields():
+    assert parse_fields('title, id,,title', POST_FIELDS) == ('id', 'title')
+    assert parse_fields('', POST_FIELDS) is None
+    assert parse_fields(None, COMMENT_FIELDS) is None
+
+
+def test_parse_fields_rejects_unknown_fields():
+    with pytest.raises(ValueError, match='password'):
+        parse_fields('id,password', POST_FIELDS)
+
+
+@pytest.fixture
+def post_with_comment(client):
+    headers = register(client)
+    post_id = client.post('/api/v1/posts', headers=headers, json={
+        'title': '제목', 'content': '본문', 'category': '자유'
+    }).get_json()['id']
+    client.post(f'/api/v1/posts/{post_id}/comments', headers=headers, json={'content': '댓글'})
+    client.post(f'/api/v1/posts/{post_id}/like', headers=headers)
+    return post_id, headers
+
+
+def test_post_list_sparse_fields_match_full_response(client, post_with_comment):
+    _, headers = post_with_comment
+    full = client.get('/api/v1/posts?fields=' + ','.join(POST_FIELDS), headers=headers).get_json()['posts'][0]
+
+    response = client.get('/api/v1/posts?fields=like_count,title,id,school', headers=headers)
+
+    assert response.status_code == 200
+    post = response.get_json()['posts'][0]
+    assert list(post) == ['id', 'title', 'school', 'like_count']
+    assert post == {field: full[field] for field in post}
+    assert post['like_count'] == 1
+
+
+def test_comment_list_sparse_fields(client, post_with_comment):
+    post_id, _ = post_with_comment
+
+    response = client.get(f'/api/v1/posts/{post_id}/comments?fields=content,reply_count')
+
+    assert response.status_code == 200
+    assert response.get_json()['comments'] == [{'content': '댓글', 'reply_count': 0}]
+
+
+def test_unknown_field_is_bad_request(client, post_with_comment):
+    post_id, _ = post_with_comment
+
+    assert client.get('/api/v1/posts?fields=id,secret').status_code == 400
+    assert client.get(f'/api/v1/posts/{post_id}/comments?fields=secret').status_code == 400
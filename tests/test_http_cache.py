@@ -0,0 +1,78 @@
+from src.models import db, Post
+from tests.conftest import register
+
+
+def _create_post(client, headers):
+    response = client.post('/api/v1/posts', headers=headers, json={
+        'title': '제목', 'content': '본문입니다', 'category': '자유'
+    })
+    assert response.status_code == 201, response.get_json()
+    return response.get_json()['id']
+
+
+def test_post_detail_returns_304_for_matching_etag(client, auth_headers):
+    post_id = _create_post(client, auth_headers)
+    client.get(f'/api/v1/posts/{post_id}', headers=auth_headers)
+
+    first = client.get(f'/api/v1/posts/{post_id}', headers=auth_headers)
+    assert first.status_code == 200
+    etag = first.headers['ETag']
+
+    second = client.get(f'/api/v1/posts/{post_id}', headers={**auth_headers, 'If-None-Match': etag})
+    assert second.status_code == 304
+    assert second.headers['ETag'] == etag
+    assert second.data == b''
+
+
+def test_views_change_etag_without_writing_post_row(app, client, auth_headers):
+    post_id = _create_post(client, auth_headers)
+    first = client.get(f'/api/v1/posts/{post_id}', headers=auth_headers)
+    # 방금 기록한 조회는 검증자에 들어 있지 않으므로 한 번은 다시 200
+    second = client.get(f'/api/v1/posts/{post_id}', headers={**auth_headers, 'If-None-Match': first.headers['ETag']})
+    assert second.status_code == 200
+    etag = second.headers['ETag']
+    assert client.get(f'/api/v1/posts/{post_id}', headers={**auth_headers, 'If-None-Match': etag}).status_code == 304
+
+    # 다른 사용자와 비로그인 사용자의 첫 조회
+    other_headers = register(client, email='other@example.com')
+    assert client.get(f'/api/v1/posts/{post_id}', headers=other_headers).status_code == 200
+    assert client.get(f'/api/v1/posts/{post_id}').status_code == 200
+
+    with app.app_context():
+        assert db.session.get(Post, post_id).stats_version == 0
+    response = client.get(f'/api/v1/posts/{post_id}', headers={**auth_headers, 'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.get_json()['view_count'] == 3
+    assert response.headers['ETag'] != etag
+
+
+def test_like_changes_post_etag(client, auth_headers):
+    post_id = _create_post(client, auth_headers)
+    etag = client.get(f'/api/v1/posts/{post_id}', headers=auth_headers).headers['ETag']
+
+    assert client.post(f'/api/v1/posts/{post_id}/like', headers=auth_headers).status_code in (200, 201)
+
+    response = client.get(f'/api/v1/posts/{post_id}', headers={**auth_headers, 'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+    assert response.get_json()['like_count'] == 1
+
+
+def test_comments_etag_changes_after_new_comment(client, auth_headers):
+    post_id = _create_post(client, auth_headers)
+    etag = client.get(f'/api/v1/posts/{post_id}/comments').headers['ETag']
+    assert client.get(f'/api/v1/posts/{post_id}/comments', headers={'If-None-Match': etag}).status_code == 304
+
+    response = client.post(f'/api/v1/posts/{post_id}/comments', headers=auth_headers, json={'content': '댓글'})
+    assert response.status_code == 201, response.get_json()
+
+    response = client.get(f'/api/v1/posts/{post_id}/comments', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+
+
+def test_current_user_etag(client, auth_headers):
+    etag = client.get('/api/v1/users/me', headers=auth_headers).headers['ETag']
+
+    response = client.get('/api/v1/users/me', headers={**auth_headers, 'If-None-Match': etag})
+    assert response.status_code == 304
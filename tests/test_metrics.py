@@ -0,0 +1,38 @@
+import threading
+from flask import Flask
+from src.utils import metrics
+from src.utils.metrics import RequestMetrics
+
+
+def _record_in_thread(request_metrics):
+    thread = threading.Thread(target=request_metrics.record, args=('post.get_post', 'GET', 200, 0.02))
+    thread.start()
+    thread.join()
+
+
+def test_finished_thread_shards_are_folded_into_totals():
+    request_metrics = RequestMetrics()
+    for _ in range(50):
+        _record_in_thread(request_metrics)
+
+    latency, statuses, _ = request_metrics.snapshot()
+
+    assert statuses[('post.get_post', 'GET', 200)] == 50
+    assert latency[('post.get_post', 'GET')][-1] == 50
+    assert len(request_metrics._shards) == 0
+
+
+def test_metrics_route_requires_token(monkeypatch):
+    app = Flask(__name__)
+    metrics.init_metrics(app)
+    assert app.test_client().get('/metrics').status_code == 404
+
+    monkeypatch.setattr(metrics, 'METRICS_TOKEN', 'scrape-token')
+    app = Flask(__name__)
+    metrics.init_metrics(app)
+    client = app.test_client()
+
+    assert client.get('/metrics').status_code == 401
+    response = client.get('/metrics', headers={'Authorization': 'Bearer scrape-token'})
+    assert response.status_code == 200
+    assert 'cache_hit_ratio{cache="reference"}' in response.get_data(as_text=True)
@@ -0,0 +1,39 @@
+import pytest
+from flask import jsonify
+from src.models import db, Nickname
+from src.utils.n_plus_one import NPlusOneError, n_plus_one
+
+
+def _repeat_select(times):
+    for nickname_id in range(1, times + 1):
+        db.session.get(Nickname, nickname_id)
+    return jsonify({})
+
+
+def test_testing_flag_set_after_create_app_enables_raise_mode(app, client):
+    # conftest는 create_app 이후에 TESTING을 켬
+    app.add_url_rule('/n-plus-one', 'n_plus_one_view', lambda: _repeat_select(10))
+
+    with pytest.raises(NPlusOneError):
+        client.get('/n-plus-one')
+
+
+def test_view_threshold_overrides_default(app, client):
+    app.add_url_rule('/few', 'few', n_plus_one(threshold=20)(lambda: _repeat_select(10)))
+    app.add_url_rule('/strict', 'strict', n_plus_one(threshold=2)(lambda: _repeat_select(3)))
+
+    assert client.get('/few').status_code == 200
+    with pytest.raises(NPlusOneError):
+        client.get('/strict')
+
+
+def test_zero_threshold_disables_detection(app, client):
+    app.add_url_rule('/zero', 'zero', n_plus_one(threshold=0)(lambda: _repeat_select(10)))
+
+    assert client.get('/zero').status_code == 200
+
+
+def test_view_mode_off(app, client):
+    app.add_url_rule('/off', 'off', n_plus_one(mode='off')(lambda: _repeat_select(10)))
+
+    assert client.get('/off').status_code == 200
@@ -0,0 +1,36 @@
+from types import SimpleNamespace
+from src.utils.name_index import NameIndex, to_chosung
+
+NAMES = ['고려대학교', '서강대학교', '서울과학기술대학교', '서울대학교', '연세대학교', 'KAIST']
+
+
+def search(term):
+    index = NameIndex([SimpleNamespace(name=name) for name in sorted(NAMES)])
+    return [ref.name for ref in index.search(term)]
+
+
+def test_to_chosung_keeps_non_hangul():
+    assert to_chosung('서울대a1') == 'ㅅㅇㄷa1'
+
+
+def test_plain_prefix_and_substring():
+    assert search('서울') == ['서울과학기술대학교', '서울대학교']
+    assert search('kai st') == ['KAIST']
+    assert search('없는학교') == []
+    assert len(search('  ')) == len(NAMES)
+
+
+def test_chosung_query():
+    assert search('ㅅㅇㄷ') == ['서울대학교']
+    assert search('ㅅㅇ') == ['서울과학기술대학교', '서울대학교']
+
+
+def test_mixed_syllable_and_chosung_query():
+    assert search('서ㄱ') == ['서강대학교']
+    assert search('서ㅇㄷ') == ['서울대학교']
+
+
+def test_prefix_match_ranks_before_later_match():
+    # '대학교'는 모든 한글 이름에 있지만 앞쪽에서 일치할수록 먼저 나옴
+    assert search('대학') == ['고려대학교', '서강대학교', '서울대학교', '연세대학교', '서울과학기술대학교']
+    assert search('ㄷㅎ')[-1] == '서울과학기술대학교'
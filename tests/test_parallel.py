@@ -0,0 +1,105 @@
+import threading
+import time
+import pytest
+from src.config.database import DatabaseConfig
+from src.models import db, Nickname
+from src.utils import parallel
+from src.utils.pagination import paginate_query
+from src.utils.parallel import run_parallel
+from tests.conftest import register
+
+
+@pytest.fixture
+def parallel_reads(monkeypatch):
+    monkeypatch.setattr(parallel, 'PARALLEL_READS', True)
+
+
+@pytest.fixture
+def small_pool_app(monkeypatch, request):
+    # 커넥션 하나짜리 풀 (기다리면 1초 뒤 타임아웃)
+    monkeypatch.setattr(DatabaseConfig, 'get_engine_options', staticmethod(
+        lambda url: {'pool_size': 1, 'max_overflow': 0, 'pool_timeout': 1}
+    ))
+    return request.getfixturevalue('app')
+
+
+def _names(nicknames):
+    return [nickname.nickname for nickname in nicknames]
+
+
+@pytest.mark.parametrize('page, per_page', [(1, 10), (2, 7), (3, 10), (5, 10), (0, 5), (1, 0), (-1, -1)])
+@pytest.mark.parametrize('parallel_enabled', [False, True])
+def test_paginate_query_matches_paginate(app, monkeypatch, page, per_page, parallel_enabled):
+    monkeypatch.setattr(parallel, 'PARALLEL_READS', parallel_enabled)
+    with app.app_context():
+        query = Nickname.query.order_by(Nickname.id)
+        expected = query.paginate(page=page, per_page=per_page, error_out=False)
+
+        items, total, pages = paginate_query(query, page, per_page, _names)
+
+        assert items == _names(expected.items)
+        assert (total, pages) == (expected.total, expected.pages)
+
+
+def test_run_parallel_returns_results_in_order(app, parallel_reads):
+    with app.app_context():
+        results = run_parallel(lambda: 1, lambda: Nickname.query.count(), lambda: 3)
+
+    assert results == [1, 20, 3]
+
+
+def test_run_parallel_propagates_worker_error_after_all_finish(app, parallel_reads):
+    finished = threading.Event()
+
+    def slow():
+        time.sleep(0.05)
+        finished.set()
+        return 'slow'
+
+    def fail():
+        raise ValueError('작업 실패')
+
+    with app.app_context():
+        with pytest.raises(ValueError, match='작업 실패'):
+            run_parallel(lambda: 'first', slow, fail)
+    assert finished.is_set()
+
+
+def test_run_parallel_waits_for_workers_when_first_fails(app, parallel_reads):
+    finished = threading.Event()
+
+    def first():
+        raise ValueError('첫 함수 실패')
+
+    def slow():
+        time.sleep(0.05)
+        finished.set()
+
+    with app.app_context():
+        with pytest.raises(ValueError, match='첫 함수 실패'):
+            run_parallel(first, slow)
+    assert finished.is_set()
+
+
+def test_exhausted_pool_falls_back_to_sequential(small_pool_app, parallel_reads):
+    app = small_pool_app
+    client = app.test_client()
+    headers = register(client)
+    response = client.post('/api/v1/posts', headers=headers, json={
+        'title': '제목', 'content': '본문', 'category': '자유'
+    })
+    post_id = response.get_json()['id']
+
+    # 요청 스레드가 커넥션을 쥔 상태에서 목록/상세 조회 (병렬로 실행하면 작업 스레드가 타임아웃)
+    started = time.perf_counter()
+    listing = client.get('/api/v1/posts', headers=headers)
+    detail = client.get(f'/api/v1/posts/{post_id}', headers=headers)
+    elapsed = time.perf_counter() - started
+
+    assert listing.status_code == 200, listing.get_json()
+    assert listing.get_json()['total'] == 1
+    assert detail.status_code == 200, detail.get_json()
+    assert elapsed < 1
+
+    with app.app_context():
+        assert db.engine.pool.size() == 1
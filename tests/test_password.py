@@ -0,0 +1,40 @@
+import threading
+import time
+from src.utils import password
+from src.utils.password import hash_password, verify_password, needs_rehash
+
+
+def test_hash_and_verify():
+    hashed = hash_password('secret-1234', 'pbkdf2:sha256:1000')
+    assert verify_password(hashed, 'secret-1234')
+    assert not verify_password(hashed, 'wrong')
+
+
+def test_needs_rehash_when_parameters_change():
+    hashed = hash_password('secret-1234', 'pbkdf2:sha256:1000')
+    assert not needs_rehash(hashed, 'pbkdf2:sha256:1000')
+    assert needs_rehash(hashed, 'pbkdf2:sha256:2000')
+
+
+def test_concurrent_hashing_is_capped(monkeypatch):
+    monkeypatch.setattr(password, '_hash_slots', threading.BoundedSemaphore(2))
+    running = []
+    peak = []
+    lock = threading.Lock()
+
+    def slow_hash(value, method):
+        with lock:
+            running.append(1)
+            peak.append(len(running))
+        time.sleep(0.05)
+        with lock:
+            running.pop()
+        return 'hash'
+
+    monkeypatch.setattr(password, 'generate_password_hash', slow_hash)
+    threads = [threading.Thread(target=hash_password, args=('pw',)) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert max(peak) == 2
@@ -0,0 +1,86 @@
+import pytest
+from flask import Flask, jsonify
+from src.utils import profiling
+from src.utils.profiling import make_profile_token, verify_profile_token
+
+
+@pytest.fixture
+def secret(monkeypatch, tmp_path):
+    monkeypatch.setattr(profiling, 'PROFILING_SECRET', 'profile-secret')
+    monkeypatch.setattr(profiling, 'PROFILING_SAMPLE_RATE', 0.0)
+    monkeypatch.setattr(profiling, 'PROFILING_DIR', str(tmp_path / 'profiles'))
+
+
+@pytest.fixture
+def client(secret):
+    app = Flask(__name__)
+    app.add_url_rule('/work', 'work', lambda: jsonify(total=sum(range(1000))))
+    profiling.init_profiling(app)
+    return app.test_client()
+
+
+def test_token_verification(secret, monkeypatch):
+    token = make_profile_token(60)
+    expires, _, signature = token.partition('.')
+
+    assert verify_profile_token(token)
+    assert not verify_profile_token(make_profile_token(-1))
+    assert not verify_profile_token(f'{expires}.{"0" * len(signature)}')
+    assert not verify_profile_token(f'{int(expires) + 1}.{signature}')
+    assert not verify_profile_token('not-a-token')
+    assert not verify_profile_token(None)
+
+    monkeypatch.setattr(profiling, 'PROFILING_SECRET', '')
+    assert not verify_profile_token(token)
+    with pytest.raises(ValueError):
+        make_profile_token(60)
+
+
+def test_invalid_token_is_rejected(client):
+    response = client.get('/work', headers={'X-Profile-Token': make_profile_token(-1)})
+
+    assert response.status_code == 403
+    assert 'X-Profile-Id' not in response.headers
+
+
+def test_valid_token_saves_profile_and_downloads_with_token(client):
+    headers = {'X-Profile-Token': make_profile_token(60)}
+    response = client.get('/work', headers=headers)
+    assert response.status_code == 200
+    profile_id = response.headers['X-Profile-Id']
+
+    assert client.get('/debug/profiles').status_code == 403
+    assert client.get(f'/debug/profiles/{profile_id}').status_code == 403
+
+    listing = client.get('/debug/profiles', headers=headers).get_json()['profiles']
+    assert [profile['id'] for profile in listing] == [profile_id]
+    download = client.get(f'/debug/profiles/{profile_id}', headers=headers)
+    assert download.status_code == 200
+    assert download.data
+    assert client.get('/debug/profiles/..%2Fsecret.prof', headers=headers).status_code == 404
+
+
+def test_busy_profiler_reports_skipped(client):
+    headers = {'X-Profile-Token': make_profile_token(60)}
+
+    with profiling._profiling_lock:
+        response = client.get('/work', headers=headers)
+
+    assert response.status_code == 200
+    assert response.headers['X-Profile-Skipped'] == 'busy'
+    assert 'X-Profile-Id' not in response.headers
+
+    # 끝난 뒤에는 다시 프로파일링
+    response = client.get('/work', headers=headers)
+    assert 'X-Profile-Id' in response.headers
+    assert 'X-Profile-Skipped' not in response.headers
+
+
+def test_hooks_not_registered_without_secret_or_sampling(monkeypatch):
+    monkeypatch.setattr(profiling, 'PROFILING_SECRET', '')
+    monkeypatch.setattr(profiling, 'PROFILING_SAMPLE_RATE', 0.0)
+    app = Flask(__name__)
+    profiling.init_profiling(app)
+
+    assert not app.before_request_funcs
+    assert 'profiles.list' not in app.view_functions
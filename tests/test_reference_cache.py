@@ -0,0 +1,53 @@
+from src.models import db, School
+from src.utils.reference_cache import ReferenceCache, bump_reference_version, reference_cache
+
+
+def _add_school(app, name):
+    with app.app_context():
+        db.session.add(School(name=name, country_id=1))
+        db.session.commit()
+
+
+def _school_names(client):
+    response = client.get('/api/v1/countries/1/schools')
+    assert response.status_code == 200, response.get_json()
+    return sorted(school['name'] for school in response.get_json()['schools'])
+
+
+def test_server_cache_reloads_after_version_bump_from_another_process(app, client, monkeypatch):
+    monkeypatch.setattr(reference_cache, 'check_interval', 0)
+    assert _school_names(client) == ['서울대학교']
+
+    # 다른 프로세스에서 데이터를 바꿨지만 버전은 그대로: TTL 동안 이전 스냅샷 사용
+    _add_school(app, '연세대학교')
+    assert _school_names(client) == ['서울대학교']
+
+    # 다른 프로세스가 버전만 올림 (이 프로세스의 캐시는 건드리지 않음)
+    with app.app_context():
+        bump_reference_version()
+
+    assert _school_names(client) == ['서울대학교', '연세대학교']
+
+
+def test_reload_command_is_seen_by_server_caches(app):
+    server_cache = ReferenceCache(ttl=3600, check_interval=0)
+    with app.app_context():
+        assert len(server_cache.get().schools) == 1
+    _add_school(app, '연세대학교')
+
+    result = app.test_cli_runner().invoke(args=['reload-reference-data'])
+
+    assert result.exit_code == 0, result.output
+    assert '학교 2개' in result.output
+    with app.app_context():
+        assert len(server_cache.get().schools) == 2
+
+
+def test_version_is_checked_only_once_per_interval(app):
+    server_cache = ReferenceCache(ttl=3600, check_interval=3600)
+    with app.app_context():
+        server_cache.get()
+        bump_reference_version()
+
+        assert server_cache.get() is server_cache.get()
+        assert server_cache.stats()['misses'] == 1
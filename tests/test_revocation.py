@@ -0,0 +1,72 @@
+import time
+from datetime import datetime, timedelta
+from src.models import db, TokenRevocation
+from src.utils.revocation import RevocationList, revoke_user_tokens, to_timestamp
+from tests.conftest import register
+
+
+def _insert(user_id, jti=None, not_before=None, id=None):
+    now = datetime.utcnow()
+    revocation = TokenRevocation(
+        id=id, user_id=user_id, jti=jti, not_before=not_before, expires_at=now + timedelta(days=1)
+    )
+    db.session.add(revocation)
+    db.session.commit()
+    return revocation
+
+
+def test_local_apply_does_not_skip_rows_from_other_processes(app, client):
+    register(client)
+    with app.app_context():
+        revocations = RevocationList()
+        revocations.refresh(force=True)
+
+        # 다른 프로세스가 먼저 기록한 행(낮은 id)과 이 프로세스의 로그아웃(높은 id)
+        other = _insert(1, jti='other')
+        local = _insert(1, jti='local')
+        assert other.id < local.id
+        revocations.apply(local)
+
+        revocations.refresh(force=True)
+        assert revocations.is_revoked({'user_id': 1, 'jti': 'other', 'iat': time.time()})
+        assert revocations.is_revoked({'user_id': 1, 'jti': 'local', 'iat': time.time()})
+
+
+def test_refresh_rereads_rows_committed_out_of_id_order(app, client):
+    register(client)
+    with app.app_context():
+        revocations = RevocationList()
+        _insert(1, jti='late-id', id=10)
+        revocations.refresh(force=True)
+
+        # id 5는 id 10보다 먼저 할당됐지만 나중에 커밋됨
+        _insert(1, jti='early-id', id=5)
+        revocations.refresh(force=True)
+        assert revocations.is_revoked({'user_id': 1, 'jti': 'early-id', 'iat': time.time()})
+
+
+def test_tokens_issued_in_same_second_before_revocation_are_revoked(app, client):
+    register(client)
+    with app.app_context():
+        revocations = RevocationList()
+        issued_before = to_timestamp(datetime.utcnow())
+        revocation = revoke_user_tokens(1)
+        db.session.commit()
+        revocations.apply(revocation)
+        issued_after = to_timestamp(datetime.utcnow()) + 0.001
+
+        assert revocations.is_revoked({'user_id': 1, 'iat': issued_before})
+        assert not revocations.is_revoked({'user_id': 1, 'iat': issued_after})
+
+
+def test_password_change_revokes_existing_tokens(client):
+    headers = register(client)
+    response = client.put('/api/v1/users/me/password', headers=headers, json={
+        'current_password': 'password1234', 'new_password': 'newpassword5678!'
+    })
+    assert response.status_code == 204
+    assert client.get('/api/v1/users/me', headers=headers).status_code == 401
+
+    login = client.post('/api/v1/auth/login', json={'email': 'user@example.com', 'password': 'newpassword5678!'})
+    new_headers = {'Authorization': f"Bearer {login.get_json()['access_token']}"}
+    assert client.get('/api/v1/users/me', headers=new_headers).status_code == 200
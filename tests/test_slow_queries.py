@@ -0,0 +1,113 @@
+import json
+import time
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+from src.models import db
+from src.utils import slow_queries
+from src.utils.slow_queries import fingerprint, normalize_sql, redact_params
+
+NICKNAME_SQL = 'SELECT id, nickname FROM nicknames WHERE nickname = :nickname AND id > :id'
+# sqlite 드라이버에 전달되는 문장을 정규화한 값
+NORMALIZED = 'SELECT id, nickname FROM nicknames WHERE nickname = ? AND id > ?'
+
+
+def test_normalize_sql_replaces_literals_and_collapses_in_lists():
+    normalized = normalize_sql("SELECT * FROM posts\n  WHERE title = 'it''s'  AND id IN (?, ?, ?) AND views > 10")
+
+    assert normalized == 'SELECT * FROM posts WHERE title = ? AND id IN (...) AND views > ?'
+
+
+def test_fingerprint_ignores_literal_values():
+    first = fingerprint(normalize_sql("SELECT * FROM users WHERE email = 'a@example.com'"))
+    second = fingerprint(normalize_sql("SELECT * FROM users WHERE email = 'b@example.com'"))
+    other = fingerprint(normalize_sql("SELECT * FROM posts WHERE email = 'a@example.com'"))
+
+    assert first == second
+    assert first != other
+
+
+def test_redact_params_keeps_only_lengths_of_strings():
+    assert redact_params({'id': 3, 'search': '비밀', 'raw': b'abc', 'flag': True, 'ids': [1, 'x']}) == {
+        'id': 3, 'search': '<str:2>', 'raw': '<bytes:3>', 'flag': True, 'ids': [1, '<str:1>']
+    }
+    assert redact_params(('secret', 1)) == ['<str:6>', 1]
+    assert redact_params([('a', 1), ('bb', 2)], executemany=True) == {'rows': 2, 'first': ['<str:1>', 1]}
+
+
+@pytest.fixture
+def slow_log(app, tmp_path, monkeypatch):
+    path = tmp_path / 'slow_queries.jsonl'
+    # 모든 쿼리가 기록되도록 아주 작은 기준 시간
+    monkeypatch.setattr(slow_queries, 'SLOW_QUERY_THRESHOLD_MS', 0.0001)
+    monkeypatch.setattr(slow_queries, 'SLOW_QUERY_LOG_PATH', str(path))
+    monkeypatch.setattr(slow_queries, '_recorder', None)
+    slow_queries.init_slow_query_log(app)
+    yield path
+    event.remove(Engine, 'before_cursor_execute', slow_queries._before_cursor_execute)
+    event.remove(Engine, 'after_cursor_execute', slow_queries._after_cursor_execute)
+    event.remove(Engine, 'handle_error', slow_queries._handle_error)
+
+
+def _records(path, record_type):
+    return [
+        record for record in map(json.loads, path.read_text(encoding='utf-8').splitlines())
+        if record['type'] == record_type
+    ]
+
+
+def _wait_for_plans(path, count):
+    deadline = time.monotonic() + 5
+    while len(_records(path, 'plan')) < count and time.monotonic() < deadline:
+        time.sleep(0.02)
+    return _records(path, 'plan')
+
+
+def _run_nickname_query(app, nickname):
+    with app.app_context():
+        db.session.execute(text(NICKNAME_SQL), {'nickname': nickname, 'id': 0}).all()
+
+
+def test_recorder_writes_sql_and_plan_once_per_fingerprint(app, slow_log):
+    _run_nickname_query(app, '다람쥐1')
+    _run_nickname_query(app, '다람쥐12')
+
+    key = fingerprint(NORMALIZED)
+    matching = [record for record in _records(slow_log, 'query') if record['fingerprint'] == key]
+    assert len(matching) == 2
+    assert matching[0]['sql'] == NORMALIZED
+    assert 'sql' not in matching[1]
+    assert matching[0]['params'] == ['<str:4>', 0]
+    assert matching[1]['params'] == ['<str:5>', 0]
+
+    plans = [plan for plan in _wait_for_plans(slow_log, 1) if plan['fingerprint'] == key]
+    assert len(plans) == 1
+    assert any('nicknames' in row for row in plans[0]['plan'])
+
+
+def test_sql_is_still_written_when_fingerprint_set_is_full(app, slow_log, monkeypatch):
+    monkeypatch.setattr(slow_queries, 'MAX_FINGERPRINTS', 0)
+
+    _run_nickname_query(app, '다람쥐1')
+    _run_nickname_query(app, '다람쥐2')
+
+    key = fingerprint(NORMALIZED)
+    matching = [record for record in _records(slow_log, 'query') if record['fingerprint'] == key]
+    assert [record.get('sql') for record in matching] == [NORMALIZED] * 2
+    # 실행 계획은 더 받지 않음
+    assert slow_queries._recorder._explained == set()
+
+
+def test_report_groups_by_fingerprint(app, slow_log):
+    for nickname in ('다람쥐1', '다람쥐2', '다람쥐3'):
+        _run_nickname_query(app, nickname)
+    _wait_for_plans(slow_log, 1)
+
+    result = app.test_cli_runner().invoke(args=['slow-query-report', str(slow_log), '--sort', 'count', '--limit', '50'])
+
+    assert result.exit_code == 0, result.output
+    key = fingerprint(NORMALIZED)
+    block = result.output[result.output.index(f'[{key}]'):]
+    assert block.startswith(f'[{key}] 3회')
+    assert f'SQL: {NORMALIZED}' in block
+    assert '실행 계획:' in block.split('\n\n')[0]
@@ -0,0 +1,78 @@
+import re
+import pytest
+from src.utils import metrics, sql_metrics
+from src.utils.sql_metrics import RequestSQLStats, sql_summary
+
+SERVER_TIMING = re.compile(
+    r'^db;dur=[\d.]+;desc="(\d+) queries", db-slowest;dur=[\d.]+, app;dur=[\d.]+$'
+)
+
+
+@pytest.fixture
+def token_app(monkeypatch, request):
+    monkeypatch.setattr(metrics, 'METRICS_TOKEN', 'scrape-token')
+    monkeypatch.setattr(sql_metrics, 'METRICS_TOKEN', 'scrape-token')
+    return request.getfixturevalue('app')
+
+
+@pytest.fixture(autouse=True)
+def clear_summary():
+    sql_summary.clear()
+    yield
+    sql_summary.clear()
+
+
+def test_request_stats_record_and_merge():
+    stats = RequestSQLStats()
+    stats.record('SELECT 1', 0.002)
+    stats.record('SELECT 2', 0.001)
+    worker = RequestSQLStats()
+    worker.record('SELECT 3', 0.005)
+
+    stats.merge(worker)
+
+    assert stats.count == 3
+    assert stats.total == pytest.approx(0.008)
+    assert (stats.slowest, stats.slowest_statement) == (0.005, 'SELECT 3')
+
+
+def test_server_timing_is_off_by_default(client):
+    response = client.get('/api/v1/countries/')
+
+    assert response.status_code == 200
+    assert 'Server-Timing' not in response.headers
+
+
+def test_server_timing_header_matches_summary(client, auth_headers, monkeypatch):
+    monkeypatch.setattr(sql_metrics, 'SQL_SERVER_TIMING', True)
+
+    counts = []
+    for _ in range(2):
+        response = client.get('/api/v1/users/me', headers=auth_headers)
+        match = SERVER_TIMING.match(response.headers['Server-Timing'])
+        assert match, response.headers['Server-Timing']
+        counts.append(int(match.group(1)))
+
+    entry = sql_summary.snapshot()['user.get_current_user']
+    assert entry['requests'] == 2
+    assert entry['statements'] == sum(counts)
+    assert entry['max_statements'] == max(counts)
+
+
+def test_summary_is_exported_behind_metrics_token(token_app):
+    client = token_app.test_client()
+    client.get('/api/v1/countries/')
+    headers = {'Authorization': 'Bearer scrape-token'}
+
+    assert client.get('/debug/sql').status_code == 401
+    endpoints = client.get('/debug/sql', headers=headers).get_json()['endpoints']
+    assert endpoints[0]['endpoint'] == 'school.get_countries'
+    assert endpoints[0]['slowest_statement'].lstrip().upper().startswith('SELECT')
+
+    body = client.get('/metrics', headers=headers).get_data(as_text=True)
+    assert 'db_request_max_queries{endpoint="school.get_countries"}' in body
+    assert 'db_slowest_query_seconds{endpoint="school.get_countries"}' in body
+
+
+def test_debug_sql_is_not_registered_without_token(client):
+    assert client.get('/debug/sql').status_code == 404
@@ -0,0 +1,41 @@
+import json
+from flask import jsonify
+from src.utils import traffic_capture
+from tests.conftest import register
+
+
+def _capture(app, tmp_path, monkeypatch):
+    path = tmp_path / 'traffic.jsonl'
+    monkeypatch.setattr(traffic_capture, 'TRAFFIC_CAPTURE_RATE', 1.0)
+    monkeypatch.setattr(traffic_capture, 'TRAFFIC_CAPTURE_PATH', str(path))
+    app.add_url_rule('/echo', 'echo', lambda: jsonify({}))
+    traffic_capture.init_traffic_capture(app)
+    return path
+
+
+def _records(path):
+    return [json.loads(line) for line in path.read_text(encoding='utf-8').splitlines()]
+
+
+def test_free_text_query_params_are_redacted(app, tmp_path, monkeypatch):
+    path = _capture(app, tmp_path, monkeypatch)
+
+    app.test_client().get('/echo?search=비밀 검색어&page=2&category=자유&fields=id,title')
+
+    query = _records(path)[0]['query']
+    assert query == {
+        'search': ['<str:6>'], 'page': ['2'], 'category': ['자유'], 'fields': ['id,title']
+    }
+
+
+def test_auth_class_only_checks_the_token_signature(app, tmp_path, monkeypatch):
+    path = _capture(app, tmp_path, monkeypatch)
+    client = app.test_client()
+    auth_headers = register(client)
+
+    client.get('/echo')
+    client.get('/echo', headers=auth_headers)
+    client.get('/echo', headers={'Authorization': 'Bearer not-a-token'})
+
+    records = [record for record in _records(path) if record['path'] == '/echo']
+    assert [record['auth'] for record in records] == ['anonymous', 'user', 'invalid']